@@ -0,0 +1,4 @@
+"""Benchmark suite for the agent app, its skills and storage backends.
+
+Run it with ``python -m benchmarks`` from the project directory.
+"""
@@ -0,0 +1,86 @@
+"""Command line entry point of the benchmark suite."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from .cases import BENCHMARKS
+from .runner import (
+    BenchmarkResult,
+    compare,
+    format_comparisons,
+    format_results,
+    load_results,
+    write_results,
+)
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the maf-basic benchmark suite.")
+    parser.add_argument(
+        "benchmarks",
+        nargs="*",
+        choices=[[], *BENCHMARKS],
+        help="Benchmarks to run (default: all).",
+    )
+    parser.add_argument("--quick", action="store_true", help="Use small sizes for a fast smoke run.")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=BENCHMARK_DIR / "results" / "latest.json",
+        help="File the results are written to.",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=BENCHMARK_DIR / "baseline.json",
+        help="Results to compare against, if the file exists.",
+    )
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Relative slowdown reported as regression (default: 0.25).",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with status 1 if any benchmark regressed.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    selected = args.benchmarks or list(BENCHMARKS)
+
+    results: List[BenchmarkResult] = []
+    for name in selected:
+        print(f"Running {name} benchmarks ...", file=sys.stderr, flush=True)
+        results.extend(BENCHMARKS[name](args.quick))
+
+    print(format_results(results))
+    write_results(results, args.output, quick=args.quick)
+    print(f"\nResults written to {args.output}")
+
+    regressions = 0
+    if args.baseline.exists() and not args.save_baseline:
+        comparisons = compare(results, load_results(args.baseline))
+        regressions = sum(comparison.is_regression(args.tolerance) for comparison in comparisons)
+        print(f"\nCompared with {args.baseline}:")
+        print(format_comparisons(comparisons, args.tolerance))
+    if args.save_baseline:
+        write_results(results, args.baseline, quick=args.quick)
+        print(f"Baseline written to {args.baseline}")
+
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+"""Benchmarks of the app, the bundled skills and the storage backends."""
+
+from __future__ import annotations
+
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from maf_basic.app import AgentApp
+from maf_basic.services.result_set import ResultSet
+from maf_basic.services.synthetic import SyntheticSearchClient
+from maf_basic.skills.base import BaseSkill, SkillMetadata
+from maf_basic.skills.echo import EchoSkill
+from maf_basic.skills.management_summary import ManagementSummarySkill
+from maf_basic.skills.web_search import WebSearchSkill
+from maf_basic.storage.base import BaseStorage
+from maf_basic.storage.bounded import BoundedInMemoryStorage, NamespaceQuota
+from maf_basic.storage.concurrent import StripedInMemoryStorage
+from maf_basic.storage.in_memory import InMemoryStorage
+from maf_basic.storage.local import LocalFileStorage
+
+from .runner import BenchmarkResult, measure
+
+Benchmark = Callable[[bool], List[BenchmarkResult]]
+
+
+class NoopSkill(BaseSkill):
+    """Skill doing no work, so timing it isolates the dispatch overhead."""
+
+    def __init__(self) -> None:
+        super().__init__(SkillMetadata(name="Noop", description="Returns the message."))
+
+    def handle(self, message: str, storage: BaseStorage, **_: Any) -> str:
+        return message
+
+
+def bench_invoke(quick: bool) -> List[BenchmarkResult]:
+    """Overhead of ``AgentApp.invoke`` compared to calling ``handle`` directly."""
+
+    ops = 20_000 if quick else 200_000
+    app = AgentApp()
+    app.register_skill(NoopSkill())
+    skill = app.get_skill("Noop")
+    storage = app.storage
+
+    def direct() -> None:
+        for _ in range(ops):
+            skill.handle(message="x", storage=storage)
+
+    def shared() -> None:
+        for _ in range(ops):
+            app.invoke("Noop", "x")
+
+    def session() -> None:
+        for _ in range(ops):
+            app.invoke("Noop", "x", session_id="benchmark")
+
+    results = [
+        measure("invoke.direct_handle", direct, ops=ops),
+        measure("invoke.app_invoke", shared, ops=ops),
+        measure("invoke.app_invoke_session", session, ops=ops),
+    ]
+    for result in results[1:]:
+        result.extra["overhead_microseconds"] = result.microseconds_per_op - results[0].microseconds_per_op
+    return results
+
+
+def bench_echo(quick: bool) -> List[BenchmarkResult]:
+    """``EchoSkill`` appends and history reads for growing histories."""
+
+    sizes = (10, 1_000, 10_000) if quick else (10, 1_000, 100_000, 1_000_000)
+    ops = 1_000 if quick else 10_000
+    results = []
+    for size in sizes:
+        storage = InMemoryStorage()
+        storage.set(EchoSkill.HISTORY_NAMESPACE, EchoSkill.HISTORY_KEY, [f"message {index}" for index in range(size)])
+        app = AgentApp(storage=storage)
+        skill = EchoSkill()
+        app.register_skill(skill)
+
+        def append() -> None:
+            for _ in range(ops):
+                app.invoke("EchoSkill", "Hallo")
+
+        def read_tail() -> None:
+            for _ in range(ops):
+                skill.conversation_history(storage, max(0, size - 10))
+
+        # Reads first, before the appends grow the history.
+        results.append(measure(f"echo.read_tail[history={size}]", read_tail, ops=ops, params={"history": size}))
+        results.append(measure(f"echo.append[history={size}]", append, ops=ops, params={"history": size}))
+    return results
+
+
+def bench_web_search(quick: bool) -> List[BenchmarkResult]:
+    """``WebSearchSkill`` against a search client with injected latency, serial and batched."""
+
+    latency = 0.002 if quick else 0.005
+    serial_ops = 20 if quick else 100
+    batch_ops = 100 if quick else 500
+    client = SyntheticSearchClient(latency_seconds=latency, seed=0)
+    app = AgentApp()
+    app.register_skill(WebSearchSkill(search_client=client))
+    params = {"latency_seconds": latency}
+
+    def serial() -> None:
+        for index in range(serial_ops):
+            app.invoke("WebSearchSkill", f"Thema {index}")
+
+    def batched() -> None:
+        requests = (("WebSearchSkill", f"Thema {index}") for index in range(batch_ops))
+        for result in app.invoke_many(requests, ordered=False, max_workers=16, max_in_flight=32):
+            if not result.ok:
+                raise result.error  # type: ignore[misc]
+
+    return [
+        measure("web_search.serial", serial, ops=serial_ops, rounds=3, params=params),
+        measure("web_search.invoke_many[workers=16]", batched, ops=batch_ops, rounds=3, params=params),
+    ]
+
+
+def bench_summary(quick: bool) -> List[BenchmarkResult]:
+    """``ManagementSummarySkill`` over a namespace holding many topics."""
+
+    topics = 200 if quick else 5_000
+    results_per_topic = 5
+    entries = [
+        ResultSet(
+            {
+                "title": f"Ergebnis {rank} zu Thema {index}",
+                "url": f"https://synthetic.example/{index}/{rank}",
+                "snippet": f"Thema {index} ist wichtig. " * 8,
+            }
+            for rank in range(results_per_topic)
+        )
+        for index in range(topics)
+    ]
+    skill = ManagementSummarySkill(max_items=3)
+    storage = InMemoryStorage()
+    params = {"topics": topics, "results_per_topic": results_per_topic}
+
+    def fill() -> None:
+        nonlocal storage
+        storage = InMemoryStorage()
+        storage.set_many(
+            WebSearchSkill.STORAGE_NAMESPACE, {f"Thema {index}": entry for index, entry in enumerate(entries)}
+        )
+
+    def summarize() -> None:
+        skill.summarize_many(storage)
+
+    def handle_each() -> None:
+        for index in range(topics):
+            skill.handle(f"Thema {index}", storage)
+
+    cold = measure(f"summary.summarize_many.cold[topics={topics}]", summarize, ops=topics, setup=fill, params=params)
+    fill()
+    summarize()
+    warm = measure(f"summary.summarize_many.warm[topics={topics}]", summarize, ops=topics, params=params)
+    single = measure(f"summary.handle.cold[topics={topics}]", handle_each, ops=topics, setup=fill, params=params)
+    return [cold, warm, single]
+
+
+def _storage_factories(directory: Path) -> Dict[str, Callable[[], BaseStorage]]:
+    counter = iter(range(1_000_000))
+    return {
+        "memory": InMemoryStorage,
+        "striped": StripedInMemoryStorage,
+        "bounded": lambda: BoundedInMemoryStorage(default_quota=NamespaceQuota(max_entries=100_000)),
+        "local": lambda: LocalFileStorage(directory / f"bench-{next(counter)}.jsonl"),
+    }
+
+
+def bench_storage(quick: bool) -> List[BenchmarkResult]:
+    """Mixed get/set/extend load on every storage backend from several threads."""
+
+    threads = 8
+    ops_per_thread = 1_000 if quick else 10_000
+    keys = 1_000
+    results = []
+
+    def worker(storage: BaseStorage, offset: int) -> None:
+        for step in range(ops_per_thread):
+            index = (offset * 7_919 + step) % keys
+            choice = step % 10
+            if choice < 7:
+                storage.get("bench", f"key {index}")
+            elif choice < 9:
+                storage.set("bench", f"key {index}", {"step": step, "thread": offset})
+            else:
+                storage.append("bench-lists", f"list {index % 16}", step)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for backend, factory in _storage_factories(Path(directory)).items():
+            storage = factory()
+
+            def reset() -> None:
+                nonlocal storage
+                close = getattr(storage, "close", None)
+                if close is not None:
+                    close()
+                storage = factory()
+
+            def run() -> None:
+                with ThreadPoolExecutor(max_workers=threads) as pool:
+                    for future in [pool.submit(worker, storage, offset) for offset in range(threads)]:
+                        future.result()
+
+            results.append(
+                measure(
+                    f"storage.{backend}.mixed[threads={threads}]",
+                    run,
+                    ops=threads * ops_per_thread,
+                    rounds=3,
+                    setup=reset,
+                    params={"backend": backend, "threads": threads, "keys": keys},
+                )
+            )
+            close = getattr(storage, "close", None)
+            if close is not None:
+                close()
+    return results
+
+
+BENCHMARKS: Dict[str, Benchmark] = {
+    "invoke": bench_invoke,
+    "echo": bench_echo,
+    "web_search": bench_web_search,
+    "summary": bench_summary,
+    "storage": bench_storage,
+}
+
+
+__all__ = ["BENCHMARKS", "NoopSkill"]
@@ -0,0 +1,365 @@
+"""Load generator replaying recorded or synthetic traffic against an ``AgentApp``.
+
+Traces are JSON lines with ``timestamp`` (seconds since the start of the
+trace), ``session`` (``null`` for the shared storage), ``skill`` and
+``message``. Run ``python -m benchmarks.loadgen --help`` for the options.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+from maf_basic.app import AgentApp
+from maf_basic.services.synthetic import SyntheticSearchClient
+from maf_basic.skills.echo import EchoSkill
+from maf_basic.skills.management_summary import ManagementSummarySkill
+from maf_basic.skills.web_search import WebSearchSkill
+from maf_basic.storage.base import BaseStorage
+from maf_basic.storage.bounded import estimate_size
+from maf_basic.storage.factory import create_storage
+
+DEFAULT_MIX: Dict[str, float] = {"EchoSkill": 0.5, "WebSearchSkill": 0.3, "ManagementSummarySkill": 0.2}
+
+DEFAULT_TOPICS = (
+    "Aktuelle KI Trends",
+    "Cloud Kosten",
+    "Datenschutz Grundverordnung",
+    "Quantencomputing",
+    "Lieferketten Risiken",
+    "Elektromobilität",
+    "Cyber Security",
+    "Fachkräftemangel",
+)
+
+# Namespaces written by the bundled skills, measured for storage growth.
+TRACKED_NAMESPACES = (
+    EchoSkill.HISTORY_NAMESPACE,
+    WebSearchSkill.STORAGE_NAMESPACE,
+    ManagementSummarySkill.STORAGE_NAMESPACE,
+    ManagementSummarySkill.FINGERPRINT_NAMESPACE,
+)
+
+
+@dataclass(frozen=True)
+class TraceEvent:
+    """A single recorded skill call."""
+
+    timestamp: float
+    session: Optional[str]
+    skill: str
+    message: str
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "TraceEvent":
+        return cls(
+            timestamp=float(data["timestamp"]),
+            session=data.get("session"),
+            skill=str(data["skill"]),
+            message=str(data.get("message", "")),
+        )
+
+
+def read_trace(path: Path) -> List[TraceEvent]:
+    """Read a JSONL trace and return its events ordered by timestamp."""
+
+    with path.open(encoding="utf-8") as handle:
+        events = [TraceEvent.from_dict(json.loads(line)) for line in handle if line.strip()]
+    return sorted(events, key=lambda event: event.timestamp)
+
+
+def write_trace(events: Iterable[TraceEvent], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as handle:
+        for event in events:
+            handle.write(json.dumps(asdict(event), ensure_ascii=False) + "\n")
+
+
+def synthesize_trace(
+    *,
+    sessions: int = 50,
+    duration_seconds: float = 60.0,
+    think_time_seconds: float = 2.0,
+    mix: Mapping[str, float] = DEFAULT_MIX,
+    topics: Sequence[str] = DEFAULT_TOPICS,
+    seed: int | None = None,
+) -> List[TraceEvent]:
+    """Generate the traffic of ``sessions`` users over ``duration_seconds``.
+
+    Every user starts at a random time and waits an exponentially distributed
+    think time with mean ``think_time_seconds`` between calls. Skills are
+    drawn according to ``mix``; a summary is requested for the topic the user
+    searched last, as a real user would do.
+    """
+
+    rng = random.Random(seed)
+    skills = list(mix)
+    weights = [mix[skill] for skill in skills]
+    events: List[TraceEvent] = []
+    for index in range(sessions):
+        session = f"session-{index}"
+        last_topic: Optional[str] = None
+        timestamp = rng.uniform(0.0, min(duration_seconds, think_time_seconds))
+        while timestamp < duration_seconds:
+            skill = rng.choices(skills, weights)[0]
+            if skill == "WebSearchSkill":
+                last_topic = rng.choice(topics)
+                message = last_topic
+            elif skill == "ManagementSummarySkill":
+                message = last_topic or rng.choice(topics)
+            else:
+                message = f"Nachricht {rng.randrange(10_000)} von {session}"
+            events.append(TraceEvent(timestamp=round(timestamp, 4), session=session, skill=skill, message=message))
+            timestamp += rng.expovariate(1.0 / think_time_seconds) if think_time_seconds > 0 else 0.01
+    return sorted(events, key=lambda event: event.timestamp)
+
+
+@dataclass
+class StorageSample:
+    """Size of the tracked namespaces at one point of a run."""
+
+    elapsed_seconds: float
+    completed: int
+    keys: int
+    bytes: int
+
+
+@dataclass
+class LoadReport:
+    """Outcome of :func:`replay`."""
+
+    requests: int = 0
+    errors: int = 0
+    elapsed_seconds: float = 0.0
+    latencies: Dict[str, Dict[str, Optional[float]]] = field(default_factory=dict)
+    error_types: Dict[str, int] = field(default_factory=dict)
+    samples: List[StorageSample] = field(default_factory=list)
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["throughput"] = self.throughput
+        return data
+
+    def format(self) -> str:
+        lines = [
+            f"Requests: {self.requests} ({self.errors} errors) in {self.elapsed_seconds:.2f}s "
+            f"= {self.throughput:,.1f} req/s",
+            f"{'Skill':<28} {'calls':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}",
+        ]
+        for skill, stats in self.latencies.items():
+            figures = " ".join(f"{(stats[key] or 0.0) * 1000:>9.2f}" for key in ("p50", "p95", "p99", "max"))
+            lines.append(f"{skill:<28} {int(stats['calls'] or 0):>7} {figures}")
+        if self.samples:
+            lines.append(f"{'t [s]':>8} {'done':>7} {'keys':>8} {'bytes':>12}")
+            for sample in self.samples:
+                lines.append(
+                    f"{sample.elapsed_seconds:>8.1f} {sample.completed:>7} {sample.keys:>8} {sample.bytes:>12,}"
+                )
+        return "\n".join(lines)
+
+
+def storage_footprint(app: AgentApp, namespaces: Sequence[str] = TRACKED_NAMESPACES) -> tuple[int, int]:
+    """Return ``(keys, estimated bytes)`` of ``namespaces`` over the shared and all session storages."""
+
+    storages: List[BaseStorage] = [app.storage]
+    storages.extend(app.sessions.session(session_id) for session_id in list(app.sessions.sessions()))
+    keys = size = 0
+    for storage in storages:
+        for namespace in namespaces:
+            # A copy, since the namespace is written to while it is measured.
+            for value in storage.dump_namespace(namespace).values():
+                keys += 1
+                size += estimate_size(value)
+    return keys, size
+
+
+def replay(
+    app: AgentApp,
+    events: Sequence[TraceEvent],
+    *,
+    speed: float = 1.0,
+    max_workers: int = 32,
+    sample_interval: float = 1.0,
+) -> LoadReport:
+    """Send ``events`` to ``app`` at their recorded times and measure the outcome.
+
+    The schedule is open-loop: every call is issued at its timestamp divided
+    by ``speed``, whether earlier calls have finished or not, so a slow app
+    builds up a backlog as it would in production. Latencies are measured
+    from the time a call was issued and so include waiting for one of the
+    ``max_workers`` threads. ``speed=0`` issues all events at once. Storage
+    growth is sampled every ``sample_interval`` seconds.
+    """
+
+    latencies: Dict[str, List[float]] = {event.skill: [] for event in events}
+    lock = threading.Lock()
+    report = LoadReport(requests=len(events))
+    completed = 0
+    finished = threading.Event()
+
+    def record(event: TraceEvent, scheduled: float) -> None:
+        nonlocal completed
+        error: Optional[BaseException] = None
+        try:
+            app.invoke(event.skill, event.message, session_id=event.session)
+        except Exception as exc:
+            error = exc
+        seconds = time.perf_counter() - scheduled
+        with lock:
+            latencies[event.skill].append(seconds)
+            completed += 1
+            if error is not None:
+                report.errors += 1
+                name = type(error).__name__
+                report.error_types[name] = report.error_types.get(name, 0) + 1
+
+    def sample(elapsed: float) -> None:
+        keys, size = storage_footprint(app)
+        report.samples.append(StorageSample(round(elapsed, 3), completed, keys, size))
+
+    started = time.perf_counter()
+
+    def sampler() -> None:
+        while not finished.wait(sample_interval):
+            sample(time.perf_counter() - started)
+
+    sampler_thread = threading.Thread(target=sampler, name="maf-loadgen-sampler", daemon=True)
+    sampler_thread.start()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="maf-loadgen") as pool:
+        for event in events:
+            if speed > 0:
+                delay = event.timestamp / speed - (time.perf_counter() - started)
+                if delay > 0:
+                    time.sleep(delay)
+            pool.submit(record, event, time.perf_counter())
+    report.elapsed_seconds = time.perf_counter() - started
+    finished.set()
+    sampler_thread.join()
+    sample(report.elapsed_seconds)
+
+    for skill, samples in latencies.items():
+        samples.sort()
+        report.latencies[skill] = {
+            "calls": len(samples),
+            "p50": _percentile(samples, 0.50),
+            "p95": _percentile(samples, 0.95),
+            "p99": _percentile(samples, 0.99),
+            "max": samples[-1] if samples else None,
+        }
+    return report
+
+
+def _percentile(ordered: Sequence[float], fraction: float) -> Optional[float]:
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))]
+
+
+def build_app(
+    *,
+    search_latency: float = 0.05,
+    search_jitter: float = 0.0,
+    storage: Mapping[str, Any] | None = None,
+    seed: int | None = None,
+) -> AgentApp:
+    """Return an app with the bundled skills and a synthetic search client."""
+
+    app = AgentApp(storage=create_storage(storage))
+    client = SyntheticSearchClient(latency_seconds=search_latency, jitter_seconds=search_jitter, seed=seed)
+    app.register_skill(EchoSkill())
+    app.register_skill(WebSearchSkill(search_client=client))
+    app.register_skill(ManagementSummarySkill())
+    return app
+
+
+def _parse_mix(raw: str) -> Dict[str, float]:
+    mix = {}
+    for part in raw.split(","):
+        skill, _, weight = part.partition("=")
+        mix[skill.strip()] = float(weight)
+    return mix
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Replay recorded or synthetic traffic against an AgentApp.")
+    parser.add_argument("--trace", type=Path, help="JSONL trace to replay. Synthesised if omitted.")
+    parser.add_argument("--save-trace", type=Path, help="Write the synthesised trace to this file.")
+    parser.add_argument("--sessions", type=int, default=50, help="Synthetic sessions (default: 50).")
+    parser.add_argument("--duration", type=float, default=30.0, help="Synthetic trace length in seconds.")
+    parser.add_argument("--think-time", type=float, default=2.0, help="Mean think time in seconds.")
+    parser.add_argument(
+        "--mix",
+        type=_parse_mix,
+        default=DEFAULT_MIX,
+        help="Skill weights, e.g. 'EchoSkill=0.5,WebSearchSkill=0.3,ManagementSummarySkill=0.2'.",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for trace and search client.")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed factor, 0 for maximum rate.")
+    parser.add_argument("--workers", type=int, default=32, help="Concurrent calls (default: 32).")
+    parser.add_argument("--search-latency", type=float, default=0.05, help="Search latency in seconds.")
+    parser.add_argument("--search-jitter", type=float, default=0.0, help="Additional random search latency.")
+    parser.add_argument(
+        "--storage",
+        default="memory",
+        choices=["memory", "concurrent", "bounded", "local"],
+        help="Storage backend of the app (default: memory).",
+    )
+    parser.add_argument("--storage-path", help="Log file of the local storage backend.")
+    parser.add_argument("--sample-interval", type=float, default=1.0, help="Seconds between storage samples.")
+    parser.add_argument("--report", type=Path, help="Write the report as JSON to this file.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.trace is not None:
+        events = read_trace(args.trace)
+    else:
+        events = synthesize_trace(
+            sessions=args.sessions,
+            duration_seconds=args.duration,
+            think_time_seconds=args.think_time,
+            mix=args.mix,
+            seed=args.seed,
+        )
+        if args.save_trace is not None:
+            write_trace(events, args.save_trace)
+
+    app = build_app(
+        search_latency=args.search_latency,
+        search_jitter=args.search_jitter,
+        storage={"backend": args.storage, "path": args.storage_path},
+        seed=args.seed,
+    )
+    print(f"Replaying {len(events)} events ...", file=sys.stderr, flush=True)
+    try:
+        report = replay(
+            app, events, speed=args.speed, max_workers=args.workers, sample_interval=args.sample_interval
+        )
+    finally:
+        app.close()
+        close = getattr(app.storage, "close", None)
+        if close is not None:
+            close()
+
+    print(report.format())
+    if args.report is not None:
+        args.report.parent.mkdir(parents=True, exist_ok=True)
+        args.report.write_text(json.dumps(report.as_dict(), indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""Timing helpers, result files and baseline comparison for the benchmark suite."""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing of one benchmark.
+
+    Attributes:
+        name: Unique name, used to match results against the baseline.
+        ops: Operations performed per round.
+        rounds: Number of timed rounds.
+        median_seconds: Median duration of a round.
+        best_seconds: Fastest round.
+        params: Parameters of the benchmark, e.g. the history size.
+        extra: Additional figures reported by the benchmark.
+    """
+
+    name: str
+    ops: int
+    rounds: int
+    median_seconds: float
+    best_seconds: float
+    params: Dict[str, Any] = field(default_factory=dict)
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def ops_per_second(self) -> float:
+        return self.ops / self.median_seconds if self.median_seconds else float("inf")
+
+    @property
+    def microseconds_per_op(self) -> float:
+        return self.median_seconds / self.ops * 1e6
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["ops_per_second"] = self.ops_per_second
+        data["microseconds_per_op"] = self.microseconds_per_op
+        return data
+
+
+def measure(
+    name: str,
+    func: Callable[[], Any],
+    *,
+    ops: int,
+    rounds: int = 5,
+    warmup: int = 1,
+    setup: Optional[Callable[[], Any]] = None,
+    params: Optional[Mapping[str, Any]] = None,
+) -> BenchmarkResult:
+    """Time ``func``, which performs ``ops`` operations, over several rounds.
+
+    ``setup`` runs untimed before every round, e.g. to reset state.
+    """
+
+    timings: List[float] = []
+    for round_index in range(warmup + rounds):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        if round_index >= warmup:
+            timings.append(elapsed)
+    return BenchmarkResult(
+        name=name,
+        ops=ops,
+        rounds=rounds,
+        median_seconds=statistics.median(timings),
+        best_seconds=min(timings),
+        params=dict(params or {}),
+    )
+
+
+@dataclass
+class Comparison:
+    """Change of a benchmark relative to the baseline."""
+
+    name: str
+    baseline_seconds: float
+    current_seconds: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_seconds / self.baseline_seconds if self.baseline_seconds else float("inf")
+
+    def is_regression(self, tolerance: float) -> bool:
+        return self.ratio > 1.0 + tolerance
+
+
+def write_results(results: Iterable[BenchmarkResult], path: Path, *, quick: bool = False) -> Dict[str, Any]:
+    """Write ``results`` with information about the environment as JSON to ``path``."""
+
+    document = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "quick": quick,
+        "results": [result.as_dict() for result in results],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return document
+
+
+def load_results(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Return the results stored in ``path`` keyed by benchmark name."""
+
+    document = json.loads(path.read_text(encoding="utf-8"))
+    return {entry["name"]: entry for entry in document.get("results", [])}
+
+
+def compare(results: Iterable[BenchmarkResult], baseline: Mapping[str, Mapping[str, Any]]) -> List[Comparison]:
+    """Compare the median round time of every result present in ``baseline``."""
+
+    comparisons = []
+    for result in results:
+        entry = baseline.get(result.name)
+        if entry is None:
+            continue
+        # Rounds of the baseline may have covered a different number of ops.
+        baseline_per_op = entry["median_seconds"] / entry["ops"]
+        comparisons.append(
+            Comparison(
+                name=result.name,
+                baseline_seconds=baseline_per_op * result.ops,
+                current_seconds=result.median_seconds,
+            )
+        )
+    return comparisons
+
+
+def format_results(results: Iterable[BenchmarkResult]) -> str:
+    lines = [f"{'Benchmark':<52} {'ops/s':>14} {'µs/op':>12}"]
+    for result in results:
+        lines.append(f"{result.name:<52} {result.ops_per_second:>14,.0f} {result.microseconds_per_op:>12,.2f}")
+    return "\n".join(lines)
+
+
+def format_comparisons(comparisons: Iterable[Comparison], tolerance: float) -> str:
+    lines = [f"{'Benchmark':<52} {'change':>10}"]
+    for comparison in comparisons:
+        marker = "  REGRESSION" if comparison.is_regression(tolerance) else ""
+        lines.append(f"{comparison.name:<52} {comparison.ratio - 1.0:>+10.1%}{marker}")
+    return "\n".join(lines)
+
+
+__all__ = [
+    "BenchmarkResult",
+    "Comparison",
+    "compare",
+    "format_comparisons",
+    "format_results",
+    "load_results",
+    "measure",
+    "write_results",
+]
@@ -1,5 +1,39 @@
-"""Demo package wiring a simple agent app and skills."""
+"""Demo package wiring a simple agent app and skills.
 
-from .app import AgentApp
+The exports are imported on first access to keep ``import maf_basic`` cheap.
+"""
 
-__all__ = ["AgentApp"]
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .app import AgentApp
+    from .batch import InvokeRequest, InvokeResult
+    from .instrumentation import Instrumentation
+    from .pipeline import Pipeline, PipelineResult, Stage
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AgentApp": ".app",
+        "Instrumentation": ".instrumentation",
+        "InvokeRequest": ".batch",
+        "InvokeResult": ".batch",
+        "Pipeline": ".pipeline",
+        "PipelineResult": ".pipeline",
+        "Stage": ".pipeline",
+    },
+)
+
+__all__ = [
+    "AgentApp",
+    "Instrumentation",
+    "InvokeRequest",
+    "InvokeResult",
+    "Pipeline",
+    "PipelineResult",
+    "Stage",
+]
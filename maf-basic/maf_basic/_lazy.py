@@ -0,0 +1,44 @@
+"""Module-level ``__getattr__`` for packages that import their exports on first use."""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+
+def lazy_exports(package: str, exports: Mapping[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Return ``__getattr__`` and ``__dir__`` for ``package``.
+
+    ``exports`` maps each exported name to the relative module defining it.
+    The module is imported when the name is first accessed, and the value is
+    cached in the package namespace so later lookups are plain attribute reads.
+    """
+
+    namespace: Dict[str, Any] = import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
+
+
+def import_string(path: str) -> Any:
+    """Import ``"package.module:attribute"`` (or ``"package.module.attribute"``) and return the attribute."""
+
+    module_name, separator, attribute = path.partition(":")
+    if not separator:
+        module_name, _, attribute = path.rpartition(".")
+    if not module_name or not attribute:
+        raise ValueError(f"Invalid import path '{path}', expected 'module:attribute'")
+    value: Any = import_module(module_name)
+    for part in attribute.split("."):
+        value = getattr(value, part)
+    return value
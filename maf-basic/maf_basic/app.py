@@ -2,32 +2,398 @@
 
 from __future__ import annotations
 
-from typing import Dict
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, Iterator, Mapping, Optional, Tuple
 
+from ._lazy import import_string
+from .batch import InvokeRequest, InvokeResult, RequestLike, run_batch
+from .instrumentation import Instrumentation, InstrumentedStorage
+from .pipeline import Pipeline, PipelineResult, Stage
 from .skills.base import BaseSkill
 from .storage.base import BaseStorage
 from .storage.in_memory import InMemoryStorage
+from .storage.sharded import ShardedSessionStore
+
+if TYPE_CHECKING:  # pragma: no cover - multiprocessing is only imported for process skills
+    from .workers import ProcessSkillPool
+
+EXECUTION_MODES = ("inline", "thread", "process")
 
 
 class AgentApp:
-    """Simple agent application managing skills and shared storage."""
+    """Simple agent application managing skills and shared storage.
+
+    Calls without a ``session_id`` use the shared ``storage``. Calls with a
+    ``session_id`` get an isolated storage from ``sessions`` instead, so many
+    users can be served from one process without clobbering each other.
+
+    Args:
+        storage: Storage shared by all registered skills.
+        sessions: Store providing per-session storage. Defaults to an
+            in-memory :class:`~maf_basic.storage.sharded.ShardedSessionStore`.
+        max_workers: Size of the thread pool used to run synchronous skills
+            from :meth:`ainvoke`. ``None`` uses the ``ThreadPoolExecutor`` default.
+        timeout: Default timeout in seconds applied to :meth:`ainvoke` calls.
+        process_workers: Number of worker processes for skills registered
+            with ``execution="process"``. Defaults to the CPU count.
+        instrumentation: Collects latencies of skill calls, skill lookups and
+            storage operations if given. Without it calls are not timed at all.
+    """
 
-    def __init__(self, storage: BaseStorage | None = None) -> None:
+    def __init__(
+        self,
+        storage: BaseStorage | None = None,
+        *,
+        sessions: ShardedSessionStore | None = None,
+        max_workers: int | None = None,
+        timeout: float | None = None,
+        process_workers: int | None = None,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
         self.storage: BaseStorage = storage or InMemoryStorage()
+        self.instrumentation = instrumentation
+        self._instrumented_storage = (
+            InstrumentedStorage(self.storage, instrumentation) if instrumentation is not None else None
+        )
+        self.sessions: ShardedSessionStore = sessions or ShardedSessionStore()
         self._skills: Dict[str, BaseSkill] = {}
+        self._execution: Dict[str, str] = {}
+        self._lazy_skills: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        self._lazy_lock = threading.Lock()
+        self._max_workers = max_workers
+        self._timeout = timeout
+        self._executor: ThreadPoolExecutor | None = None
+        self._process_workers = process_workers
+        self._process_pool: ProcessSkillPool | None = None
+        self._process_lock = threading.Lock()
+
+    @classmethod
+    def from_settings(
+        cls, settings: Mapping[str, Any], *, base_dir: str | Path | None = None, **kwargs: Any
+    ) -> "AgentApp":
+        """Create an app whose storage is selected by ``storage.default`` in ``settings``."""
+
+        from .storage.factory import storage_from_settings
+
+        return cls(storage=storage_from_settings(settings, base_dir=base_dir), **kwargs)
+
+    def register_skill(self, skill: BaseSkill, *, execution: str = "inline") -> None:
+        """Register ``skill`` under its metadata name.
+
+        ``execution`` selects where synchronous calls of the skill run:
+        ``"inline"`` in the calling thread, ``"thread"`` in the app's thread
+        pool and ``"process"`` in a warm pool of worker processes, which lets
+        CPU-bound skills use all cores. Process skills must be picklable; they
+        reach the app's storage through a proxy and keep their own copy of any
+        other state.
+        """
+
+        if execution not in EXECUTION_MODES:
+            raise ValueError(f"Unknown execution mode '{execution}', expected one of {EXECUTION_MODES}")
+        if execution == "process":
+            from .workers import ensure_picklable
+
+            ensure_picklable(skill)
+        name = skill.metadata.name
+        if execution == "process" or self._execution.get(name) == "process":
+            self._close_process_pool()
+        self._lazy_skills.pop(name, None)
+        self._skills[name] = skill
+        self._execution[name] = execution
+
+    def register_lazy_skill(self, name: str, target: str, *, execution: str = "inline", **kwargs: Any) -> None:
+        """Register a skill by import path without importing it yet.
+
+        ``target`` names the skill class or factory as ``"package.module:Name"``.
+        It is imported and called with ``kwargs`` on the first call of ``name``
+        (or by :meth:`warm_up`), so short-lived processes only pay for the
+        skills they actually use. The instance must report ``name`` as its
+        metadata name. ``execution`` has the same meaning as in
+        :meth:`register_skill`.
+        """
+
+        if execution not in EXECUTION_MODES:
+            raise ValueError(f"Unknown execution mode '{execution}', expected one of {EXECUTION_MODES}")
+        if execution == "process" or self._execution.get(name) == "process":
+            self._close_process_pool()
+        self._skills.pop(name, None)
+        self._lazy_skills[name] = (target, kwargs)
+        self._execution[name] = execution
+
+    def has_skill(self, name: str) -> bool:
+        """Return ``True`` if a skill is registered under ``name``, loaded or not."""
+
+        return name in self._execution
 
-    def register_skill(self, skill: BaseSkill) -> None:
-        self._skills[skill.metadata.name] = skill
+    def is_loaded(self, name: str) -> bool:
+        """Return ``True`` if the skill ``name`` has been instantiated."""
+
+        return name in self._skills
+
+    def execution_mode(self, name: str) -> str:
+        """Return the execution mode the skill ``name`` was registered with."""
+
+        self.get_skill(name)
+        return self._execution[name]
 
     def get_skill(self, name: str) -> BaseSkill:
         try:
             return self._skills[name]
-        except KeyError as exc:
-            raise KeyError(f"Skill '{name}' is not registered") from exc
+        except KeyError:
+            if name not in self._lazy_skills:
+                raise KeyError(f"Skill '{name}' is not registered") from None
+        return self._load_skill(name)
+
+    @property
+    def timeout(self) -> float | None:
+        """Default timeout in seconds of :meth:`ainvoke` calls."""
+
+        return self._timeout
+
+    def storage_for(self, session_id: str | None = None) -> BaseStorage:
+        """Return the storage used for ``session_id`` (the shared storage for ``None``).
+
+        With instrumentation the storage is wrapped so its operations are timed.
+        """
+
+        if session_id is None:
+            return self._instrumented_storage or self.storage
+        storage = self.sessions.session(session_id)
+        if self.instrumentation is None:
+            return storage
+        return InstrumentedStorage(storage, self.instrumentation)
+
+    def end_session(self, session_id: str) -> bool:
+        """Drop all state stored for ``session_id``."""
+
+        return self.sessions.drop(session_id)
+
+    def invoke(self, name: str, message: str, *, session_id: str | None = None) -> str:
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            return self._dispatch(self.get_skill(name), name, message, session_id)
+        started = time.perf_counter()
+        skill = self.get_skill(name)
+        instrumentation.observe("app", "skill_lookup", time.perf_counter() - started)
+        with instrumentation.span("skill", name, session_id=session_id):
+            return self._dispatch(skill, name, message, session_id)
+
+    async def ainvoke(
+        self,
+        name: str,
+        message: str,
+        *,
+        session_id: str | None = None,
+        timeout: float | None = None,
+    ) -> str:
+        """Invoke a skill without blocking the running event loop.
+
+        Native async skills are awaited directly, synchronous skills run in the
+        bounded thread pool of the app and process skills in the worker pool.
+        If the call exceeds ``timeout`` (or the app default) it is cancelled and
+        :class:`asyncio.TimeoutError` is raised. A synchronous skill that is
+        already running in a worker cannot be interrupted; its result is
+        discarded.
+        """
 
-    def invoke(self, name: str, message: str) -> str:
         skill = self.get_skill(name)
-        return skill.handle(message=message, storage=self.storage)
+        storage = self.storage_for(session_id)
+        if self._execution[name] == "process":
+            call = asyncio.wrap_future(self._get_process_pool().submit(name, message, session_id))
+        elif skill.is_async:
+            call = skill.ahandle(message=message, storage=storage)
+        else:
+            loop = asyncio.get_running_loop()
+            call = loop.run_in_executor(
+                self._get_executor(), partial(skill.handle, message=message, storage=storage)
+            )
+        effective_timeout = self._timeout if timeout is None else timeout
+        if self.instrumentation is None:
+            return await asyncio.wait_for(call, timeout=effective_timeout)
+        with self.instrumentation.span("skill", name, session_id=session_id):
+            return await asyncio.wait_for(call, timeout=effective_timeout)
+
+    def stream(self, name: str, message: str, *, session_id: str | None = None) -> Iterator[str]:
+        """Invoke a skill and iterate over its response lines as they are produced.
+
+        Process skills cannot stream across the process boundary; their whole
+        response is yielded once it is complete.
+        """
+
+        skill = self.get_skill(name)
+        if self._execution[name] == "process":
+            return self._stream_from_process(name, message, session_id)
+        return skill.handle_stream(message=message, storage=self.storage_for(session_id))
+
+    def astream(self, name: str, message: str, *, session_id: str | None = None) -> AsyncIterator[str]:
+        """Asynchronous variant of :meth:`stream`."""
+
+        skill = self.get_skill(name)
+        if self._execution[name] == "process":
+            return self._astream_from_process(name, message, session_id)
+        return skill.astream(message=message, storage=self.storage_for(session_id))
+
+    def invoke_many(
+        self,
+        requests: Iterable[RequestLike],
+        *,
+        ordered: bool = True,
+        max_workers: int | None = None,
+        max_in_flight: int | None = None,
+        skill_limits: Mapping[str, int] | None = None,
+    ) -> Iterator[InvokeResult]:
+        """Invoke many ``(skill, message)`` pairs concurrently and stream the results.
+
+        Requests for the same topic keep their relative order, so a
+        ``WebSearchSkill`` call finishes before the ``ManagementSummarySkill``
+        call that follows it in the batch; a summary with an empty message
+        waits for the request before it in the same session. See :func:`maf_basic.batch.run_batch`
+        for the remaining options.
+        """
+
+        return run_batch(
+            self._invoke_request,
+            requests,
+            ordered=ordered,
+            max_workers=max_workers,
+            max_in_flight=max_in_flight,
+            skill_limits=skill_limits,
+        )
+
+    def run_pipeline(
+        self,
+        pipeline: Pipeline | Iterable[Stage],
+        message: str,
+        *,
+        session_id: str | None = None,
+        max_workers: int | None = None,
+    ) -> PipelineResult:
+        """Run a graph of skills on ``message``, passing stage outputs in memory.
+
+        Each skill receives the outputs of its input stages as the ``inputs``
+        keyword argument, exactly as returned by the skills; a
+        :class:`~maf_basic.skills.base.SkillResponse` keeps its structured
+        ``data``. Independent stages run concurrently; writes of
+        stages declared with ``store=False`` are only visible within the run.
+        Stages always run in the pipeline's threads, regardless of the
+        execution mode of their skill. See :class:`maf_basic.pipeline.Pipeline`
+        for details.
+        """
+
+        if not isinstance(pipeline, Pipeline):
+            pipeline = Pipeline(pipeline)
+        skills = {stage.name: self.get_skill(stage.skill) for stage in pipeline.stages}
+
+        instrumentation = self.instrumentation
+
+        def call(stage: Stage, stage_message: str, storage: BaseStorage, inputs: Mapping[str, str]) -> str:
+            if instrumentation is None:
+                return skills[stage.name].handle(message=stage_message, storage=storage, inputs=inputs)
+            with instrumentation.span("skill", stage.skill, stage=stage.name):
+                return skills[stage.name].handle(message=stage_message, storage=storage, inputs=inputs)
+
+        return pipeline.run(call, message, self.storage_for(session_id), max_workers=max_workers)
+
+    def warm_up(self, names: Iterable[str] | None = None) -> None:
+        """Prepare skills ahead of their first call.
+
+        Lazily registered skills are instantiated, every skill's
+        :meth:`~maf_basic.skills.base.BaseSkill.warm_up` resolves its providers
+        and connections, and worker processes of process skills are started.
+        ``names`` restricts the warm-up to the given skills.
+        """
+
+        selected = list(self._execution) if names is None else list(names)
+        for name in selected:
+            self.get_skill(name).warm_up()
+        if any(self._execution[name] == "process" for name in selected):
+            self._get_process_pool().warm_up()
+
+    def start_workers(self) -> None:
+        """Start the worker processes of process skills ahead of the first call."""
+
+        if "process" in self._execution.values():
+            self._get_process_pool().warm_up()
+
+    def close(self) -> None:
+        """Release the worker threads and processes used to run skills."""
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self._close_process_pool()
+
+    def _invoke_request(self, request: InvokeRequest) -> str:
+        return self.invoke(request.skill, request.message, session_id=request.session_id)
+
+    def _dispatch(self, skill: BaseSkill, name: str, message: str, session_id: Optional[str]) -> str:
+        execution = self._execution[name]
+        if execution == "process":
+            return self._get_process_pool().submit(name, message, session_id).result()
+        storage = self.storage_for(session_id)
+        if execution == "thread":
+            return self._get_executor().submit(skill.handle, message=message, storage=storage).result()
+        return skill.handle(message=message, storage=storage)
+
+    def _stream_from_process(self, name: str, message: str, session_id: Optional[str]) -> Iterator[str]:
+        yield self.invoke(name, message, session_id=session_id)
+
+    async def _astream_from_process(self, name: str, message: str, session_id: Optional[str]) -> AsyncIterator[str]:
+        yield await self.ainvoke(name, message, session_id=session_id)
+
+    def _load_skill(self, name: str) -> BaseSkill:
+        with self._lazy_lock:
+            skill = self._skills.get(name)
+            if skill is not None:
+                return skill
+            try:
+                target, kwargs = self._lazy_skills[name]
+            except KeyError:
+                raise KeyError(f"Skill '{name}' is not registered") from None
+            skill = import_string(target)(**kwargs)
+            if not isinstance(skill, BaseSkill):
+                raise TypeError(f"'{target}' did not produce a skill, got {type(skill).__name__}")
+            if skill.metadata.name != name:
+                raise ValueError(f"'{target}' produced skill '{skill.metadata.name}', expected '{name}'")
+            if self._execution[name] == "process":
+                from .workers import ensure_picklable
+
+                ensure_picklable(skill)
+            self._skills[name] = skill
+            del self._lazy_skills[name]
+            return skill
+
+    def _get_process_pool(self) -> ProcessSkillPool:
+        pool = self._process_pool
+        if pool is not None:
+            return pool
+        from .workers import ProcessSkillPool
+
+        # Lazy process skills are instantiated here, outside the pool lock.
+        process_names = [name for name, mode in self._execution.items() if mode == "process"]
+        skills = {name: self.get_skill(name) for name in process_names}
+        with self._process_lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessSkillPool(skills, self.storage_for, max_workers=self._process_workers)
+            return self._process_pool
+
+    def _close_process_pool(self) -> None:
+        with self._process_lock:
+            pool, self._process_pool = self._process_pool, None
+        if pool is not None:
+            pool.close()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="maf-skill"
+            )
+        return self._executor
 
 
 __all__ = ["AgentApp"]
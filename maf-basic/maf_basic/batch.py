@@ -0,0 +1,164 @@
+"""Batched skill invocation with bounded concurrency and ordering guarantees."""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Iterable, Iterator, Mapping, Optional, Tuple, Union
+
+
+@dataclass(frozen=True)
+class InvokeRequest:
+    """A single skill invocation inside a batch.
+
+    Attributes:
+        skill: Name of the registered skill.
+        message: Message passed to the skill.
+        key: Ordering key. Requests of the same session sharing a key run one
+            after another in input order, e.g. a web search and the summary of
+            the same topic. Defaults to the stripped message. A request with
+            an empty message and no key, e.g. a summary of the session's last
+            query, continues the chain of the previous request of its session,
+            see :func:`resolve_chain_key`.
+        session_id: Session whose isolated storage is used, if any.
+    """
+
+    skill: str
+    message: str
+    key: Optional[str] = None
+    session_id: Optional[str] = None
+
+    @property
+    def ordering_key(self) -> str:
+        return self.message.strip() if self.key is None else self.key
+
+    @property
+    def chain_key(self) -> Tuple[Optional[str], str]:
+        return (self.session_id, self.ordering_key)
+
+
+@dataclass(frozen=True)
+class InvokeResult:
+    """Outcome of a batched invocation."""
+
+    index: int
+    request: InvokeRequest
+    response: Optional[str] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+RequestLike = Union[InvokeRequest, Tuple[str, str]]
+ChainKey = Tuple[Optional[str], str]
+
+
+def resolve_chain_key(request: InvokeRequest, last_keys: Dict[Optional[str], str]) -> ChainKey:
+    """Return the chain of ``request`` and record it in ``last_keys``, the last key per session.
+
+    Requests are resolved in input order. A request without key and with an
+    empty message refers to earlier work of its session, so it joins the chain
+    of the previous request of that session instead of starting a new one.
+    """
+
+    key = request.ordering_key
+    if request.key is None and not key:
+        key = last_keys.get(request.session_id, key)
+    last_keys[request.session_id] = key
+    return (request.session_id, key)
+
+
+def _as_request(item: RequestLike) -> InvokeRequest:
+    if isinstance(item, InvokeRequest):
+        return item
+    skill, message = item
+    return InvokeRequest(skill=skill, message=message)
+
+
+def run_batch(
+    invoke: Callable[[InvokeRequest], str],
+    requests: Iterable[RequestLike],
+    *,
+    ordered: bool = True,
+    max_workers: int | None = None,
+    max_in_flight: int | None = None,
+    skill_limits: Mapping[str, int] | None = None,
+) -> Iterator[InvokeResult]:
+    """Run ``requests`` through ``invoke`` on a thread pool and stream the results.
+
+    The input iterable is consumed lazily and at most ``max_in_flight`` requests
+    are scheduled at any time, so memory stays flat for arbitrarily large
+    batches. Results are yielded in input order if ``ordered`` is true,
+    otherwise as soon as they complete. ``skill_limits`` caps the number of
+    concurrent calls per skill name. Errors raised by a skill are reported on
+    the corresponding :class:`InvokeResult` instead of aborting the batch.
+    """
+
+    workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    window = max(1, max_in_flight or workers * 4)
+    limiters: Dict[str, threading.BoundedSemaphore] = {
+        name: threading.BoundedSemaphore(max(1, limit)) for name, limit in (skill_limits or {}).items()
+    }
+    # Most recent future per chain; entries are dropped once the chain is drained.
+    last_by_key: Dict[ChainKey, Future] = {}
+    last_keys: Dict[Optional[str], str] = {}
+
+    def _call(request: InvokeRequest, predecessor: Optional[Future]) -> str:
+        if predecessor is not None:
+            wait([predecessor])
+        limiter = limiters.get(request.skill)
+        if limiter is None:
+            return invoke(request)
+        with limiter:
+            return invoke(request)
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="maf-batch")
+    source = enumerate(_as_request(item) for item in requests)
+    in_flight: Dict[Future, Tuple[int, InvokeRequest, ChainKey]] = {}
+    queue: Deque[Future] = deque()
+
+    def _submit_next() -> bool:
+        try:
+            index, request = next(source)
+        except StopIteration:
+            return False
+        key = resolve_chain_key(request, last_keys)
+        future = executor.submit(_call, request, last_by_key.get(key))
+        last_by_key[key] = future
+        in_flight[future] = (index, request, key)
+        if ordered:
+            queue.append(future)
+        return True
+
+    def _collect(future: Future) -> InvokeResult:
+        index, request, key = in_flight.pop(future)
+        if last_by_key.get(key) is future:
+            del last_by_key[key]
+        error = future.exception()
+        if error is not None:
+            return InvokeResult(index=index, request=request, error=error)
+        return InvokeResult(index=index, request=request, response=future.result())
+
+    try:
+        exhausted = False
+        while True:
+            while not exhausted and len(in_flight) < window:
+                exhausted = not _submit_next()
+            if not in_flight:
+                return
+            if ordered:
+                yield _collect(queue.popleft())
+            else:
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield _collect(future)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+__all__ = ["InvokeRequest", "InvokeResult", "resolve_chain_key", "run_batch"]
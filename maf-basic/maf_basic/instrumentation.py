@@ -0,0 +1,328 @@
+"""Latency histograms, call counters and span hooks for skills, storage and search."""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from .services.search import SearchClient, SearchResult
+from .storage.base import BaseStorage
+
+# Upper bounds in seconds, following the Prometheus client defaults but
+# starting lower, since many storage operations finish in microseconds.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+MetricKey = Tuple[str, str]
+
+
+class Histogram:
+    """Thread-safe latency histogram with fixed bucket bounds.
+
+    Percentiles are estimated by linear interpolation inside the bucket that
+    contains them, so their precision depends on the bucket bounds.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.bounds: Tuple[float, ...] = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        index = bisect.bisect_left(self.bounds, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.sum += seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        with self._lock:
+            counts = list(self._counts)
+            total = self.count
+            largest = self.max
+        if not total:
+            return None
+        rank = fraction * total
+        seen = 0
+        for index, count in enumerate(counts):
+            if count and seen + count >= rank:
+                if index == len(self.bounds):
+                    return largest
+                lower = self.bounds[index - 1] if index else 0.0
+                upper = self.bounds[index]
+                estimate = lower + (upper - lower) * (rank - seen) / count
+                return min(estimate, largest)
+            seen += count
+        return largest
+
+    def cumulative_counts(self) -> List[Tuple[float, int]]:
+        """Return ``(upper bound, observations <= bound)`` pairs, ending with ``inf``."""
+
+        with self._lock:
+            counts = list(self._counts)
+        pairs = []
+        running = 0
+        for bound, count in zip(self.bounds + (float("inf"),), counts):
+            running += count
+            pairs.append((bound, running))
+        return pairs
+
+
+@dataclass
+class Span:
+    """A timed operation reported to span hooks.
+
+    Attributes:
+        kind: Category of the operation (``"skill"``, ``"storage"``, ``"search"``, ...).
+        name: Name of the operation within its kind, e.g. the skill name.
+        attributes: Additional context such as the namespace or session id.
+        started: ``time.perf_counter()`` value at the start of the operation.
+        seconds: Duration, set once the operation ended.
+        error: Exception raised by the operation, if any.
+    """
+
+    kind: str
+    name: str
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    started: float = 0.0
+    seconds: Optional[float] = None
+    error: Optional[BaseException] = None
+
+
+SpanCallback = Callable[[Span], None]
+
+
+class Instrumentation:
+    """Collects per-operation latency histograms and error counters.
+
+    Operations are keyed by ``(kind, name)``. Every operation timed through
+    :meth:`span` is also passed to the registered hooks, e.g. to forward it to
+    a tracing system. Hooks run synchronously in the calling thread and must
+    not raise.
+    """
+
+    def __init__(self, *, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self._buckets = tuple(buckets)
+        self._histograms: Dict[MetricKey, Histogram] = {}
+        self._errors: Dict[MetricKey, int] = {}
+        self._start_hooks: List[SpanCallback] = []
+        self._end_hooks: List[SpanCallback] = []
+        self._lock = threading.Lock()
+
+    def add_hook(self, *, on_start: SpanCallback | None = None, on_end: SpanCallback | None = None) -> None:
+        """Register callbacks invoked when a span starts and when it ends."""
+
+        if on_start is not None:
+            self._start_hooks.append(on_start)
+        if on_end is not None:
+            self._end_hooks.append(on_end)
+
+    @contextmanager
+    def span(self, kind: str, name: str, **attributes: Any) -> Iterator[Span]:
+        """Time the enclosed block as operation ``(kind, name)``."""
+
+        span = Span(kind=kind, name=name, attributes=attributes)
+        for hook in self._start_hooks:
+            hook(span)
+        span.started = time.perf_counter()
+        try:
+            yield span
+        except BaseException as exc:
+            span.error = exc
+            raise
+        finally:
+            span.seconds = time.perf_counter() - span.started
+            self.observe(kind, name, span.seconds, error=span.error is not None)
+            for hook in self._end_hooks:
+                hook(span)
+
+    def observe(self, kind: str, name: str, seconds: float, *, error: bool = False) -> None:
+        """Record a single call of operation ``(kind, name)``."""
+
+        key = (kind, name)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, Histogram(self._buckets))
+                self._errors.setdefault(key, 0)
+        histogram.observe(seconds)
+        if error:
+            with self._lock:
+                self._errors[key] += 1
+
+    def histogram(self, kind: str, name: str) -> Optional[Histogram]:
+        return self._histograms.get((kind, name))
+
+    def errors(self, kind: str, name: str) -> int:
+        return self._errors.get((kind, name), 0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._errors.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Return ``{kind: {name: stats}}`` with calls, errors and latency percentiles."""
+
+        result: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for (kind, name), histogram in self._items():
+            result.setdefault(kind, {})[name] = {
+                "calls": histogram.count,
+                "errors": self.errors(kind, name),
+                "total_seconds": histogram.sum,
+                "max_seconds": histogram.max,
+                "p50": histogram.percentile(0.50),
+                "p95": histogram.percentile(0.95),
+                "p99": histogram.percentile(0.99),
+            }
+        return result
+
+    def to_prometheus(self, prefix: str = "maf") -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+
+        by_kind: Dict[str, List[Tuple[str, Histogram]]] = {}
+        for (kind, name), histogram in self._items():
+            by_kind.setdefault(kind, []).append((name, histogram))
+
+        lines: List[str] = []
+        for kind, entries in by_kind.items():
+            duration = f"{prefix}_{kind}_duration_seconds"
+            lines.append(f"# HELP {duration} Latency of {kind} operations in seconds.")
+            lines.append(f"# TYPE {duration} histogram")
+            for name, histogram in entries:
+                label = f'name="{_escape_label(name)}"'
+                for bound, count in histogram.cumulative_counts():
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'{duration}_bucket{{{label},le="{le}"}} {count}')
+                lines.append(f"{duration}_sum{{{label}}} {histogram.sum!r}")
+                lines.append(f"{duration}_count{{{label}}} {histogram.count}")
+            errors = f"{prefix}_{kind}_errors_total"
+            lines.append(f"# HELP {errors} Failed {kind} operations.")
+            lines.append(f"# TYPE {errors} counter")
+            for name, _ in entries:
+                lines.append(f'{errors}{{name="{_escape_label(name)}"}} {self.errors(kind, name)}')
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def _items(self) -> List[Tuple[MetricKey, Histogram]]:
+        with self._lock:
+            return sorted(self._histograms.items())
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class InstrumentedStorage(BaseStorage):
+    """Delegate to another storage and time every operation as ``("storage", <method>)``.
+
+    Spans carry the namespace as attribute. ``iter_namespace`` is passed
+    through untimed since its cost is spread over the consumer's loop.
+    """
+
+    def __init__(self, inner: BaseStorage, instrumentation: Instrumentation) -> None:
+        self.inner = inner
+        self.instrumentation = instrumentation
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        with self.instrumentation.span("storage", "get", namespace=namespace):
+            return self.inner.get(namespace, key)
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        with self.instrumentation.span("storage", "set", namespace=namespace):
+            self.inner.set(namespace, key, value)
+
+    def set_many(self, namespace: str, values: Mapping[str, Any]) -> None:
+        with self.instrumentation.span("storage", "set_many", namespace=namespace):
+            self.inner.set_many(namespace, values)
+
+    def set_batch(self, values: Mapping[str, Mapping[str, Any]]) -> None:
+        with self.instrumentation.span("storage", "set_batch", namespaces=",".join(values)):
+            self.inner.set_batch(values)
+
+    def extend(self, namespace: str, key: str, items: Iterable[Any]) -> None:
+        with self.instrumentation.span("storage", "extend", namespace=namespace):
+            self.inner.extend(namespace, key, items)
+
+    def dump_namespace(self, namespace: str) -> Dict[str, Any]:
+        with self.instrumentation.span("storage", "dump_namespace", namespace=namespace):
+            return self.inner.dump_namespace(namespace)
+
+    def iter_namespace(self, namespace: str, prefix: Optional[str] = None) -> Iterator[Tuple[str, Any]]:
+        return self.inner.iter_namespace(namespace, prefix)
+
+    def namespace_view(self, namespace: str) -> Mapping[str, Any]:
+        with self.instrumentation.span("storage", "namespace_view", namespace=namespace):
+            return self.inner.namespace_view(namespace)
+
+    def update(self, namespace: str, key: str, fn: Callable[[Optional[Any]], Any]) -> Any:
+        with self.instrumentation.span("storage", "update", namespace=namespace):
+            return self.inner.update(namespace, key, fn)
+
+    def compare_and_set(self, namespace: str, key: str, expected: Any, value: Any) -> bool:
+        with self.instrumentation.span("storage", "compare_and_set", namespace=namespace):
+            return self.inner.compare_and_set(namespace, key, expected, value)
+
+    def read_range(self, namespace: str, key: str, start: int = 0, stop: Optional[int] = None) -> List[Any]:
+        with self.instrumentation.span("storage", "read_range", namespace=namespace):
+            return self.inner.read_range(namespace, key, start, stop)
+
+    def length(self, namespace: str, key: str) -> int:
+        with self.instrumentation.span("storage", "length", namespace=namespace):
+            return self.inner.length(namespace, key)
+
+
+class InstrumentedSearchClient:
+    """Search client timing the calls of another client as ``("search", <client class>)``.
+
+    The wrapper offers ``asearch`` only if the wrapped client does, so skills
+    keep choosing the same sync or async code path.
+    """
+
+    def __init__(self, client: SearchClient, instrumentation: Instrumentation, *, name: str | None = None) -> None:
+        self._client = client
+        self.instrumentation = instrumentation
+        self.name = name or type(client).__name__
+        if hasattr(client, "asearch"):
+            self.asearch = self._asearch
+
+    def search(self, query: str, *, max_results: int = 5) -> List[SearchResult]:
+        with self.instrumentation.span("search", self.name, query=query):
+            return list(self._client.search(query, max_results=max_results))
+
+    async def _asearch(self, query: str, *, max_results: int = 5) -> List[SearchResult]:
+        with self.instrumentation.span("search", self.name, query=query):
+            return list(await self._client.asearch(query, max_results=max_results))  # type: ignore[attr-defined]
+
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "Histogram",
+    "InstrumentedSearchClient",
+    "InstrumentedStorage",
+    "Instrumentation",
+    "Span",
+]
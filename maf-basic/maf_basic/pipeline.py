@@ -0,0 +1,183 @@
+"""Skill pipelines: graphs of skill invocations passing their outputs in memory."""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .storage.base import BaseStorage
+from .storage.overlay import OverlayStorage
+
+MessageBuilder = Callable[[str, Mapping[str, str]], str]
+
+
+@dataclass(frozen=True)
+class Stage:
+    """A single skill invocation inside a :class:`Pipeline`.
+
+    Attributes:
+        name: Unique name of the stage, used to reference its output.
+        skill: Name of the registered skill.
+        inputs: Names of the stages whose outputs this stage consumes. The
+            stage starts once all of them have finished.
+        store: Whether storage writes of the stage are committed. If false
+            they are kept in memory for the duration of the run, visible to
+            the downstream stages only.
+        message: Builds the message for the skill from the pipeline message
+            and the outputs of ``inputs``. Defaults to the pipeline message.
+    """
+
+    name: str
+    skill: str
+    inputs: Tuple[str, ...] = ()
+    store: bool = True
+    message: Optional[MessageBuilder] = None
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "inputs", tuple(self.inputs))
+
+    def build_message(self, message: str, inputs: Mapping[str, str]) -> str:
+        return message if self.message is None else self.message(message, inputs)
+
+
+@dataclass
+class PipelineResult:
+    """Outcome of a pipeline run.
+
+    Attributes:
+        outputs: Responses of the stages that succeeded, keyed by stage name.
+        errors: Exceptions raised by failed stages.
+        skipped: Stages not run because one of their inputs failed.
+        seconds: Run time of every stage that was started.
+        elapsed_seconds: Wall-clock time of the whole run.
+    """
+
+    outputs: Dict[str, str] = field(default_factory=dict)
+    errors: Dict[str, BaseException] = field(default_factory=dict)
+    skipped: List[str] = field(default_factory=list)
+    seconds: Dict[str, float] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors and not self.skipped
+
+    def __getitem__(self, name: str) -> str:
+        return self.outputs[name]
+
+
+StageCall = Callable[[Stage, str, BaseStorage, Mapping[str, str]], str]
+
+
+class Pipeline:
+    """A directed acyclic graph of :class:`Stage` objects.
+
+    The graph is validated on construction: stage names must be unique, all
+    inputs must refer to stages of the pipeline and there must be no cycles.
+    """
+
+    def __init__(self, stages: Iterable[Stage]) -> None:
+        self._stages: Dict[str, Stage] = {}
+        for stage in stages:
+            if stage.name in self._stages:
+                raise ValueError(f"Duplicate pipeline stage '{stage.name}'")
+            self._stages[stage.name] = stage
+        self._dependents: Dict[str, List[str]] = {name: [] for name in self._stages}
+        for stage in self._stages.values():
+            for name in stage.inputs:
+                if name not in self._stages:
+                    raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{name}'")
+                self._dependents[name].append(stage.name)
+        self._order = self._topological_order()
+
+    @property
+    def stages(self) -> Sequence[Stage]:
+        """Stages in an order in which every stage follows its inputs."""
+
+        return [self._stages[name] for name in self._order]
+
+    def run(
+        self,
+        call: StageCall,
+        message: str,
+        storage: BaseStorage,
+        *,
+        max_workers: int | None = None,
+    ) -> PipelineResult:
+        """Run all stages through ``call`` and return their outputs.
+
+        Stages whose inputs are complete are scheduled on a thread pool right
+        away, so independent branches run concurrently. A failing stage does
+        not abort the run, but all stages depending on it are skipped.
+        """
+
+        started = time.perf_counter()
+        result = PipelineResult()
+        committed = OverlayStorage(storage, write_through=True)
+        transient = committed.sibling(write_through=False)
+        waiting = {name: len(stage.inputs) for name, stage in self._stages.items()}
+        running: Dict[Future[str], str] = {}
+        stage_started: Dict[str, float] = {}
+
+        def submit(pool: ThreadPoolExecutor, name: str) -> None:
+            stage = self._stages[name]
+            inputs = {input_name: result.outputs[input_name] for input_name in stage.inputs}
+            stage_storage = committed if stage.store else transient
+            stage_started[name] = time.perf_counter()
+            running[pool.submit(call, stage, stage.build_message(message, inputs), stage_storage, inputs)] = name
+
+        def skip(name: str) -> None:
+            result.skipped.append(name)
+            for dependent in self._dependents[name]:
+                if dependent not in result.skipped:
+                    skip(dependent)
+
+        workers = max_workers or max(1, len(self._stages))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="maf-pipeline") as pool:
+            for name in self._order:
+                if waiting[name] == 0:
+                    submit(pool, name)
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    result.seconds[name] = time.perf_counter() - stage_started[name]
+                    error = future.exception()
+                    if error is not None:
+                        result.errors[name] = error
+                        for dependent in self._dependents[name]:
+                            if dependent not in result.skipped:
+                                skip(dependent)
+                        continue
+                    result.outputs[name] = future.result()
+                    for dependent in self._dependents[name]:
+                        waiting[dependent] -= 1
+                        if waiting[dependent] == 0 and dependent not in result.skipped:
+                            submit(pool, dependent)
+
+        result.elapsed_seconds = time.perf_counter() - started
+        return result
+
+    def __len__(self) -> int:
+        return len(self._stages)
+
+    def _topological_order(self) -> List[str]:
+        remaining = {name: len(stage.inputs) for name, stage in self._stages.items()}
+        ready = [name for name, count in remaining.items() if count == 0]
+        order: List[str] = []
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for dependent in self._dependents[name]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+        if len(order) != len(self._stages):
+            cyclic = sorted(set(self._stages) - set(order))
+            raise ValueError(f"Pipeline contains a cycle through stages {cyclic}")
+        return order
+
+
+__all__ = ["Pipeline", "PipelineResult", "Stage"]
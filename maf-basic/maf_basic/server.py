@@ -0,0 +1,626 @@
+"""HTTP serving mode for :class:`~maf_basic.app.AgentApp` built on ``asyncio`` streams.
+
+Endpoints (all JSON unless noted):
+
+``POST /invoke``
+    ``{"skill": ..., "message": ..., "session_id": ...}`` → ``{"response": ...}``
+``POST /invoke_many``
+    ``{"requests": [{"skill", "message", "session_id", "key"}, ...]}`` →
+    ``{"results": [{"index", "ok", "response" | "error"}, ...]}``. Requests
+    sharing a session and ordering key run one after another, see
+    :class:`~maf_basic.batch.InvokeRequest`.
+``POST /stream``
+    Same body as ``/invoke``; the response lines are sent as newline
+    delimited JSON (``{"line": ...}``) with chunked transfer encoding. A
+    failure or timeout after the first line ends the stream with
+    ``{"error": ...}``.
+``GET /health``
+    Status, running and queued requests and the number of shed requests.
+``GET /metrics``
+    Prometheus text export if the app has an
+    :class:`~maf_basic.instrumentation.Instrumentation`.
+
+Every request first has to be admitted: at most ``max_concurrency`` skill
+calls run at the same time and at most ``max_queue`` wait for a slot. Skills
+listed in ``skill_limits`` additionally have their own concurrency limit and
+queue. Requests that do not fit are shed immediately with ``429 Too Many
+Requests``, so a slow skill cannot pile up unbounded work. On shutdown the
+server stops accepting connections, answers new requests on open connections
+with ``503`` and waits for admitted requests to finish.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import signal
+from collections import defaultdict
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Set, Tuple
+
+from .app import AgentApp
+from .batch import InvokeRequest, resolve_chain_key
+
+_MAX_HEADER_LINES = 100
+
+
+class HttpError(Exception):
+    """Error answered with ``status`` and a JSON body ``{"error": message}``."""
+
+    def __init__(self, status: int, message: str, *, close: bool = False) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.close = close
+
+
+@dataclass
+class HttpRequest:
+    """A parsed HTTP request."""
+
+    method: str
+    path: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    keep_alive: bool = True
+
+    def json(self) -> Dict[str, Any]:
+        try:
+            data = json.loads(self.body or b"{}")
+        except ValueError as exc:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"Invalid JSON body: {exc}") from None
+        if not isinstance(data, dict):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Request body must be a JSON object")
+        return data
+
+
+class _Limiter:
+    """Concurrency limit with a bounded number of waiting callers.
+
+    ``pending`` counts admitted callers, running or waiting. It is only
+    touched from the event loop, so checking and reserving room needs no lock.
+    """
+
+    def __init__(self, limit: int, queue_size: int) -> None:
+        self.limit = max(1, limit)
+        self.capacity = self.limit + max(0, queue_size)
+        self.pending = 0
+        self.running = 0
+        self._semaphore = asyncio.Semaphore(self.limit)
+
+    @property
+    def queued(self) -> int:
+        return self.pending - self.running
+
+    def has_room(self, count: int = 1) -> bool:
+        return self.pending + count <= self.capacity
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Wait for a slot; the caller reserves and releases room in ``pending``."""
+
+        async with self._semaphore:
+            self.running += 1
+            try:
+                yield
+            finally:
+                self.running -= 1
+
+
+class AgentServer:
+    """Serve an :class:`AgentApp` over HTTP/1.1 with backpressure.
+
+    Args:
+        app: App whose skills are served.
+        host: Interface to bind.
+        port: Port to bind; ``0`` picks a free port, see :attr:`port`.
+        max_concurrency: Skill calls running at the same time.
+        max_queue: Admitted requests allowed to wait for a slot.
+        skill_limits: Concurrency limit per skill name.
+        skill_queue: Waiting requests allowed per limited skill. Defaults to
+            ``max_queue``.
+        request_timeout: Timeout in seconds of a single skill call or of a
+            whole stream. ``None`` uses the app default.
+        max_batch_size: Largest accepted ``/invoke_many`` batch.
+        max_body_bytes: Largest accepted request body.
+        keep_alive_timeout: Seconds an idle connection is kept open.
+        retry_after: Value of the ``Retry-After`` header of shed requests.
+    """
+
+    def __init__(
+        self,
+        app: AgentApp,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        max_concurrency: int = 64,
+        max_queue: int = 256,
+        skill_limits: Mapping[str, int] | None = None,
+        skill_queue: int | None = None,
+        request_timeout: float | None = None,
+        max_batch_size: int = 100,
+        max_body_bytes: int = 1_048_576,
+        keep_alive_timeout: float = 5.0,
+        retry_after: int = 1,
+    ) -> None:
+        self.app = app
+        self.host = host
+        self.port = port
+        self._max_concurrency = max_concurrency
+        self._max_queue = max_queue
+        self._skill_limits = dict(skill_limits or {})
+        self._skill_queue = max_queue if skill_queue is None else skill_queue
+        self._request_timeout = request_timeout
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_body_bytes = max_body_bytes
+        self._keep_alive_timeout = keep_alive_timeout
+        self._retry_after = retry_after
+        self._server: asyncio.AbstractServer | None = None
+        self._limiter: _Limiter | None = None
+        self._skill_limiters: Dict[str, _Limiter] = {}
+        self._connections: Set[asyncio.Task] = set()
+        self._idle_connections: Set[asyncio.Task] = set()
+        self._in_progress = 0
+        self._drained: asyncio.Event | None = None
+        self._closed: asyncio.Event | None = None
+        self.draining = False
+        self.shed = 0
+
+    async def start(self) -> None:
+        """Bind the listening socket and start accepting connections."""
+
+        # Loop-bound primitives are created here, inside the serving loop.
+        self._limiter = _Limiter(self._max_concurrency, self._max_queue)
+        self._skill_limiters = {
+            name: _Limiter(limit, self._skill_queue) for name, limit in self._skill_limits.items()
+        }
+        self._drained = asyncio.Event()
+        self._drained.set()
+        self._closed = asyncio.Event()
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """Start the server if needed and wait until :meth:`shutdown` completes."""
+
+        if self._server is None:
+            await self.start()
+        assert self._closed is not None
+        await self._closed.wait()
+
+    async def shutdown(self, timeout: float | None = 30.0) -> None:
+        """Stop accepting connections and drain admitted requests.
+
+        Requests that are still running after ``timeout`` seconds are cancelled.
+        """
+
+        if self._server is None or self.draining:
+            return
+        self.draining = True
+        self._server.close()
+        for task in list(self._idle_connections):
+            task.cancel()
+        assert self._drained is not None and self._closed is not None
+        try:
+            await asyncio.wait_for(self._drained.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        for task in list(self._connections):
+            task.cancel()
+        if self._connections:
+            await asyncio.gather(*self._connections, return_exceptions=True)
+        await self._server.wait_closed()
+        self._closed.set()
+
+    async def __aenter__(self) -> "AgentServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.shutdown()
+
+    def status(self) -> Dict[str, Any]:
+        limiter = self._limiter
+        return {
+            "status": "draining" if self.draining else "ok",
+            "running": limiter.running if limiter else 0,
+            "queued": limiter.queued if limiter else 0,
+            "shed": self.shed,
+            "skills": {
+                name: {"running": skill.running, "queued": skill.queued}
+                for name, skill in self._skill_limiters.items()
+            },
+        }
+
+    # Connection handling -------------------------------------------------
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        assert task is not None
+        self._connections.add(task)
+        try:
+            while not self.draining:
+                self._idle_connections.add(task)
+                try:
+                    request = await asyncio.wait_for(self._read_request(reader), self._keep_alive_timeout)
+                except HttpError as exc:
+                    await self._send_json(writer, exc.status, {"error": exc.message}, keep_alive=False)
+                    break
+                except asyncio.TimeoutError:
+                    break
+                finally:
+                    self._idle_connections.discard(task)
+                if request is None:
+                    break
+                self._begin()
+                try:
+                    keep_alive = await self._respond(request, writer)
+                finally:
+                    self._end()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._connections.discard(task)
+            writer.close()
+            with contextlib.suppress(Exception):
+                await writer.wait_closed()
+
+    def _begin(self) -> None:
+        assert self._drained is not None
+        self._in_progress += 1
+        self._drained.clear()
+
+    def _end(self) -> None:
+        assert self._drained is not None
+        self._in_progress -= 1
+        if self._in_progress == 0:
+            self._drained.set()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[HttpRequest]:
+        line = await _readline(reader)
+        if not line:
+            return None
+        try:
+            method, path, version = line.decode("latin-1").split()
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Malformed request line", close=True) from None
+        headers: Dict[str, str] = {}
+        for _ in range(_MAX_HEADER_LINES):
+            header = await _readline(reader)
+            if header in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = header.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        else:
+            raise HttpError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Too many headers", close=True)
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            raise HttpError(HTTPStatus.LENGTH_REQUIRED, "Chunked request bodies are not supported", close=True)
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length", close=True) from None
+        if length < 0:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length", close=True)
+        if length > self._max_body_bytes:
+            raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large", close=True)
+        body = await reader.readexactly(length) if length else b""
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+        return HttpRequest(method.upper(), path.split("?", 1)[0], headers, body, keep_alive)
+
+    async def _respond(self, request: HttpRequest, writer: asyncio.StreamWriter) -> bool:
+        """Answer ``request`` and return whether the connection stays open."""
+
+        try:
+            if self.draining:
+                raise HttpError(HTTPStatus.SERVICE_UNAVAILABLE, "Server is shutting down", close=True)
+            route = (request.method, request.path)
+            if route == ("POST", "/stream"):
+                await self._stream(request, writer)
+                return request.keep_alive and not self.draining
+            if route == ("POST", "/invoke"):
+                status, body = await self._invoke(request)
+            elif route == ("POST", "/invoke_many"):
+                status, body = await self._invoke_many(request)
+            elif route == ("GET", "/health"):
+                status, body = HTTPStatus.OK, self.status()
+            elif route == ("GET", "/metrics"):
+                return await self._metrics(request, writer)
+            elif request.path in ("/invoke", "/invoke_many", "/stream", "/health", "/metrics"):
+                raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, f"{request.method} is not allowed on {request.path}")
+            else:
+                raise HttpError(HTTPStatus.NOT_FOUND, f"Unknown path {request.path}")
+        except HttpError as exc:
+            keep_alive = request.keep_alive and not exc.close and not self.draining
+            await self._send_json(writer, exc.status, {"error": exc.message}, keep_alive=keep_alive)
+            return keep_alive
+        keep_alive = request.keep_alive and not self.draining
+        await self._send_json(writer, status, body, keep_alive=keep_alive)
+        return keep_alive
+
+    # Endpoints -----------------------------------------------------------
+
+    async def _invoke(self, request: HttpRequest) -> Tuple[int, Dict[str, Any]]:
+        invoke_request = self._parse_invoke(request.json())
+        self._admit([invoke_request.skill])
+        try:
+            response = await self._call(invoke_request)
+        except HttpError:
+            raise
+        except asyncio.TimeoutError:
+            raise HttpError(HTTPStatus.GATEWAY_TIMEOUT, f"Skill '{invoke_request.skill}' timed out") from None
+        except Exception as exc:  # noqa: BLE001 - skill errors are reported to the client
+            raise HttpError(HTTPStatus.INTERNAL_SERVER_ERROR, _describe(exc)) from None
+        return HTTPStatus.OK, {"response": response}
+
+    async def _invoke_many(self, request: HttpRequest) -> Tuple[int, Dict[str, Any]]:
+        data = request.json()
+        items = data.get("requests")
+        if not isinstance(items, list):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "'requests' must be a list")
+        if len(items) > self._max_batch_size:
+            raise HttpError(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"Batch exceeds the limit of {self._max_batch_size} requests"
+            )
+        requests = [self._parse_invoke(item, batch=True) for item in items]
+        # The whole batch is admitted or shed, never a part of it.
+        self._admit([invoke_request.skill for invoke_request in requests])
+
+        chains: Dict[Tuple[Optional[str], str], List[int]] = defaultdict(list)
+        last_keys: Dict[Optional[str], str] = {}
+        for index, invoke_request in enumerate(requests):
+            chains[resolve_chain_key(invoke_request, last_keys)].append(index)
+        results: List[Dict[str, Any]] = [{} for _ in requests]
+
+        async def run_chain(indices: List[int]) -> None:
+            remaining = list(indices)
+            try:
+                while remaining:
+                    index = remaining.pop(0)
+                    try:
+                        response = await self._call(requests[index])
+                    except asyncio.TimeoutError:
+                        results[index] = {"index": index, "ok": False, "error": "Skill timed out"}
+                    except Exception as exc:  # noqa: BLE001 - reported per request
+                        results[index] = {"index": index, "ok": False, "error": _describe(exc)}
+                    else:
+                        results[index] = {"index": index, "ok": True, "response": response}
+            finally:
+                # Give back the room reserved for requests a cancellation skipped.
+                for index in remaining:
+                    self._release(requests[index].skill)
+
+        await asyncio.gather(*(run_chain(indices) for indices in chains.values()))
+        return HTTPStatus.OK, {"results": results}
+
+    async def _stream(self, request: HttpRequest, writer: asyncio.StreamWriter) -> None:
+        invoke_request = self._parse_invoke(request.json())
+        self._admit([invoke_request.skill])
+        async with self._slot(invoke_request.skill):
+            # Resolve the skill before the status line is sent, so that a
+            # failure here is still answered with a proper error status.
+            try:
+                lines = self.app.astream(
+                    invoke_request.skill, invoke_request.message, session_id=invoke_request.session_id
+                )
+            except Exception as exc:  # noqa: BLE001 - e.g. a lazy skill that fails to import
+                raise HttpError(HTTPStatus.INTERNAL_SERVER_ERROR, _describe(exc)) from None
+            keep_alive = request.keep_alive and not self.draining
+            head = _head(
+                HTTPStatus.OK,
+                {"Content-Type": "application/x-ndjson", "Transfer-Encoding": "chunked"},
+                keep_alive=keep_alive,
+            )
+            writer.write(head)
+            loop = asyncio.get_running_loop()
+            timeout = self._request_timeout if self._request_timeout is not None else self.app.timeout
+            deadline = None if timeout is None else loop.time() + timeout
+            try:
+                async with contextlib.aclosing(lines):
+                    while True:
+                        remaining = None if deadline is None else max(0.0, deadline - loop.time())
+                        try:
+                            line = await asyncio.wait_for(anext(lines), remaining)
+                        except StopAsyncIteration:
+                            break
+                        writer.write(_chunk({"line": line}))
+                        await writer.drain()
+            except ConnectionError:
+                raise
+            except asyncio.TimeoutError:
+                writer.write(_chunk({"error": f"Skill '{invoke_request.skill}' timed out"}))
+            except Exception as exc:  # noqa: BLE001 - the status line has been sent already
+                writer.write(_chunk({"error": _describe(exc)}))
+            writer.write(b"0\r\n\r\n")
+            await writer.drain()
+
+    async def _metrics(self, request: HttpRequest, writer: asyncio.StreamWriter) -> bool:
+        instrumentation = self.app.instrumentation
+        if instrumentation is None:
+            raise HttpError(HTTPStatus.NOT_FOUND, "The app has no instrumentation")
+        body = instrumentation.to_prometheus().encode("utf-8")
+        keep_alive = request.keep_alive and not self.draining
+        writer.write(_head(HTTPStatus.OK, {"Content-Type": "text/plain; version=0.0.4"}, body, keep_alive=keep_alive))
+        writer.write(body)
+        await writer.drain()
+        return keep_alive
+
+    # Admission control ---------------------------------------------------
+
+    def _parse_invoke(self, data: Any, *, batch: bool = False) -> InvokeRequest:
+        if not isinstance(data, dict):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Each request must be a JSON object")
+        skill = data.get("skill")
+        message = data.get("message")
+        session_id = data.get("session_id")
+        key = data.get("key") if batch else None
+        if not isinstance(skill, str) or not isinstance(message, str):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "'skill' and 'message' must be strings")
+        if session_id is not None and not isinstance(session_id, str):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "'session_id' must be a string")
+        if key is not None and not isinstance(key, str):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "'key' must be a string")
+        if not self.app.has_skill(skill):
+            raise HttpError(HTTPStatus.NOT_FOUND, f"Skill '{skill}' is not registered")
+        return InvokeRequest(skill=skill, message=message, key=key, session_id=session_id)
+
+    def _admit(self, skills: List[str]) -> None:
+        """Reserve room for ``skills`` or shed the request with ``429``."""
+
+        assert self._limiter is not None
+        counts: Dict[str, int] = defaultdict(int)
+        for skill in skills:
+            counts[skill] += 1
+        limiters = [(self._limiter, len(skills))]
+        limiters.extend(
+            (self._skill_limiters[skill], count) for skill, count in counts.items() if skill in self._skill_limiters
+        )
+        if not all(limiter.has_room(count) for limiter, count in limiters):
+            self.shed += 1
+            raise HttpError(HTTPStatus.TOO_MANY_REQUESTS, "Server is overloaded, retry later")
+        for limiter, count in limiters:
+            limiter.pending += count
+
+    def _release(self, skill: str) -> None:
+        assert self._limiter is not None
+        self._limiter.pending -= 1
+        skill_limiter = self._skill_limiters.get(skill)
+        if skill_limiter is not None:
+            skill_limiter.pending -= 1
+
+    @contextlib.asynccontextmanager
+    async def _slot(self, skill: str) -> AsyncIterator[None]:
+        """Hold a slot of the skill's limiter and then of the global one.
+
+        Taking the skill slot first keeps requests for a saturated skill from
+        occupying global slots other skills could use. The room reserved by
+        :meth:`_admit` is released on exit, also if the wait is cancelled.
+        """
+
+        assert self._limiter is not None
+        skill_limiter = self._skill_limiters.get(skill)
+        try:
+            async with skill_limiter.slot() if skill_limiter is not None else contextlib.nullcontext():
+                async with self._limiter.slot():
+                    yield
+        finally:
+            self._release(skill)
+
+    async def _call(self, request: InvokeRequest) -> str:
+        async with self._slot(request.skill):
+            return await self.app.ainvoke(
+                request.skill, request.message, session_id=request.session_id, timeout=self._request_timeout
+            )
+
+    async def _send_json(
+        self, writer: asyncio.StreamWriter, status: int, body: Mapping[str, Any], *, keep_alive: bool
+    ) -> None:
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        headers = {"Content-Type": "application/json; charset=utf-8"}
+        if status in (HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE):
+            headers["Retry-After"] = str(self._retry_after)
+        writer.write(_head(status, headers, payload, keep_alive=keep_alive))
+        writer.write(payload)
+        await writer.drain()
+
+
+async def _readline(reader: asyncio.StreamReader) -> bytes:
+    try:
+        return await reader.readline()
+    except ValueError:  # the line exceeds the stream buffer limit
+        raise HttpError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Header line too long", close=True) from None
+
+
+def _head(status: int, headers: Mapping[str, str], body: bytes | None = None, *, keep_alive: bool) -> bytes:
+    status = HTTPStatus(status)
+    lines = [f"HTTP/1.1 {status.value} {status.phrase}"]
+    lines.extend(f"{name}: {value}" for name, value in headers.items())
+    if body is not None:
+        lines.append(f"Content-Length: {len(body)}")
+    lines.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+def _chunk(data: Mapping[str, Any]) -> bytes:
+    payload = json.dumps(data, ensure_ascii=False).encode("utf-8") + b"\n"
+    return f"{len(payload):x}\r\n".encode("ascii") + payload + b"\r\n"
+
+
+def _describe(exc: BaseException) -> str:
+    return f"{type(exc).__name__}: {exc}"
+
+
+async def serve(app: AgentApp, *, drain_timeout: float = 30.0, **kwargs: Any) -> None:
+    """Serve ``app`` until SIGINT or SIGTERM, then drain gracefully.
+
+    ``kwargs`` are passed to :class:`AgentServer`.
+    """
+
+    server = AgentServer(app, **kwargs)
+    await server.start()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        with contextlib.suppress(NotImplementedError):  # not available on Windows
+            loop.add_signal_handler(signum, lambda: asyncio.ensure_future(server.shutdown(drain_timeout)))
+    print(f"maf-basic serving on http://{server.host}:{server.port}", flush=True)
+    await server.serve_forever()
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Serve the demo agent over HTTP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--max-concurrency", type=int, default=64)
+    parser.add_argument("--max-queue", type=int, default=256)
+    parser.add_argument(
+        "--skill-limit",
+        action="append",
+        default=[],
+        metavar="SKILL=N",
+        help="Concurrency limit of a skill, may be given several times",
+    )
+    parser.add_argument("--request-timeout", type=float, default=None)
+    parser.add_argument("--drain-timeout", type=float, default=30.0)
+    return parser
+
+
+def main(argv: List[str] | None = None) -> None:
+    """Serve the bundled skills, registered lazily."""
+
+    args = _build_parser().parse_args(argv)
+    skill_limits = {}
+    for entry in args.skill_limit:
+        name, _, limit = entry.partition("=")
+        skill_limits[name] = int(limit)
+
+    app = AgentApp()
+    app.register_lazy_skill("EchoSkill", "maf_basic.skills.echo:EchoSkill")
+    app.register_lazy_skill("WebSearchSkill", "maf_basic.skills.web_search:WebSearchSkill")
+    app.register_lazy_skill("ManagementSummarySkill", "maf_basic.skills.management_summary:ManagementSummarySkill")
+    try:
+        asyncio.run(
+            serve(
+                app,
+                host=args.host,
+                port=args.port,
+                max_concurrency=args.max_concurrency,
+                max_queue=args.max_queue,
+                skill_limits=skill_limits,
+                request_timeout=args.request_timeout,
+                drain_timeout=args.drain_timeout,
+            )
+        )
+    finally:
+        app.close()
+
+
+if __name__ == "__main__":
+    main()
+
+
+__all__ = ["AgentServer", "HttpError", "HttpRequest", "serve"]
@@ -0,0 +1,110 @@
+"""Caching wrapper for search clients."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Iterable, Tuple
+
+from .search import SearchClient, SearchResult
+
+CacheKey = Tuple[str, int]
+
+
+def normalize_query(query: str) -> str:
+    """Return a canonical form of ``query`` used for cache lookups."""
+
+    return " ".join(query.split()).casefold()
+
+
+@dataclass
+class CacheStats:
+    """Counters describing the effectiveness of a :class:`CachingSearchClient`."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CachingSearchClient:
+    """Search client that memoises the results of another client.
+
+    Entries are keyed on the normalised query and ``max_results``, expire after
+    ``ttl_seconds`` and the least recently used entry is evicted once more than
+    ``max_entries`` queries are cached.
+    """
+
+    def __init__(
+        self,
+        client: SearchClient,
+        *,
+        ttl_seconds: float = 300.0,
+        max_entries: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._client = client
+        self._ttl = ttl_seconds
+        self._max_entries = max(1, max_entries)
+        self._clock = clock
+        self._entries: OrderedDict[CacheKey, Tuple[float, Tuple[SearchResult, ...]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    def search(self, query: str, *, max_results: int = 5) -> Iterable[SearchResult]:
+        key = (normalize_query(query), max_results)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        results = tuple(self._client.search(query, max_results=max_results))
+        self._store(key, results)
+        return results
+
+    def invalidate(self, query: str | None = None) -> None:
+        """Drop the cached entries for ``query`` or the whole cache."""
+
+        with self._lock:
+            if query is None:
+                self._entries.clear()
+                return
+            normalized = normalize_query(query)
+            for key in [key for key in self._entries if key[0] == normalized]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, key: CacheKey) -> Tuple[SearchResult, ...] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            expires_at, results = entry
+            if self._clock() >= expires_at:
+                del self._entries[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return results
+
+    def _store(self, key: CacheKey, results: Tuple[SearchResult, ...]) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self._ttl, results)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+
+__all__ = ["CacheStats", "CachingSearchClient", "normalize_query"]
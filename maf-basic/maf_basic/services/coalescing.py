@@ -0,0 +1,108 @@
+"""Single-flight request coalescing for search clients."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+from .cache import CacheKey, normalize_query
+from .search import SearchClient, SearchResult
+
+
+@dataclass
+class CoalescingStats:
+    """Counters describing how many calls were served by a shared flight."""
+
+    calls: int = 0
+    coalesced: int = 0
+
+    @property
+    def upstream_calls(self) -> int:
+        return self.calls - self.coalesced
+
+
+class _Flight:
+    __slots__ = ("done", "results", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.results: Tuple[SearchResult, ...] = ()
+        self.error: Optional[BaseException] = None
+
+
+class CoalescingSearchClient:
+    """Search client sharing one in-flight provider call between identical queries.
+
+    Concurrent calls with the same normalised query and ``max_results`` wait for
+    the first call (the leader) and all receive its results or its exception.
+    Nothing is cached once the call completes; combine with
+    :class:`~maf_basic.services.cache.CachingSearchClient` for that.
+
+    Thread callers use :meth:`search`, asyncio callers use :meth:`asearch`. The
+    async path runs the blocking provider call in a worker thread through
+    :meth:`search`, so both kinds of callers share the same flights. If the
+    wrapped client offers its own ``asearch`` it is awaited directly instead.
+    """
+
+    def __init__(self, client: SearchClient) -> None:
+        self._client = client
+        self._lock = threading.Lock()
+        self._flights: Dict[CacheKey, _Flight] = {}
+        self._async_flights: Dict[Tuple[asyncio.AbstractEventLoop, CacheKey], "asyncio.Future[Any]"] = {}
+        self.stats = CoalescingStats()
+
+    def search(self, query: str, *, max_results: int = 5) -> Iterable[SearchResult]:
+        key = (normalize_query(query), max_results)
+        with self._lock:
+            self.stats.calls += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.stats.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.results
+
+        try:
+            flight.results = tuple(self._client.search(query, max_results=max_results))
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.results
+
+    async def asearch(self, query: str, *, max_results: int = 5) -> Sequence[SearchResult]:
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, (normalize_query(query), max_results))
+        task = self._async_flights.get(flight_key)
+        if task is None:
+            task = loop.create_task(self._fetch(query, max_results))
+            self._async_flights[flight_key] = task
+            task.add_done_callback(lambda _: self._async_flights.pop(flight_key, None))
+        else:
+            with self._lock:
+                self.stats.calls += 1
+                self.stats.coalesced += 1
+        # Shield the shared task so a cancelled caller does not cancel the others.
+        return await asyncio.shield(task)
+
+    async def _fetch(self, query: str, max_results: int) -> Tuple[SearchResult, ...]:
+        asearch = getattr(self._client, "asearch", None)
+        if asearch is None:
+            return tuple(await asyncio.to_thread(self.search, query, max_results=max_results))
+        with self._lock:
+            self.stats.calls += 1
+        return tuple(await asearch(query, max_results=max_results))
+
+
+__all__ = ["CoalescingSearchClient", "CoalescingStats"]
@@ -0,0 +1,228 @@
+"""Federated search over several providers with hedged requests."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Sequence, Set
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .providers import SearchProviderError
+from .search import SearchClient, SearchResult
+
+_TRACKING_PREFIXES = ("utm_",)
+_TRACKING_PARAMS = frozenset({"fbclid", "gclid", "ref", "ref_src"})
+
+
+def normalize_url(url: str) -> str:
+    """Return a canonical form of ``url`` used to detect duplicate results.
+
+    Scheme and host are lower-cased, a leading ``www.``, default ports, the
+    fragment, trailing slashes and common tracking parameters are dropped and
+    the remaining query parameters are sorted.
+    """
+
+    parts = urlsplit(url.strip())
+    if not parts.netloc:
+        return url.strip().casefold()
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    port = parts.port
+    if port and not ((scheme == "http" and port == 80) or (scheme == "https" and port == 443)):
+        host = f"{host}:{port}"
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.startswith(_TRACKING_PREFIXES) and key not in _TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/")
+    return urlunsplit(("https" if scheme in {"http", "https"} else scheme, host, path, urlencode(query), ""))
+
+
+def merge_results(
+    result_lists: Sequence[Sequence[SearchResult]], *, max_results: int, rank_constant: int = 60
+) -> List[SearchResult]:
+    """Deduplicate results by normalised URL and merge them by reciprocal rank.
+
+    A result scores ``1 / (rank_constant + rank)`` for every list it appears
+    in. Ties keep the order of first appearance, so earlier lists win.
+    """
+
+    scores: Dict[str, float] = {}
+    first_seen: Dict[str, SearchResult] = {}
+    for results in result_lists:
+        for rank, result in enumerate(results, start=1):
+            key = normalize_url(result.url) if result.url else f"title:{result.title.casefold()}"
+            if key not in first_seen:
+                first_seen[key] = result
+                scores[key] = 0.0
+            scores[key] += 1.0 / (rank_constant + rank)
+    order = {key: index for index, key in enumerate(first_seen)}
+    ranked = sorted(first_seen, key=lambda key: (-scores[key], order[key]))
+    return [first_seen[key] for key in ranked[:max_results]]
+
+
+class LatencyTracker:
+    """Rolling window of call latencies with percentile lookup."""
+
+    def __init__(self, window: int = 200) -> None:
+        self._samples: Deque[float] = deque(maxlen=max(1, window))
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        with self._lock:
+            if not self._samples:
+                return None
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+        return ordered[index]
+
+
+class FederatedSearchClient:
+    """Search client querying several providers and merging their results.
+
+    In hedged mode (the default) the first provider is queried alone. If it has
+    not answered within the hedge delay, or fails, the next provider is
+    queried as well, and so on. The call returns as soon as any provider has
+    answered, merged with the answers of every other provider that finished by
+    then. The hedge delay is ``hedge_delay`` if given, otherwise the
+    ``hedge_percentile`` latency of the primary provider over its recent calls
+    (``initial_hedge_delay`` until ``min_samples`` calls were observed).
+
+    With ``hedged=False`` all providers are queried in parallel and the call
+    waits for all of them (or ``timeout``).
+
+    ``hedges_sent`` counts backup requests sent because a provider was slower
+    than the hedge delay, ``fallbacks_sent`` those sent because it failed.
+
+    Args:
+        providers: Search clients in order of preference.
+        hedged: Whether to use hedged requests instead of a full fan-out.
+        hedge_delay: Fixed hedge delay in seconds.
+        hedge_percentile: Percentile of the primary's latency used as delay.
+        initial_hedge_delay: Delay used before enough latencies were recorded.
+        min_samples: Number of latencies needed before the percentile is used.
+        timeout: Overall time limit of a call in seconds.
+        max_workers: Size of the thread pool running provider calls.
+    """
+
+    def __init__(
+        self,
+        providers: Sequence[SearchClient],
+        *,
+        hedged: bool = True,
+        hedge_delay: float | None = None,
+        hedge_percentile: float = 0.95,
+        initial_hedge_delay: float = 0.5,
+        min_samples: int = 20,
+        timeout: float | None = None,
+        max_workers: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not providers:
+            raise ValueError("FederatedSearchClient requires at least one provider")
+        self._providers = list(providers)
+        self._hedged = hedged
+        self._hedge_delay = hedge_delay
+        self._hedge_percentile = hedge_percentile
+        self._initial_hedge_delay = initial_hedge_delay
+        self._min_samples = min_samples
+        self._timeout = timeout
+        self._clock = clock
+        self._latencies = [LatencyTracker() for _ in self._providers]
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or 4 * len(self._providers), thread_name_prefix="maf-federated"
+        )
+        self.hedges_sent = 0
+        self.fallbacks_sent = 0
+
+    def current_hedge_delay(self) -> float:
+        """Return the delay after which a backup request is sent."""
+
+        if self._hedge_delay is not None:
+            return self._hedge_delay
+        primary = self._latencies[0]
+        if len(primary) < self._min_samples:
+            return self._initial_hedge_delay
+        return primary.percentile(self._hedge_percentile) or self._initial_hedge_delay
+
+    def search(self, query: str, *, max_results: int = 5) -> Iterable[SearchResult]:
+        deadline = None if self._timeout is None else self._clock() + self._timeout
+        pending: Dict[Future, int] = {}
+        answers: Dict[int, List[SearchResult]] = {}
+        errors: List[BaseException] = []
+        next_index = 0
+
+        def launch() -> None:
+            nonlocal next_index
+            pending[self._executor.submit(self._call, next_index, query, max_results)] = next_index
+            next_index += 1
+
+        def collect(done: Set[Future]) -> None:
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    answers[index] = future.result()
+                except Exception as exc:  # noqa: BLE001 - any provider failure triggers a fallback
+                    errors.append(exc)
+
+        if self._hedged:
+            launch()
+        else:
+            while next_index < len(self._providers):
+                launch()
+
+        while pending:
+            remaining = None if deadline is None else max(0.0, deadline - self._clock())
+            can_hedge = self._hedged and next_index < len(self._providers)
+            wait_for = remaining
+            if can_hedge:
+                delay = self.current_hedge_delay()
+                wait_for = delay if remaining is None else min(delay, remaining)
+            mode = FIRST_COMPLETED if self._hedged else ALL_COMPLETED
+            done, _ = wait(set(pending), timeout=wait_for, return_when=mode)
+            collect(done)
+            if self._hedged and answers:
+                collect({future for future in pending if future.done()})
+                break
+            if deadline is not None and self._clock() >= deadline:
+                break
+            if can_hedge:
+                # Without an answer, a completed call means a failed provider.
+                if done:
+                    self.fallbacks_sent += 1
+                else:
+                    self.hedges_sent += 1
+                launch()
+
+        for future in pending:
+            future.cancel()
+        if not answers:
+            if errors:
+                raise SearchProviderError(f"Alle Suchanbieter sind fehlgeschlagen: {errors[-1]}") from errors[-1]
+            raise SearchProviderError("Kein Suchanbieter hat rechtzeitig geantwortet.")
+        ordered = [answers[index] for index in sorted(answers)]
+        return merge_results(ordered, max_results=max_results)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _call(self, index: int, query: str, max_results: int) -> List[SearchResult]:
+        started = self._clock()
+        results = list(self._providers[index].search(query, max_results=max_results))
+        self._latencies[index].record(self._clock() - started)
+        return results
+
+
+__all__ = ["FederatedSearchClient", "LatencyTracker", "merge_results", "normalize_url"]
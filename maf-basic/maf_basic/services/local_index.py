@@ -0,0 +1,147 @@
+"""Inverted full-text index over stored search results with BM25 ranking."""
+
+from __future__ import annotations
+
+import math
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+
+from .federated import normalize_url
+from .search import SearchResult
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split ``text`` into lower-cased word tokens."""
+
+    return _TOKEN_PATTERN.findall(text.casefold())
+
+
+class _Document:
+    __slots__ = ("result", "length", "terms")
+
+    def __init__(self, result: SearchResult, terms: Counter[str]) -> None:
+        self.result = result
+        self.terms = terms
+        self.length = sum(terms.values())
+
+
+class SearchIndex:
+    """Incrementally maintained inverted index over titles and snippets.
+
+    Documents are grouped by the query they were stored under, so re-storing
+    the results of a query replaces its previous documents.
+
+    Args:
+        k1: BM25 term frequency saturation.
+        b: BM25 document length normalisation.
+    """
+
+    def __init__(self, *, k1: float = 1.5, b: float = 0.75) -> None:
+        self._k1 = k1
+        self._b = b
+        self._docs: Dict[int, _Document] = {}
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._by_query: Dict[str, List[int]] = {}
+        self._total_length = 0
+        self._next_id = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, query: str, entries: Iterable[Any]) -> None:
+        """Index ``entries`` (mappings or :class:`SearchResult`) stored under ``query``."""
+
+        with self._lock:
+            doc_ids = self._by_query.setdefault(query, [])
+            for entry in entries:
+                result = _as_result(entry)
+                terms = Counter(tokenize(f"{result.title} {result.snippet}"))
+                if not terms:
+                    continue
+                doc_id = self._next_id
+                self._next_id += 1
+                document = _Document(result, terms)
+                self._docs[doc_id] = document
+                self._total_length += document.length
+                for term, frequency in terms.items():
+                    self._postings.setdefault(term, {})[doc_id] = frequency
+                doc_ids.append(doc_id)
+
+    def remove(self, query: str) -> None:
+        """Drop every document stored under ``query``."""
+
+        with self._lock:
+            for doc_id in self._by_query.pop(query, ()):
+                document = self._docs.pop(doc_id)
+                self._total_length -= document.length
+                for term in document.terms:
+                    postings = self._postings[term]
+                    del postings[doc_id]
+                    if not postings:
+                        del self._postings[term]
+
+    def replace(self, query: str, entries: Iterable[Any]) -> None:
+        with self._lock:
+            self.remove(query)
+            self.add(query, entries)
+
+    def search(self, text: str, limit: int = 5) -> List[Tuple[float, SearchResult]]:
+        """Return up to ``limit`` ``(score, result)`` pairs ranked by BM25, one per URL."""
+
+        with self._lock:
+            count = len(self._docs)
+            if not count:
+                return []
+            average_length = self._total_length / count
+            scores: Dict[int, float] = {}
+            for term in set(tokenize(text)):
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, frequency in postings.items():
+                    length_norm = 1 - self._b + self._b * self._docs[doc_id].length / average_length
+                    gain = idf * frequency * (self._k1 + 1) / (frequency + self._k1 * length_norm)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + gain
+            ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+            hits: List[Tuple[float, SearchResult]] = []
+            seen: set[str] = set()
+            for doc_id, score in ranked:
+                result = self._docs[doc_id].result
+                key = normalize_url(result.url) if result.url else f"title:{result.title.casefold()}"
+                if key in seen:
+                    continue
+                seen.add(key)
+                hits.append((score, result))
+                if len(hits) >= limit:
+                    break
+            return hits
+
+
+def _as_result(entry: Any) -> SearchResult:
+    if isinstance(entry, SearchResult):
+        return entry
+    if isinstance(entry, Mapping):
+        return SearchResult(
+            title=str(entry.get("title", "")), url=str(entry.get("url", "")), snippet=str(entry.get("snippet", ""))
+        )
+    raise TypeError(f"Cannot index search result of type {type(entry).__name__}")
+
+
+class LocalSearchClient:
+    """Search client answering queries from a :class:`SearchIndex` without network access."""
+
+    def __init__(self, index: SearchIndex, *, min_score: float = 0.0) -> None:
+        self.index = index
+        self._min_score = min_score
+
+    def search(self, query: str, *, max_results: int = 5) -> Iterable[SearchResult]:
+        return [result for score, result in self.index.search(query, max_results) if score > self._min_score]
+
+
+__all__ = ["LocalSearchClient", "SearchIndex", "tokenize"]
@@ -0,0 +1,270 @@
+"""Long-lived, connection-pooled search provider clients."""
+
+from __future__ import annotations
+
+import http.client
+import json
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, Iterable, Iterator, List, Mapping, Optional, TypeVar
+from urllib.parse import urlencode, urlsplit
+
+from .search import SearchResult
+
+T = TypeVar("T")
+
+
+class SearchProviderError(RuntimeError):
+    """Raised when a search provider cannot answer a query."""
+
+
+class _RetryableError(SearchProviderError):
+    pass
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry configuration with exponential backoff.
+
+    Attributes:
+        attempts: Total number of attempts including the first one.
+        backoff_seconds: Delay before the first retry; doubled for every further retry.
+        max_backoff_seconds: Upper bound for a single delay.
+    """
+
+    attempts: int = 3
+    backoff_seconds: float = 0.2
+    max_backoff_seconds: float = 2.0
+
+    def delay(self, retry: int) -> float:
+        return min(self.max_backoff_seconds, self.backoff_seconds * (2**retry))
+
+
+class ResourcePool(Generic[T]):
+    """Bounded pool handing out reusable resources such as connections.
+
+    At most ``max_size`` resources exist at the same time; callers block until
+    one is free. Resources are created lazily by ``factory`` and destroyed by
+    ``closer`` when they are discarded after an error.
+    """
+
+    def __init__(self, factory: Callable[[], T], *, max_size: int, closer: Callable[[T], None] = lambda _: None) -> None:
+        self._factory = factory
+        self._closer = closer
+        self._idle: "queue.LifoQueue[T]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max(1, max_size))
+        self.created = 0
+
+    @contextmanager
+    def acquire(self) -> Iterator[T]:
+        self._slots.acquire()
+        try:
+            try:
+                resource = self._idle.get_nowait()
+            except queue.Empty:
+                resource = self._factory()
+                self.created += 1
+            try:
+                yield resource
+            except BaseException:
+                self._closer(resource)
+                raise
+            self._idle.put(resource)
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._closer(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+
+def _with_retries(policy: RetryPolicy, call: Callable[[], T]) -> T:
+    for attempt in range(max(1, policy.attempts)):
+        try:
+            return call()
+        except (_RetryableError, OSError, http.client.HTTPException) as exc:
+            if attempt + 1 >= policy.attempts:
+                raise SearchProviderError(f"Suchanbieter nicht erreichbar: {exc}") from exc
+            time.sleep(policy.delay(attempt))
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+class HttpSearchClient:
+    """Search client for JSON search endpoints reusing keep-alive connections.
+
+    The endpoint is called as ``GET {base_url}{path}?q=<query>&max_results=<n>``
+    and must answer with a JSON list of results (or an object with a
+    ``results`` list). Each result may use ``title``, ``url``/``href`` and
+    ``snippet``/``body`` keys. Connections are kept in a pool of at most
+    ``max_connections`` and are shared by every skill using the client.
+    Connection errors, 429 and 5xx responses are retried with backoff.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        path: str = "/search",
+        max_connections: int = 4,
+        timeout: float = 30.0,
+        retry: RetryPolicy = RetryPolicy(),
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        parts = urlsplit(base_url)
+        if parts.scheme not in {"http", "https"} or not parts.hostname:
+            raise ValueError(f"Ungültige Basis-URL für die Websuche: '{base_url}'")
+        self._https = parts.scheme == "https"
+        self._host = parts.hostname
+        self._port = parts.port
+        self._path = parts.path.rstrip("/") + path
+        self._timeout = timeout
+        self._retry = retry
+        self._headers = {"Accept": "application/json", "Connection": "keep-alive", **(headers or {})}
+        self._pool: ResourcePool[http.client.HTTPConnection] = ResourcePool(
+            self._connect, max_size=max_connections, closer=lambda conn: conn.close()
+        )
+
+    @property
+    def connections_created(self) -> int:
+        return self._pool.created
+
+    def search(self, query: str, *, max_results: int = 5) -> Iterable[SearchResult]:
+        target = f"{self._path}?{urlencode({'q': query, 'max_results': max_results})}"
+        payload = _with_retries(self._retry, lambda: self._get(target))
+        entries = payload.get("results", []) if isinstance(payload, dict) else payload
+        return [_to_result(entry) for entry in entries[:max_results]]
+
+    def warm_up(self) -> None:
+        """Open one pooled connection ahead of the first query."""
+
+        with self._pool.acquire() as conn:
+            conn.connect()
+
+    def close(self) -> None:
+        self._pool.close()
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self._https:
+            return http.client.HTTPSConnection(self._host, self._port, timeout=self._timeout)
+        return http.client.HTTPConnection(self._host, self._port, timeout=self._timeout)
+
+    def _get(self, target: str) -> Any:
+        with self._pool.acquire() as conn:
+            conn.request("GET", target, headers=self._headers)
+            response = conn.getresponse()
+            body = response.read()
+            if response.will_close:
+                conn.close()
+        if response.status == 429 or response.status >= 500:
+            raise _RetryableError(f"HTTP {response.status}")
+        if response.status >= 400:
+            raise SearchProviderError(f"Suchanbieter antwortete mit HTTP {response.status}")
+        return json.loads(body.decode("utf-8"))
+
+
+def _to_result(entry: Mapping[str, Any]) -> SearchResult:
+    return SearchResult(
+        title=str(entry.get("title", "")),
+        url=str(entry.get("url") or entry.get("href") or ""),
+        snippet=str(entry.get("snippet") or entry.get("body") or ""),
+    )
+
+
+def _load_ddgs() -> Callable[[], Any]:
+    try:
+        from ddgs import DDGS  # type: ignore
+    except ImportError:
+        try:
+            from duckduckgo_search import DDGS  # type: ignore
+        except ImportError as exc:  # pragma: no cover - exercised in integration usage only
+            raise RuntimeError(
+                "Die Standard-Websuche benötigt das Paket 'ddgs' (oder 'duckduckgo_search'). "
+                "Bitte installiere es oder übergib einen eigenen SearchClient."
+            ) from exc
+    return DDGS
+
+
+class DuckDuckGoSearchClient:
+    """DuckDuckGo client keeping a small pool of long-lived ``DDGS`` sessions.
+
+    Each ``DDGS`` instance holds its own HTTP session, so reusing them avoids a
+    new TLS handshake per query.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 4,
+        retry: RetryPolicy = RetryPolicy(),
+        factory: Callable[[], Any] | None = None,
+    ) -> None:
+        self._factory = factory or _load_ddgs()
+        self._retry = retry
+        self._pool: ResourcePool[Any] = ResourcePool(self._factory, max_size=max_connections, closer=_close_quietly)
+
+    def search(self, query: str, *, max_results: int = 5) -> Iterable[SearchResult]:
+        entries = _with_retries(self._retry, lambda: self._text(query, max_results))
+        return [_to_result(entry) for entry in entries]
+
+    def warm_up(self) -> None:
+        with self._pool.acquire():
+            pass
+
+    def close(self) -> None:
+        self._pool.close()
+
+    def _text(self, query: str, max_results: int) -> List[Dict[str, Any]]:
+        with self._pool.acquire() as client:
+            return list(client.text(query, max_results=max_results) or [])
+
+
+def _close_quietly(resource: Any) -> None:
+    exit_method = getattr(resource, "__exit__", None)
+    if exit_method is not None:
+        try:
+            exit_method(None, None, None)
+        except Exception:  # pragma: no cover - best effort cleanup
+            pass
+
+
+_default_client: Optional[DuckDuckGoSearchClient] = None
+_default_lock = threading.Lock()
+
+
+def default_search_client() -> DuckDuckGoSearchClient:
+    """Return the process-wide DuckDuckGo client shared by all skills."""
+
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = DuckDuckGoSearchClient()
+        return _default_client
+
+
+def http_client_from_settings(settings: Mapping[str, Any], name: str = "default", **kwargs: Any) -> HttpSearchClient:
+    """Create an :class:`HttpSearchClient` from ``connections.<name>`` in the settings."""
+
+    connection = (settings.get("connections") or {}).get(name) or {}
+    base_url = str(connection.get("base_url") or "")
+    options: Dict[str, Any] = {"timeout": float(connection.get("timeout_seconds", 30))}
+    if "max_connections" in connection:
+        options["max_connections"] = int(connection["max_connections"])
+    options.update(kwargs)
+    return HttpSearchClient(base_url, **options)
+
+
+__all__ = [
+    "DuckDuckGoSearchClient",
+    "HttpSearchClient",
+    "ResourcePool",
+    "RetryPolicy",
+    "SearchProviderError",
+    "default_search_client",
+    "http_client_from_settings",
+]
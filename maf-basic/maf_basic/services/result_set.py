@@ -0,0 +1,143 @@
+"""Compact, column-oriented storage representation for search results."""
+
+from __future__ import annotations
+
+import sys
+from typing import Any, Iterable, Iterator, List, Mapping, Sequence, Tuple, Union, overload
+
+from .search import SearchResult
+
+_FIELDS = ("title", "url", "snippet")
+
+
+class ResultView(Mapping[str, str]):
+    """Read-only, dict-compatible view of a single entry of a :class:`ResultSet`."""
+
+    __slots__ = ("_results", "_index")
+
+    def __init__(self, results: "ResultSet", index: int) -> None:
+        self._results = results
+        self._index = index
+
+    def __getitem__(self, key: str) -> str:
+        if key == "title":
+            return self._results._titles[self._index]
+        if key == "url":
+            return self._results._urls[self._index]
+        if key == "snippet":
+            return self._results._snippets[self._index]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_FIELDS)
+
+    def __len__(self) -> int:
+        return len(_FIELDS)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class ResultSet(Sequence[Mapping[str, str]]):
+    """Search results of one query stored as three parallel columns.
+
+    Compared to a list of dicts this needs one list per field instead of one
+    dict per hit, and URLs and titles are interned so repeated values across
+    queries share memory. Entries are exposed as :class:`ResultView` mappings,
+    so code reading ``entry.get("title")`` keeps working, and a result set
+    compares equal to the equivalent list of dicts.
+
+    Appending is safe next to lock-free readers, e.g. on a
+    :class:`~maf_basic.storage.concurrent.StripedInMemoryStorage`: a new row
+    becomes visible only once all three columns hold it. Concurrent appends
+    must still be serialised by the caller, as the storages do.
+    """
+
+    __slots__ = ("_titles", "_urls", "_snippets", "_size")
+
+    def __init__(self, results: Iterable[Union[SearchResult, Mapping[str, Any]]] = ()) -> None:
+        self._titles: List[str] = []
+        self._urls: List[str] = []
+        self._snippets: List[str] = []
+        # Number of complete rows; readers never look past it.
+        self._size = 0
+        self.extend(results)
+
+    def append(self, result: Union[SearchResult, Mapping[str, Any]]) -> None:
+        if isinstance(result, SearchResult):
+            title, url, snippet = result.title, result.url, result.snippet
+        else:
+            title = str(result.get("title", ""))
+            url = str(result.get("url", ""))
+            snippet = str(result.get("snippet", ""))
+        self._titles.append(sys.intern(title))
+        self._urls.append(sys.intern(url))
+        self._snippets.append(snippet)
+        self._size += 1
+
+    def extend(self, results: Iterable[Union[SearchResult, Mapping[str, Any]]]) -> None:
+        for result in results:
+            self.append(result)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @overload
+    def __getitem__(self, index: int) -> ResultView: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ResultSet": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[ResultView, "ResultSet"]:
+        if isinstance(index, slice):
+            rows = slice(*index.indices(self._size))
+            subset = ResultSet()
+            subset._titles = self._titles[rows]
+            subset._urls = self._urls[rows]
+            subset._snippets = self._snippets[rows]
+            subset._size = len(subset._titles)
+            return subset
+        position = range(self._size)[index]
+        return ResultView(self, position)
+
+    def __iter__(self) -> Iterator[ResultView]:
+        return (ResultView(self, index) for index in range(self._size))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ResultSet):
+            return self._columns() == other._columns()
+        if isinstance(other, Sequence) and not isinstance(other, (str, bytes)):
+            return self.as_dicts() == [dict(entry) if isinstance(entry, Mapping) else entry for entry in other]
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ResultSet({self.as_dicts()!r})"
+
+    def titles(self) -> Sequence[str]:
+        return self._titles[: self._size]
+
+    def urls(self) -> Sequence[str]:
+        return self._urls[: self._size]
+
+    def snippets(self) -> Sequence[str]:
+        return self._snippets[: self._size]
+
+    def as_dicts(self) -> List[dict[str, str]]:
+        """Return the entries as a list of plain dicts, e.g. for serialisation."""
+
+        return [
+            {"title": title, "url": url, "snippet": snippet} for title, url, snippet in zip(*self._columns())
+        ]
+
+    def results(self) -> Iterator[SearchResult]:
+        for title, url, snippet in zip(*self._columns()):
+            yield SearchResult(title=title, url=url, snippet=snippet)
+
+    def _columns(self) -> Tuple[List[str], List[str], List[str]]:
+        size = self._size
+        return self._titles[:size], self._urls[:size], self._snippets[:size]
+
+
+__all__ = ["ResultSet", "ResultView"]
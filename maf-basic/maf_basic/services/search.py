@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Protocol
+from typing import Iterable, Protocol, Sequence
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SearchResult:
     """Container describing a single search result entry."""
 
@@ -27,5 +27,12 @@ class SearchClient(Protocol):
         """Return an iterable of :class:`SearchResult` objects."""
 
 
-__all__ = ["SearchResult", "SearchClient"]
+class AsyncSearchClient(SearchClient, Protocol):
+    """Search client that additionally offers a native coroutine API."""
+
+    async def asearch(self, query: str, *, max_results: int = 5) -> Sequence[SearchResult]:
+        """Return the search results for ``query`` without blocking the event loop."""
+
+
+__all__ = ["SearchResult", "SearchClient", "AsyncSearchClient"]
 
@@ -0,0 +1,193 @@
+"""Model-backed summarisation with request batching and a response cache."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Mapping, Protocol, Sequence, Tuple
+
+from .cache import CacheStats
+
+SummaryItem = Tuple[str, Sequence[Mapping[str, str]]]
+
+
+class LanguageModel(Protocol):
+    """Protocol that needs to be implemented by text generation models."""
+
+    def complete_batch(self, prompts: Sequence[str]) -> List[str]:
+        """Return one completion per prompt, in the same order."""
+
+
+class Summarizer(Protocol):
+    """Protocol for components turning search results into summary lines."""
+
+    def summarize(self, topic: str, results: Sequence[Mapping[str, str]]) -> List[str]:
+        """Return the summary lines for a single topic."""
+
+    def summarize_many(self, items: Sequence[SummaryItem]) -> List[List[str]]:
+        """Return the summary lines for several topics, in input order."""
+
+
+_RESULT_LINE = re.compile(r"^\d+\. (?P<title>.*?): (?P<snippet>.*)$")
+
+
+class LocalModel:
+    """Deterministic offline stand-in for a language model.
+
+    It condenses each numbered result of a summary prompt to its title and
+    first sentence. ``latency_seconds`` simulates the time of a model call,
+    and every call is recorded in ``batch_sizes``.
+    """
+
+    def __init__(self, *, latency_seconds: float = 0.0) -> None:
+        self._latency = latency_seconds
+        self._lock = threading.Lock()
+        self.batch_sizes: List[int] = []
+
+    def complete_batch(self, prompts: Sequence[str]) -> List[str]:
+        with self._lock:
+            self.batch_sizes.append(len(prompts))
+        if self._latency:
+            time.sleep(self._latency)
+        return [self._complete(prompt) for prompt in prompts]
+
+    @staticmethod
+    def _complete(prompt: str) -> str:
+        points = []
+        for line in prompt.splitlines():
+            match = _RESULT_LINE.match(line.strip())
+            if match is None:
+                continue
+            sentence = match.group("snippet").split(". ")[0].strip().rstrip(".")
+            points.append(f"{match.group('title')}: {sentence}." if sentence else match.group("title"))
+        return "\n".join(points) or "Keine Ergebnisse zum Zusammenfassen vorhanden."
+
+
+class ModelSummarizer:
+    """Summariser delegating to a :class:`LanguageModel`.
+
+    Prompts of several topics are sent to the model in batches of up to
+    ``batch_size`` prompts per call, at most ``max_in_flight`` model calls run
+    at the same time (across all callers), and responses are cached in an LRU
+    of ``cache_size`` entries keyed on the SHA-256 of the prompt.
+    """
+
+    def __init__(
+        self,
+        model: LanguageModel,
+        *,
+        batch_size: int = 8,
+        max_in_flight: int = 2,
+        cache_size: int = 1024,
+    ) -> None:
+        self._model = model
+        self._batch_size = max(1, batch_size)
+        self._max_in_flight = max(1, max_in_flight)
+        self._in_flight = threading.BoundedSemaphore(self._max_in_flight)
+        self._cache_size = max(1, cache_size)
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    def summarize(self, topic: str, results: Sequence[Mapping[str, str]]) -> List[str]:
+        return self.summarize_many([(topic, results)])[0]
+
+    def summarize_many(self, items: Sequence[SummaryItem]) -> List[List[str]]:
+        prompts = [self.build_prompt(topic, results) for topic, results in items]
+        keys = [hashlib.sha256(prompt.encode("utf-8")).hexdigest() for prompt in prompts]
+        responses: Dict[str, str] = {}
+        missing: Dict[str, str] = {}
+        with self._lock:
+            for key, prompt in zip(keys, prompts):
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    self.stats.hits += 1
+                    responses[key] = cached
+                elif key not in missing:
+                    self.stats.misses += 1
+                    missing[key] = prompt
+
+        if missing:
+            responses.update(self._complete(missing))
+        return [self._to_lines(topic, responses[key]) for (topic, _), key in zip(items, keys)]
+
+    def build_prompt(self, topic: str, results: Sequence[Mapping[str, str]]) -> str:
+        lines = [
+            f"Fasse die folgenden Suchergebnisse zum Thema '{topic}' in kurzen Stichpunkten "
+            "für das Management zusammen.",
+            "Ergebnisse:",
+        ]
+        for index, entry in enumerate(results, start=1):
+            title = entry.get("title", "") or "Eintrag ohne Titel"
+            snippet = " ".join(entry.get("snippet", "").split())
+            lines.append(f"{index}. {title}: {snippet}")
+        return "\n".join(lines)
+
+    def _complete(self, prompts: Dict[str, str]) -> Dict[str, str]:
+        keys = list(prompts)
+        batches = [keys[start : start + self._batch_size] for start in range(0, len(keys), self._batch_size)]
+        if len(batches) == 1:
+            completed = [self._call(batches[0], prompts)]
+        else:
+            workers = min(self._max_in_flight, len(batches))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="maf-model") as pool:
+                completed = list(pool.map(lambda batch: self._call(batch, prompts), batches))
+
+        responses: Dict[str, str] = {}
+        with self._lock:
+            for batch_responses in completed:
+                for key, response in batch_responses:
+                    responses[key] = response
+                    self._cache[key] = response
+                    self._cache.move_to_end(key)
+                    while len(self._cache) > self._cache_size:
+                        self._cache.popitem(last=False)
+                        self.stats.evictions += 1
+        return responses
+
+    def _call(self, batch: List[str], prompts: Dict[str, str]) -> List[Tuple[str, str]]:
+        with self._in_flight:
+            outputs = self._model.complete_batch([prompts[key] for key in batch])
+        if len(outputs) != len(batch):
+            raise RuntimeError(f"Model returned {len(outputs)} completions for {len(batch)} prompts")
+        return list(zip(batch, outputs))
+
+    @staticmethod
+    def _to_lines(topic: str, response: str) -> List[str]:
+        lines = [f"Management Summary zu '{topic}':"]
+        for line in response.splitlines():
+            point = line.strip().lstrip("-•*").strip()
+            if point:
+                lines.append(f"- {point}")
+        return lines
+
+
+def summarizer_from_settings(settings: Mapping[str, Any], name: str = "primary", **kwargs: Any) -> ModelSummarizer:
+    """Create a :class:`ModelSummarizer` for ``models.<name>`` of the settings.
+
+    Only the ``local`` provider ships with the package; other providers must be
+    wrapped in a :class:`LanguageModel` and passed to :class:`ModelSummarizer`.
+    """
+
+    model_settings = (settings.get("models") or {}).get(name) or {}
+    provider = str(model_settings.get("provider", "local")).lower()
+    if provider == "local":
+        return ModelSummarizer(LocalModel(), **kwargs)
+    raise ValueError(
+        f"Model provider '{provider}' is not bundled; wrap your client in a LanguageModel "
+        "and pass it to ModelSummarizer."
+    )
+
+
+__all__ = [
+    "LanguageModel",
+    "LocalModel",
+    "ModelSummarizer",
+    "Summarizer",
+    "summarizer_from_settings",
+]
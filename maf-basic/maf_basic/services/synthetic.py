@@ -0,0 +1,76 @@
+"""Synthetic search client with configurable latency, for benchmarks and load tests."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from typing import List
+
+from .providers import SearchProviderError
+from .search import SearchResult
+
+
+class SyntheticSearchClient:
+    """Search client returning generated results after an injected delay.
+
+    Every call sleeps for ``latency_seconds`` plus a uniformly distributed
+    ``jitter_seconds`` and fails with :class:`SearchProviderError` with
+    probability ``failure_rate``. Results only depend on the query, so
+    repeated queries produce identical results. ``asearch`` sleeps on the
+    event loop instead of blocking a thread.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency_seconds: float = 0.0,
+        jitter_seconds: float = 0.0,
+        failure_rate: float = 0.0,
+        snippet_sentences: int = 10,
+        seed: int | None = None,
+    ) -> None:
+        self._latency = latency_seconds
+        self._jitter = jitter_seconds
+        self._failure_rate = failure_rate
+        self._snippet_sentences = snippet_sentences
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def search(self, query: str, *, max_results: int = 5) -> List[SearchResult]:
+        delay = self._next_delay()
+        if delay:
+            time.sleep(delay)
+        return self._results(query, max_results)
+
+    async def asearch(self, query: str, *, max_results: int = 5) -> List[SearchResult]:
+        delay = self._next_delay()
+        if delay:
+            await asyncio.sleep(delay)
+        return self._results(query, max_results)
+
+    def _next_delay(self) -> float:
+        with self._lock:
+            self.calls += 1
+            failed = self._failure_rate and self._random.random() < self._failure_rate
+            jitter = self._random.uniform(0.0, self._jitter) if self._jitter else 0.0
+        if failed:
+            raise SearchProviderError("Synthetic search failure")
+        return self._latency + jitter
+
+    def _results(self, query: str, max_results: int) -> List[SearchResult]:
+        slug = "-".join(query.lower().split()) or "query"
+        snippet = " ".join(f"{query} detail {index}." for index in range(self._snippet_sentences))
+        return [
+            SearchResult(
+                title=f"{query} – Ergebnis {rank}",
+                url=f"https://synthetic.example/{slug}/{rank}",
+                snippet=snippet,
+            )
+            for rank in range(1, max_results + 1)
+        ]
+
+
+__all__ = ["SyntheticSearchClient"]
@@ -1,9 +1,27 @@
-"""Skill implementations bundled with the demo app."""
+"""Skill implementations bundled with the demo app.
+
+Skills are imported on first access, so importing one skill does not load
+the dependencies of the others.
+"""
 
 from __future__ import annotations
 
-from .echo import EchoSkill
-from .management_summary import ManagementSummarySkill
-from .web_search import WebSearchSkill
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .echo import EchoSkill
+    from .management_summary import ManagementSummarySkill
+    from .web_search import WebSearchSkill
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "EchoSkill": ".echo",
+        "ManagementSummarySkill": ".management_summary",
+        "WebSearchSkill": ".web_search",
+    },
+)
 
 __all__ = ["EchoSkill", "WebSearchSkill", "ManagementSummarySkill"]
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, AsyncIterator, Iterator
 
 from ..storage.base import BaseStorage
 
@@ -22,6 +24,28 @@ class SkillMetadata:
     description: str
 
 
+class SkillResponse(str):
+    """Text response of a skill carrying the structured data it was built from.
+
+    The instance is the response text and can be used wherever a string is
+    expected. Pipelines hand it unchanged to downstream stages, which read
+    :attr:`data` instead of parsing the text or loading the data from storage.
+    """
+
+    data: Any
+
+    def __new__(cls, text: str, data: Any = None) -> "SkillResponse":
+        response = super().__new__(cls, text)
+        response.data = data
+        return response
+
+    def __reduce__(self) -> Any:
+        return type(self), (str(self), self.data)
+
+
+_END_OF_STREAM: Any = object()
+
+
 class BaseSkill(ABC):
     """Base class for skills used by the demo agent app."""
 
@@ -34,9 +58,80 @@ class BaseSkill(ABC):
 
         return self._metadata
 
+    @property
+    def is_async(self) -> bool:
+        """Return ``True`` if the skill provides a native :meth:`ahandle`."""
+
+        return type(self).ahandle is not BaseSkill.ahandle
+
     @abstractmethod
     def handle(self, message: str, storage: BaseStorage, **kwargs: Any) -> str:
         """Process an incoming message and return a response."""
 
+    def warm_up(self) -> None:
+        """Resolve providers and open connections ahead of the first message.
+
+        Called by :meth:`maf_basic.app.AgentApp.warm_up`. The default does nothing.
+        """
+
+    async def ahandle(self, message: str, storage: BaseStorage, **kwargs: Any) -> str:
+        """Asynchronously process a message.
+
+        The default implementation runs :meth:`handle` in a worker thread so
+        legacy skills never block the event loop. Skills doing native async I/O
+        should override this method.
+        """
+
+        return await asyncio.to_thread(self.handle, message, storage, **kwargs)
+
+    def handle_stream(self, message: str, storage: BaseStorage, **kwargs: Any) -> Iterator[str]:
+        """Process a message and yield the response line by line as it becomes available.
+
+        The default implementation yields the complete response of :meth:`handle`.
+        """
+
+        yield self.handle(message, storage, **kwargs)
+
+    async def astream(self, message: str, storage: BaseStorage, **kwargs: Any) -> AsyncIterator[str]:
+        """Asynchronous variant of :meth:`handle_stream`.
+
+        Native async skills yield the response of :meth:`ahandle`; other skills
+        advance :meth:`handle_stream` in a worker thread, one line at a time.
+        """
+
+        if self.is_async:
+            yield await self.ahandle(message, storage, **kwargs)
+            return
+        lines = self.handle_stream(message, storage, **kwargs)
+        while True:
+            line = await asyncio.to_thread(next, lines, _END_OF_STREAM)
+            if line is _END_OF_STREAM:
+                return
+            yield line
+
+
+class AsyncSkill(BaseSkill):
+    """Base class for skills that are implemented natively with ``async``."""
+
+    @abstractmethod
+    async def ahandle(self, message: str, storage: BaseStorage, **kwargs: Any) -> str:
+        """Asynchronously process an incoming message and return a response."""
+
+    def handle(self, message: str, storage: BaseStorage, **kwargs: Any) -> str:
+        """Run :meth:`ahandle` to completion for synchronous callers.
+
+        Synchronous code called from a coroutine cannot start a second event
+        loop in the same thread, so in that case :meth:`ahandle` runs on its
+        own loop in a worker thread. The calling loop is blocked meanwhile;
+        coroutines should use :meth:`~maf_basic.app.AgentApp.ainvoke` instead.
+        """
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.ahandle(message, storage, **kwargs))
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="maf-async-skill") as executor:
+            return executor.submit(lambda: asyncio.run(self.ahandle(message, storage, **kwargs))).result()
+
 
-__all__ = ["SkillMetadata", "BaseSkill"]
+__all__ = ["SkillMetadata", "SkillResponse", "BaseSkill", "AsyncSkill"]
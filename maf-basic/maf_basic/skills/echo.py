@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Optional
 
 from .base import BaseSkill, SkillMetadata
 from ..storage.base import BaseStorage
@@ -25,16 +25,18 @@ class EchoSkill(BaseSkill):
         super().__init__(metadata or _default_metadata())
 
     def handle(self, message: str, storage: BaseStorage, **_: Any) -> str:
-        history = storage.get(self.HISTORY_NAMESPACE, self.HISTORY_KEY)
-        if history is None:
-            history = []
-        history.append(message)
-        storage.set(self.HISTORY_NAMESPACE, self.HISTORY_KEY, history)
+        storage.append(self.HISTORY_NAMESPACE, self.HISTORY_KEY, message)
         return message
 
-    def conversation_history(self, storage: BaseStorage) -> list[str]:
-        history = storage.get(self.HISTORY_NAMESPACE, self.HISTORY_KEY)
-        return list(history or [])
+    def conversation_history(
+        self, storage: BaseStorage, start: int = 0, stop: Optional[int] = None
+    ) -> list[str]:
+        """Return the stored messages, optionally limited to ``[start:stop]``."""
+
+        return storage.read_range(self.HISTORY_NAMESPACE, self.HISTORY_KEY, start, stop)
+
+    def history_length(self, storage: BaseStorage) -> int:
+        return storage.length(self.HISTORY_NAMESPACE, self.HISTORY_KEY)
 
 
 __all__ = ["EchoSkill"]
@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import hashlib
+import threading
+import time
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Optional, Tuple
 
 from .base import BaseSkill, SkillMetadata
 from .web_search import WebSearchSkill
-from ..storage.base import BaseStorage
+from ..services.providers import SearchProviderError
+from ..services.result_set import ResultSet
+from ..services.search import SearchClient
+from ..services.summarizer import Summarizer
+from ..storage.base import BaseStorage, is_dunder_key
 
 
 def _default_metadata() -> SkillMetadata:
@@ -16,16 +26,107 @@ def _default_metadata() -> SkillMetadata:
     )
 
 
+def result_fingerprint(entry: Mapping[str, str]) -> str:
+    """Return a short content hash of a stored search result."""
+
+    payload = "\0".join((entry.get("title", ""), entry.get("url", ""), entry.get("snippet", "")))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+
+@dataclass
+class SummaryCacheStats:
+    """Counters describing how summaries were produced."""
+
+    hits: int = 0
+    incremental: int = 0
+    rebuilds: int = 0
+
+
+@dataclass
+class TopicSummary:
+    """Outcome of summarising a single topic in a batch.
+
+    Attributes:
+        topic: The summarised topic.
+        lines: Summary lines, empty if no results were stored for the topic.
+        status: ``"hit"``, ``"incremental"``, ``"rebuild"`` or ``"missing"``.
+        seconds: Time spent building the summary.
+    """
+
+    topic: str
+    lines: list[str]
+    status: str
+    seconds: float
+
+
+@dataclass
+class SummaryBatchReport:
+    """Result of :meth:`ManagementSummarySkill.summarize_many`."""
+
+    topics: list[TopicSummary] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    def by_topic(self) -> dict[str, TopicSummary]:
+        return {entry.topic: entry for entry in self.topics}
+
+    def slowest(self, count: int = 5) -> list[TopicSummary]:
+        return sorted(self.topics, key=lambda entry: entry.seconds, reverse=True)[:count]
+
+
 class ManagementSummarySkill(BaseSkill):
-    """Generate a short textual summary based on previously stored search results."""
+    """Generate a short textual summary based on previously stored search results.
+
+    If no results are stored for a topic and a ``fallback_client`` is given
+    (typically a :class:`~maf_basic.services.local_index.LocalSearchClient`),
+    the summary is built from the results it returns instead, e.g. from past
+    searches on related topics.
+
+    Summaries are cached in storage together with the fingerprints of the
+    results they were built from. If the summarised results are unchanged the
+    stored summary is returned as is; if results were only appended, just the
+    lines for the new results are added. Any storage write that changes the
+    summarised results therefore invalidates the cached summary.
+
+    By default each summary line is a shortened result snippet. With a
+    ``summarizer`` (e.g. a :class:`~maf_basic.services.summarizer.ModelSummarizer`)
+    the lines are generated by a language model instead; summaries are then
+    always rebuilt as a whole when the results change.
+
+    Inside a pipeline the results are taken from the ``inputs`` of the stage,
+    i.e. the :class:`~maf_basic.skills.base.SkillResponse` of an upstream
+    :class:`~maf_basic.skills.web_search.WebSearchSkill` stage, instead of
+    being read back from storage.
+    """
 
     STORAGE_NAMESPACE = "management_summary"
+    FINGERPRINT_NAMESPACE = "management_summary_fingerprints"
 
-    def __init__(self, metadata: SkillMetadata | None = None, *, max_items: int = 3) -> None:
+    def __init__(
+        self,
+        metadata: SkillMetadata | None = None,
+        *,
+        max_items: int = 3,
+        fallback_client: SearchClient | None = None,
+        summarizer: Summarizer | None = None,
+    ) -> None:
         super().__init__(metadata or _default_metadata())
         self._max_items = max(1, max_items)
+        self._fallback_client = fallback_client
+        self._summarizer = summarizer
+        self.cache_stats = SummaryCacheStats()
+        self._stats_lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_stats_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._stats_lock = threading.Lock()
 
-    def handle(self, message: str, storage: BaseStorage, **_: object) -> str:
+    def handle(self, message: str, storage: BaseStorage, **kwargs: object) -> str:
+        upstream_results = self._results_from_inputs(kwargs.get("inputs"))
         topic = message.strip()
         if not topic:
             topic = storage.get(WebSearchSkill.STORAGE_NAMESPACE, WebSearchSkill.LAST_QUERY_KEY) or ""
@@ -33,29 +134,208 @@ class ManagementSummarySkill(BaseSkill):
         if not topic:
             return "Keine Suchanfrage gefunden. Bitte starte zuerst eine Websuche."
 
-        raw_results = storage.get(WebSearchSkill.STORAGE_NAMESPACE, topic)
+        if upstream_results is not None:
+            raw_results = upstream_results
+        else:
+            raw_results = storage.get(WebSearchSkill.STORAGE_NAMESPACE, topic)
+        if not raw_results and self._fallback_client is not None:
+            try:
+                raw_results = [
+                    result.as_dict() for result in self._fallback_client.search(topic, max_results=self._max_items)
+                ]
+            except SearchProviderError:
+                raw_results = []
         if not raw_results:
             return (
                 f"Keine gespeicherten Suchergebnisse für '{topic}' gefunden. "
                 "Führe zunächst die WebSearchSkill aus."
             )
 
-        summary = self._build_summary(topic, raw_results[: self._max_items])
-        storage.set(self.STORAGE_NAMESPACE, topic, summary)
-        return "\n".join(summary)
+        return "\n".join(self._summarize(topic, raw_results[: self._max_items], storage))
 
-    def _build_summary(self, topic: str, results: Sequence[dict[str, str]]) -> list[str]:
+    @staticmethod
+    def _results_from_inputs(inputs: object) -> Optional[ResultSet]:
+        """Return the search results passed in by an upstream pipeline stage, if any."""
+
+        if not isinstance(inputs, Mapping):
+            return None
+        for output in inputs.values():
+            data = getattr(output, "data", None)
+            if isinstance(data, ResultSet):
+                return data
+        return None
+
+    def summarize_many(
+        self,
+        storage: BaseStorage,
+        topics: Optional[Iterable[str]] = None,
+        *,
+        max_workers: int = 4,
+    ) -> SummaryBatchReport:
+        """Summarise many topics in one pass and store all summaries in one batched write.
+
+        With ``topics=None`` every topic stored in the ``web_search`` namespace
+        is summarised. The topics are taken from a snapshot of the namespace's
+        keys, so searches stored while the batch runs do not disturb it.
+        Summaries are built on a pool of ``max_workers`` threads; cached
+        summaries are reused exactly as in :meth:`handle`. With a summariser all
+        outdated topics are passed to it in one call so it can batch the model
+        requests; their timing is the amortised share of that call. Topics
+        without stored results are reported with status ``"missing"``.
+        """
+
+        started = time.perf_counter()
+        summaries = self.cached_summaries(storage)
+        fingerprints = storage.namespace_view(self.FINGERPRINT_NAMESPACE)
+        report = SummaryBatchReport()
+        futures: list[Tuple[str, Any, Future[Tuple[Optional[list[str]], list[str], str, float]]]] = []
+        defer_build = self._summarizer is not None
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="maf-summary") as pool:
+            for topic, results in self._iter_topic_results(storage, topics):
+                if not results:
+                    report.topics.append(TopicSummary(topic=topic, lines=[], status="missing", seconds=0.0))
+                    continue
+                considered = results[: self._max_items]
+                future = pool.submit(
+                    self._timed_compute,
+                    topic,
+                    considered,
+                    summaries.get(topic),
+                    fingerprints.get(topic),
+                    defer_build,
+                )
+                futures.append((topic, considered, future))
+
+            new_summaries: dict[str, list[str]] = {}
+            new_fingerprints: dict[str, list[str]] = {}
+            deferred: list[Tuple[TopicSummary, Any]] = []
+            for topic, considered, future in futures:
+                lines, topic_fingerprints, status, seconds = future.result()
+                entry = TopicSummary(topic=topic, lines=lines or [], status=status, seconds=seconds)
+                report.topics.append(entry)
+                if status != "hit":
+                    new_fingerprints[topic] = topic_fingerprints
+                if lines is None:
+                    deferred.append((entry, considered))
+                elif status != "hit":
+                    new_summaries[topic] = lines
+
+        if deferred and self._summarizer is not None:
+            build_started = time.perf_counter()
+            built = self._summarizer.summarize_many([(entry.topic, considered) for entry, considered in deferred])
+            share = (time.perf_counter() - build_started) / len(deferred)
+            for (entry, _), lines in zip(deferred, built):
+                entry.lines = lines
+                entry.seconds += share
+                new_summaries[entry.topic] = lines
+
+        if new_summaries:
+            storage.set_batch({self.STORAGE_NAMESPACE: new_summaries, self.FINGERPRINT_NAMESPACE: new_fingerprints})
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
+
+    def cached_summaries(self, storage: BaseStorage) -> Mapping[str, list[str]]:
+        """Return a read-only view of all stored summaries keyed by topic."""
+
+        return storage.namespace_view(self.STORAGE_NAMESPACE)
+
+    def _iter_topic_results(
+        self, storage: BaseStorage, topics: Optional[Iterable[str]]
+    ) -> Iterator[Tuple[str, Any]]:
+        if topics is None:
+            view = storage.namespace_view(WebSearchSkill.STORAGE_NAMESPACE)
+            for topic in list(view):
+                if not is_dunder_key(topic):
+                    yield topic, view.get(topic)
+            return
+        for topic in topics:
+            yield topic, storage.get(WebSearchSkill.STORAGE_NAMESPACE, topic)
+
+    def _summarize(self, topic: str, results: Sequence[Mapping[str, str]], storage: BaseStorage) -> list[str]:
+        summary, fingerprints, status = self._compute(
+            topic,
+            results,
+            storage.get(self.STORAGE_NAMESPACE, topic),
+            storage.get(self.FINGERPRINT_NAMESPACE, topic),
+        )
+        if status != "hit":
+            storage.set_batch(
+                {self.STORAGE_NAMESPACE: {topic: summary}, self.FINGERPRINT_NAMESPACE: {topic: fingerprints}}
+            )
+        return summary
+
+    def _timed_compute(
+        self,
+        topic: str,
+        results: Sequence[Mapping[str, str]],
+        cached_summary: Optional[list[str]],
+        cached_fingerprints: Optional[list[str]],
+        defer_build: bool = False,
+    ) -> Tuple[Optional[list[str]], list[str], str, float]:
+        started = time.perf_counter()
+        summary, fingerprints, status = self._compute(
+            topic, results, cached_summary, cached_fingerprints, defer_build=defer_build
+        )
+        return summary, fingerprints, status, time.perf_counter() - started
+
+    def _compute(
+        self,
+        topic: str,
+        results: Sequence[Mapping[str, str]],
+        cached_summary: Optional[list[str]],
+        cached_fingerprints: Optional[list[str]],
+        *,
+        defer_build: bool = False,
+    ) -> Tuple[Optional[list[str]], list[str], str]:
+        """Return ``(summary, fingerprints, status)`` for ``results``.
+
+        The summary is ``None`` if it must be rebuilt and ``defer_build`` is set.
+        """
+
+        fingerprints = [result_fingerprint(entry) for entry in results]
+        summary: Optional[list[str]]
+
+        if cached_summary is not None and cached_fingerprints == fingerprints:
+            status = "hit"
+            summary = list(cached_summary)
+        else:
+            known = len(cached_fingerprints or ())
+            appended_only = 0 < known < len(fingerprints) and fingerprints[:known] == cached_fingerprints
+            if cached_summary is not None and appended_only and self._summarizer is None:
+                status = "incremental"
+                summary = list(cached_summary)
+                summary.extend(self._summary_line(entry) for entry in results[known:])
+            else:
+                status = "rebuild"
+                summary = None if defer_build else self._build_summary(topic, results)
+
+        with self._stats_lock:
+            if status == "hit":
+                self.cache_stats.hits += 1
+            elif status == "incremental":
+                self.cache_stats.incremental += 1
+            else:
+                self.cache_stats.rebuilds += 1
+        return summary, fingerprints, status
+
+    def _build_summary(self, topic: str, results: Sequence[Mapping[str, str]]) -> list[str]:
+        if self._summarizer is not None:
+            return self._summarizer.summarize(topic, results)
         lines = [f"Management Summary zu '{topic}':"]
-        for entry in results:
-            title = entry.get("title", "Eintrag ohne Titel")
-            snippet = entry.get("snippet", "").strip() or "Keine Beschreibung verfügbar."
-            if len(snippet) > 160:
-                snippet = f"{snippet[:157]}..."
-            lines.append(f"- {title}: {snippet}")
+        lines.extend(self._summary_line(entry) for entry in results)
         if len(results) == 0:
             lines.append("- Keine Ergebnisse zum Zusammenfassen vorhanden.")
         return lines
 
+    @staticmethod
+    def _summary_line(entry: Mapping[str, str]) -> str:
+        title = entry.get("title", "Eintrag ohne Titel")
+        snippet = entry.get("snippet", "").strip() or "Keine Beschreibung verfügbar."
+        if len(snippet) > 160:
+            snippet = f"{snippet[:157]}..."
+        return f"- {title}: {snippet}"
+
 
-__all__ = ["ManagementSummarySkill"]
+__all__ = ["ManagementSummarySkill", "SummaryBatchReport", "TopicSummary"]
 
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable
+from typing import AsyncIterator, Iterable, Iterator, Mapping
 
-from .base import BaseSkill, SkillMetadata
+from .base import BaseSkill, SkillMetadata, SkillResponse
+from ..services.providers import SearchProviderError, default_search_client
+from ..services.result_set import ResultSet
 from ..services.search import SearchClient, SearchResult
 from ..storage.base import BaseStorage
 
@@ -17,22 +18,14 @@ def _default_metadata() -> SkillMetadata:
     )
 
 
-@dataclass
-class _StoredResult:
-    title: str
-    url: str
-    snippet: str
-
-    @classmethod
-    def from_search_result(cls, result: SearchResult) -> "_StoredResult":
-        return cls(title=result.title, url=result.url, snippet=result.snippet)
-
-    def to_dict(self) -> dict[str, str]:
-        return {"title": self.title, "url": self.url, "snippet": self.snippet}
-
-
 class WebSearchSkill(BaseSkill):
-    """Skill that performs a web search using a configurable search client."""
+    """Skill that performs a web search using a configurable search client.
+
+    :meth:`handle` returns a :class:`~maf_basic.skills.base.SkillResponse`
+    whose ``data`` is the :class:`~maf_basic.services.result_set.ResultSet` of
+    the query, so pipeline stages can consume the results without reading them
+    back from storage.
+    """
 
     STORAGE_NAMESPACE = "web_search"
     LAST_QUERY_KEY = "__last_query__"
@@ -49,31 +42,18 @@ class WebSearchSkill(BaseSkill):
         self._max_results = max(1, max_results)
 
     def _resolve_client(self) -> SearchClient:
-        if self._search_client is not None:
-            return self._search_client
-
-        try:
-            from duckduckgo_search import DDGS  # type: ignore
-        except ImportError as exc:  # pragma: no cover - exercised in integration usage only
-            raise RuntimeError(
-                "Die Standard-Websuche benötigt das Paket 'duckduckgo_search'. "
-                "Bitte installiere es oder übergib einen eigenen SearchClient."
-            ) from exc
-
-        class _DuckDuckGoClient:
-            def search(self, query: str, *, max_results: int = 5) -> Iterable[SearchResult]:
-                with DDGS() as search:
-                    results = search.text(query, max_results=max_results)
-                for entry in results:
-                    yield SearchResult(
-                        title=entry.get("title", ""),
-                        url=entry.get("href", ""),
-                        snippet=entry.get("body", ""),
-                    )
-
-        self._search_client = _DuckDuckGoClient()
+        if self._search_client is None:
+            self._search_client = default_search_client()
         return self._search_client
 
+    def warm_up(self) -> None:
+        """Resolve the search client and let it open its connections."""
+
+        client = self._resolve_client()
+        warm_up = getattr(client, "warm_up", None)
+        if callable(warm_up):
+            warm_up()
+
     def handle(self, message: str, storage: BaseStorage, **_: object) -> str:
         query = message.strip()
         if not query:
@@ -83,31 +63,107 @@ class WebSearchSkill(BaseSkill):
             client = self._resolve_client()
         except RuntimeError as exc:
             return str(exc)
-        results = list(client.search(query, max_results=self._max_results))
-        stored_results = [
-            _StoredResult.from_search_result(result).to_dict() for result in results if result.title or result.url
-        ]
+        try:
+            results = list(client.search(query, max_results=self._max_results))
+        except SearchProviderError as exc:
+            return str(exc)
+        return self._store_results(query, results, storage)
+
+    @property
+    def is_async(self) -> bool:
+        return callable(getattr(self._search_client, "asearch", None))
+
+    async def ahandle(self, message: str, storage: BaseStorage, **kwargs: object) -> str:
+        query = message.strip()
+        asearch = getattr(self._search_client, "asearch", None)
+        if not query or asearch is None:
+            return await super().ahandle(message, storage, **kwargs)
+        try:
+            results = await asearch(query, max_results=self._max_results)
+        except SearchProviderError as exc:
+            return str(exc)
+        return self._store_results(query, results, storage)
+
+    def handle_stream(self, message: str, storage: BaseStorage, **_: object) -> Iterator[str]:
+        """Yield formatted result lines as soon as the search client produces them.
+
+        Each result is appended to the stored result list when it arrives, so
+        the stored list always mirrors what has been shown to the user.
+        """
+
+        query = message.strip()
+        if not query:
+            yield "Bitte gib ein Suchthema an, um eine Websuche zu starten."
+            return
+
+        try:
+            client = self._resolve_client()
+        except RuntimeError as exc:
+            yield str(exc)
+            return
+        try:
+            yield from self._stream_results(query, client.search(query, max_results=self._max_results), storage)
+        except SearchProviderError as exc:
+            yield str(exc)
+
+    async def astream(self, message: str, storage: BaseStorage, **kwargs: object) -> AsyncIterator[str]:
+        query = message.strip()
+        asearch = getattr(self._search_client, "asearch", None)
+        if not query or asearch is None:
+            async for line in super().astream(message, storage, **kwargs):
+                yield line
+            return
+        try:
+            results = await asearch(query, max_results=self._max_results)
+        except SearchProviderError as exc:
+            yield str(exc)
+            return
+        for line in self._stream_results(query, results, storage):
+            yield line
+
+    def _stream_results(self, query: str, results: Iterable[SearchResult], storage: BaseStorage) -> Iterator[str]:
+        storage.set(self.STORAGE_NAMESPACE, query, ResultSet())
+        found = False
+        for result in results:
+            if not (result.title or result.url):
+                continue
+            entry = result.as_dict()
+            storage.append(self.STORAGE_NAMESPACE, query, entry)
+            if not found:
+                found = True
+                yield f"Suchergebnisse für '{query}':"
+            yield self._format_line(entry)
+        storage.set(self.STORAGE_NAMESPACE, self.LAST_QUERY_KEY, query)
+
+        if not found:
+            yield f"Keine Treffer für '{query}' gefunden."
+
+    def _store_results(self, query: str, results: Iterable[SearchResult], storage: BaseStorage) -> str:
+        stored_results = ResultSet(result for result in results if result.title or result.url)
 
         storage.set(self.STORAGE_NAMESPACE, query, stored_results)
         storage.set(self.STORAGE_NAMESPACE, self.LAST_QUERY_KEY, query)
 
         if not stored_results:
-            return f"Keine Treffer für '{query}' gefunden."
+            return SkillResponse(f"Keine Treffer für '{query}' gefunden.", stored_results)
 
-        return self._format_response(query, stored_results)
+        return SkillResponse(self._format_response(query, stored_results), stored_results)
 
-    def _format_response(self, query: str, results: list[dict[str, str]]) -> str:
+    def _format_response(self, query: str, results: Iterable[Mapping[str, str]]) -> str:
         lines = [f"Suchergebnisse für '{query}':"]
-        for entry in results:
-            title = entry.get("title", "Unbenannter Treffer")
-            url = entry.get("url", "")
-            snippet = entry.get("snippet", "").strip()
-            if len(snippet) > 180:
-                snippet = f"{snippet[:177]}..."
-            link_segment = f" ({url})" if url else ""
-            lines.append(f"- {title}{link_segment}: {snippet}")
+        lines.extend(self._format_line(entry) for entry in results)
         return "\n".join(lines)
 
+    @staticmethod
+    def _format_line(entry: Mapping[str, str]) -> str:
+        title = entry.get("title", "Unbenannter Treffer")
+        url = entry.get("url", "")
+        snippet = entry.get("snippet", "").strip()
+        if len(snippet) > 180:
+            snippet = f"{snippet[:177]}..."
+        link_segment = f" ({url})" if url else ""
+        return f"- {title}{link_segment}: {snippet}"
+
 
 __all__ = ["WebSearchSkill"]
 
@@ -1,5 +1,52 @@
-"""Storage implementations for the demo app."""
+"""Storage implementations for the demo app.
 
-from .in_memory import InMemoryStorage
+Backends are imported on first access, so using one backend does not load
+the dependencies of the others.
+"""
 
-__all__ = ["InMemoryStorage"]
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .bounded import BoundedInMemoryStorage, NamespaceQuota
+    from .concurrent import StripedInMemoryStorage
+    from .factory import create_storage, storage_from_settings
+    from .in_memory import InMemoryStorage
+    from .indexed import IndexedStorage
+    from .local import LocalFileStorage
+    from .overlay import OverlayStorage
+    from .sharded import ShardedSessionStore, shard_for
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BoundedInMemoryStorage": ".bounded",
+        "InMemoryStorage": ".in_memory",
+        "IndexedStorage": ".indexed",
+        "LocalFileStorage": ".local",
+        "NamespaceQuota": ".bounded",
+        "OverlayStorage": ".overlay",
+        "ShardedSessionStore": ".sharded",
+        "StripedInMemoryStorage": ".concurrent",
+        "create_storage": ".factory",
+        "shard_for": ".sharded",
+        "storage_from_settings": ".factory",
+    },
+)
+
+__all__ = [
+    "BoundedInMemoryStorage",
+    "InMemoryStorage",
+    "IndexedStorage",
+    "LocalFileStorage",
+    "NamespaceQuota",
+    "OverlayStorage",
+    "ShardedSessionStore",
+    "StripedInMemoryStorage",
+    "create_storage",
+    "shard_for",
+    "storage_from_settings",
+]
@@ -2,8 +2,45 @@
 
 from __future__ import annotations
 
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+class _Missing:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+    def __reduce__(self) -> str:
+        # Unpickles to the same sentinel, e.g. in worker processes.
+        return "MISSING"
+
+
+MISSING: Any = _Missing()
+"""Sentinel describing an absent entry in :meth:`BaseStorage.compare_and_set`."""
+
+# Serialises the default update/compare_and_set of storages without their own locking.
+_DEFAULT_ATOMIC_LOCK = threading.RLock()
+
+
+def json_default(value: Any) -> Any:
+    """``json.dumps`` hook converting compact value types into plain JSON data."""
+
+    as_dicts = getattr(value, "as_dicts", None)
+    if callable(as_dicts):
+        return as_dicts()
+    as_dict = getattr(value, "as_dict", None)
+    if callable(as_dict):
+        return as_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def is_dunder_key(key: str) -> bool:
+    """Return ``True`` for bookkeeping keys such as ``__last_query__``."""
+
+    return len(key) > 4 and key.startswith("__") and key.endswith("__")
 
 
 class BaseStorage(ABC):
@@ -21,5 +58,106 @@ class BaseStorage(ABC):
     def dump_namespace(self, namespace: str) -> Dict[str, Any]:
         """Return all key/value pairs for a namespace."""
 
+    def set_many(self, namespace: str, values: Mapping[str, Any]) -> None:
+        """Persist several key/value pairs of a namespace in one batched write."""
+
+        for key, value in values.items():
+            self.set(namespace, key, value)
+
+    def set_batch(self, values: Mapping[str, Mapping[str, Any]]) -> None:
+        """Persist key/value pairs of several namespaces, ``{namespace: {key: value}}``, in one write.
+
+        Durable backends write the batch as a single record, so related values
+        in different namespaces cannot get out of sync after a crash. The
+        default implementation calls :meth:`set_many` per namespace.
+        """
+
+        for namespace, namespace_values in values.items():
+            self.set_many(namespace, namespace_values)
+
+    def iter_namespace(self, namespace: str, prefix: Optional[str] = None) -> Iterator[Tuple[str, Any]]:
+        """Lazily yield the key/value pairs of a namespace.
+
+        Only keys starting with ``prefix`` are yielded if it is given. The
+        default implementation iterates over :meth:`dump_namespace`; backends
+        should override it to avoid materialising the namespace.
+        """
+
+        for key, value in self.dump_namespace(namespace).items():
+            if prefix is None or key.startswith(prefix):
+                yield key, value
+
+    def namespace_view(self, namespace: str) -> Mapping[str, Any]:
+        """Return a read-only mapping of the namespace.
+
+        Backends that can do so return a live view that reflects later writes
+        without copying; the default implementation wraps a snapshot.
+        """
+
+        return MappingProxyType(self.dump_namespace(namespace))
+
+    def append(self, namespace: str, key: str, item: Any) -> None:
+        """Append ``item`` to the list stored under the namespace and key.
+
+        A missing entry is created as a new list.
+        """
+
+        self.extend(namespace, key, (item,))
+
+    def extend(self, namespace: str, key: str, items: Iterable[Any]) -> None:
+        """Append all ``items`` to the list stored under the namespace and key.
+
+        The default implementation rewrites the whole list; backends should
+        override it with an operation whose cost only depends on ``items``.
+        """
+
+        current = list(self.get(namespace, key) or [])
+        current.extend(items)
+        self.set(namespace, key, current)
+
+    def update(self, namespace: str, key: str, fn: Callable[[Optional[Any]], Any]) -> Any:
+        """Replace the value with ``fn(current)`` and return the new value.
+
+        ``fn`` receives ``None`` for a missing entry and must not access the
+        storage itself. The default implementation holds a process-wide lock,
+        so it is atomic with respect to other default ``update`` and
+        :meth:`compare_and_set` calls but not to concurrent plain writes.
+        Thread-safe backends override it, wrappers pass it through.
+        """
+
+        with _DEFAULT_ATOMIC_LOCK:
+            value = fn(self.get(namespace, key))
+            self.set(namespace, key, value)
+            return value
+
+    def compare_and_set(self, namespace: str, key: str, expected: Any, value: Any) -> bool:
+        """Store ``value`` only if the current value equals ``expected``.
+
+        Pass :data:`MISSING` as ``expected`` to insert only if the key is absent.
+        Returns whether the value was written. The default implementation
+        treats a stored ``None`` as absent and has the same locking as
+        :meth:`update`.
+        """
+
+        with _DEFAULT_ATOMIC_LOCK:
+            current = self.get(namespace, key)
+            if current is None or expected is MISSING:
+                matches = current is None and expected in (None, MISSING)
+            else:
+                matches = current == expected
+            if matches:
+                self.set(namespace, key, value)
+            return matches
+
+    def read_range(self, namespace: str, key: str, start: int = 0, stop: Optional[int] = None) -> List[Any]:
+        """Return the slice ``[start:stop]`` of the list stored under the namespace and key."""
+
+        return list((self.get(namespace, key) or [])[start:stop])
+
+    def length(self, namespace: str, key: str) -> int:
+        """Return the number of items of the list stored under the namespace and key."""
+
+        return len(self.get(namespace, key) or [])
+
 
-__all__ = ["BaseStorage"]
+__all__ = ["BaseStorage", "MISSING", "is_dunder_key", "json_default"]
@@ -0,0 +1,304 @@
+"""Memory-bounded storage with per-namespace quotas and LRU/TTL eviction."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Collection, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from .base import BaseStorage, is_dunder_key, json_default
+
+
+@dataclass(frozen=True)
+class NamespaceQuota:
+    """Limits applied to a single namespace.
+
+    Attributes:
+        max_entries: Maximum number of unpinned keys kept in the namespace.
+        max_bytes: Maximum estimated size of the unpinned values in bytes.
+        ttl_seconds: Lifetime of an entry after its last write.
+    """
+
+    max_entries: Optional[int] = None
+    max_bytes: Optional[int] = None
+    ttl_seconds: Optional[float] = None
+
+
+@dataclass
+class EvictionStats:
+    """Counters describing why entries left a namespace."""
+
+    evicted_entries: int = 0
+    evicted_bytes: int = 0
+    expired: int = 0
+
+
+def estimate_size(value: Any) -> int:
+    """Return a cheap estimate of the memory held by ``value`` in bytes."""
+
+    try:
+        return len(json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=json_default))
+    except (TypeError, ValueError):
+        return len(repr(value))
+
+
+_ABSENT: Any = object()
+
+
+class _Entry:
+    __slots__ = ("value", "size", "expires_at")
+
+    def __init__(self, value: Any, size: int, expires_at: Optional[float]) -> None:
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+
+
+class BoundedInMemoryStorage(BaseStorage):
+    """In-memory storage that evicts entries to stay within per-namespace quotas.
+
+    Each namespace keeps its keys in least-recently-used order. When a write
+    exceeds ``max_entries`` or ``max_bytes`` of the namespace's
+    :class:`NamespaceQuota`, the least recently used unpinned entries are
+    evicted. Entries older than ``ttl_seconds`` are dropped lazily on access.
+
+    Pinned keys are never evicted and do not count towards the quota. By
+    default every dunder key (e.g. ``WebSearchSkill.LAST_QUERY_KEY``) is pinned;
+    ``pinned`` adds explicit ``(namespace, key)`` pairs.
+
+    Args:
+        quotas: Quota per namespace name.
+        default_quota: Quota for namespaces without an explicit entry.
+        pinned: Additional ``(namespace, key)`` pairs that are never evicted.
+        pin_dunder_keys: Whether ``__name__`` style keys are pinned.
+        sizer: Function estimating the size of a value in bytes.
+        clock: Time source used for TTL handling.
+    """
+
+    def __init__(
+        self,
+        quotas: Mapping[str, NamespaceQuota] | None = None,
+        *,
+        default_quota: NamespaceQuota | None = None,
+        pinned: Collection[Tuple[str, str]] = (),
+        pin_dunder_keys: bool = True,
+        sizer: Callable[[Any], int] = estimate_size,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._quotas: Dict[str, NamespaceQuota] = dict(quotas or {})
+        self._default_quota = default_quota or NamespaceQuota()
+        self._pinned = frozenset(pinned)
+        self._pin_dunder_keys = pin_dunder_keys
+        self._sizer = sizer
+        self._clock = clock
+        self._store: Dict[str, OrderedDict[str, _Entry]] = {}
+        self._pinned_store: Dict[str, Dict[str, Any]] = {}
+        self._bytes: Dict[str, int] = {}
+        self._stats: Dict[str, EvictionStats] = {}
+        self._lock = threading.RLock()
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        if self._is_pinned(namespace, key):
+            return self._pinned_store.get(namespace, {}).get(key)
+        with self._lock:
+            entries = self._store.get(namespace)
+            entry = entries.get(key) if entries else None
+            if entry is None:
+                return None
+            if entry.expires_at is not None and self._clock() >= entry.expires_at:
+                self._remove(namespace, key)
+                self._stats_for(namespace).expired += 1
+                return None
+            entries.move_to_end(key)
+            return entry.value
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        if self._is_pinned(namespace, key):
+            with self._lock:
+                self._pinned_store.setdefault(namespace, {})[key] = value
+            return
+        with self._lock:
+            self._put(namespace, key, value)
+            self._enforce_quota(namespace)
+
+    def set_many(self, namespace: str, values: Mapping[str, Any]) -> None:
+        with self._lock:
+            for key, value in values.items():
+                if self._is_pinned(namespace, key):
+                    self._pinned_store.setdefault(namespace, {})[key] = value
+                else:
+                    self._put(namespace, key, value)
+            if namespace in self._store:
+                self._enforce_quota(namespace)
+
+    def extend(self, namespace: str, key: str, items: Iterable[Any]) -> None:
+        """Append ``items`` in place, accounting only for the size of ``items``."""
+
+        items = list(items)
+        with self._lock:
+            current = self.get(namespace, key)
+            if current is None:
+                self.set(namespace, key, items)
+                return
+            if not callable(getattr(current, "extend", None)):
+                raise TypeError(f"Value stored under '{namespace}/{key}' is not a list")
+            had_items = len(current) > 0
+            current.extend(items)
+            if self._is_pinned(namespace, key) or not items:
+                return
+            entry = self._store[namespace][key]
+            quota = self._quota_for(namespace)
+            if quota.ttl_seconds is not None:
+                entry.expires_at = self._clock() + quota.ttl_seconds
+            if quota.max_bytes is not None:
+                added = self._extension_size(items, had_items)
+                entry.size += added
+                self._bytes[namespace] += added
+            self._enforce_quota(namespace)
+
+    def dump_namespace(self, namespace: str) -> Dict[str, Any]:
+        with self._lock:
+            self._expire(namespace)
+            values = {key: entry.value for key, entry in self._store.get(namespace, {}).items()}
+            values.update(self._pinned_store.get(namespace, {}))
+            return values
+
+    def iter_namespace(self, namespace: str, prefix: Optional[str] = None) -> Iterator[Tuple[str, Any]]:
+        """Yield the live, unexpired entries of a namespace without copying values.
+
+        Iteration does not count as access for the LRU order. Entries evicted
+        while the iterator is active are skipped.
+        """
+
+        pinned = self._pinned_store.get(namespace, {})
+        for key in list(pinned):
+            if (prefix is None or key.startswith(prefix)) and key in pinned:
+                yield key, pinned[key]
+        entries = self._store.get(namespace)
+        if not entries:
+            return
+        with self._lock:
+            keys = [key for key in entries if prefix is None or key.startswith(prefix)]
+        for key in keys:
+            value = self._peek(namespace, key)
+            if value is not _ABSENT:
+                yield key, value
+
+    def namespace_view(self, namespace: str) -> Mapping[str, Any]:
+        return _NamespaceView(self, namespace)
+
+    def expire(self) -> int:
+        """Drop all expired entries eagerly and return how many were removed."""
+
+        with self._lock:
+            return sum(self._expire(namespace) for namespace in list(self._store))
+
+    def namespace_bytes(self, namespace: str) -> int:
+        """Return the estimated size of the unpinned values in ``namespace``."""
+
+        return self._bytes.get(namespace, 0)
+
+    def namespace_size(self, namespace: str) -> int:
+        """Return the number of unpinned keys currently held in ``namespace``."""
+
+        return len(self._store.get(namespace, {}))
+
+    def eviction_stats(self) -> Dict[str, EvictionStats]:
+        """Return a copy of the eviction counters per namespace."""
+
+        with self._lock:
+            return {namespace: EvictionStats(**vars(stats)) for namespace, stats in self._stats.items()}
+
+    def _peek(self, namespace: str, key: str) -> Any:
+        if self._is_pinned(namespace, key):
+            return self._pinned_store.get(namespace, {}).get(key, _ABSENT)
+        entry = self._store.get(namespace, {}).get(key)
+        if entry is None or (entry.expires_at is not None and self._clock() >= entry.expires_at):
+            return _ABSENT
+        return entry.value
+
+    def _is_pinned(self, namespace: str, key: str) -> bool:
+        return (self._pin_dunder_keys and is_dunder_key(key)) or (namespace, key) in self._pinned
+
+    def _quota_for(self, namespace: str) -> NamespaceQuota:
+        return self._quotas.get(namespace, self._default_quota)
+
+    def _stats_for(self, namespace: str) -> EvictionStats:
+        return self._stats.setdefault(namespace, EvictionStats())
+
+    def _put(self, namespace: str, key: str, value: Any) -> None:
+        quota = self._quota_for(namespace)
+        size = self._sizer(value) if quota.max_bytes is not None else 0
+        expires_at = self._clock() + quota.ttl_seconds if quota.ttl_seconds is not None else None
+        entries = self._store.setdefault(namespace, OrderedDict())
+        if key in entries:
+            self._remove(namespace, key)
+        entries[key] = _Entry(value, size, expires_at)
+        self._bytes[namespace] = self._bytes.get(namespace, 0) + size
+
+    def _extension_size(self, items: List[Any], had_items: bool) -> int:
+        size = self._sizer(items)
+        if self._sizer is estimate_size:
+            # ``[a]`` extended by ``[b]`` serialises to ``[a,b]``: the brackets
+            # are already counted and a separating comma is added.
+            size -= 1 if had_items else 2
+        return size
+
+    def _remove(self, namespace: str, key: str) -> _Entry:
+        entry = self._store[namespace].pop(key)
+        self._bytes[namespace] -= entry.size
+        return entry
+
+    def _enforce_quota(self, namespace: str) -> None:
+        quota = self._quota_for(namespace)
+        entries = self._store[namespace]
+        stats = self._stats_for(namespace)
+        while entries and (
+            (quota.max_entries is not None and len(entries) > quota.max_entries)
+            or (quota.max_bytes is not None and self._bytes[namespace] > quota.max_bytes)
+        ):
+            oldest = next(iter(entries))
+            entry = self._remove(namespace, oldest)
+            stats.evicted_entries += 1
+            stats.evicted_bytes += entry.size
+
+    def _expire(self, namespace: str) -> int:
+        entries = self._store.get(namespace)
+        if not entries or self._quota_for(namespace).ttl_seconds is None:
+            return 0
+        now = self._clock()
+        expired: List[str] = [
+            key for key, entry in entries.items() if entry.expires_at is not None and now >= entry.expires_at
+        ]
+        for key in expired:
+            self._remove(namespace, key)
+        self._stats_for(namespace).expired += len(expired)
+        return len(expired)
+
+
+class _NamespaceView(Mapping[str, Any]):
+    """Read-only live view of a namespace of a :class:`BoundedInMemoryStorage`."""
+
+    __slots__ = ("_storage", "_namespace")
+
+    def __init__(self, storage: BoundedInMemoryStorage, namespace: str) -> None:
+        self._storage = storage
+        self._namespace = namespace
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._storage._peek(self._namespace, key)
+        if value is _ABSENT:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key, _ in self._storage.iter_namespace(self._namespace))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+__all__ = ["BoundedInMemoryStorage", "EvictionStats", "NamespaceQuota", "estimate_size"]
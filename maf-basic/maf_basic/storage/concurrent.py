@@ -0,0 +1,134 @@
+"""Thread-safe in-memory storage using lock striping."""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from .base import MISSING
+from .in_memory import InMemoryStorage
+
+
+class StripedInMemoryStorage(InMemoryStorage):
+    """In-memory storage safe for concurrent use from many threads.
+
+    Writes take one of ``stripes`` locks chosen by the hash of the namespace and
+    key, so writers to different keys rarely contend while read-modify-write
+    operations on the same key are serialised. Reads do not lock: single dict
+    lookups are atomic in CPython and always observe a complete value.
+    Iterating a namespace works on a snapshot of its keys taken under all
+    stripe locks, so concurrent writers never break a running iteration.
+    """
+
+    def __init__(self, stripes: int = 64) -> None:
+        super().__init__()
+        self._locks: List[threading.Lock] = [threading.Lock() for _ in range(max(1, stripes))]
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        with self._lock_for(namespace, key):
+            super().set(namespace, key, value)
+
+    def set_many(self, namespace: str, values: Mapping[str, Any]) -> None:
+        stripes = sorted({self._stripe_index(namespace, key) for key in values})
+        for index in stripes:
+            self._locks[index].acquire()
+        try:
+            super().set_many(namespace, values)
+        finally:
+            for index in reversed(stripes):
+                self._locks[index].release()
+
+    def extend(self, namespace: str, key: str, items: Iterable[Any]) -> None:
+        items = list(items)
+        with self._lock_for(namespace, key):
+            super().extend(namespace, key, items)
+
+    def update(self, namespace: str, key: str, fn: Callable[[Optional[Any]], Any]) -> Any:
+        """Atomically replace the value with ``fn(current)`` and return the new value.
+
+        ``fn`` receives ``None`` for a missing entry. It runs while the stripe
+        lock is held and must not access the storage itself.
+        """
+
+        with self._lock_for(namespace, key):
+            value = fn(self.get(namespace, key))
+            super().set(namespace, key, value)
+            return value
+
+    def compare_and_set(self, namespace: str, key: str, expected: Any, value: Any) -> bool:
+        """Store ``value`` only if the current value equals ``expected``.
+
+        Pass :data:`MISSING` as ``expected`` to insert only if the key is absent.
+        Returns whether the value was written.
+        """
+
+        with self._lock_for(namespace, key):
+            current = self._store.get(namespace, {}).get(key, MISSING)
+            if current is MISSING or expected is MISSING:
+                matches = current is expected
+            else:
+                matches = current == expected
+            if matches:
+                super().set(namespace, key, value)
+            return matches
+
+    def iter_namespace(self, namespace: str, prefix: Optional[str] = None) -> Iterator[Tuple[str, Any]]:
+        """Lazily yield the entries that existed when the iteration started.
+
+        Values are looked up one at a time, so an entry written meanwhile is
+        yielded with its current value. Keys added later are not yielded.
+        """
+
+        for key in self._snapshot_keys(namespace):
+            if prefix is not None and not key.startswith(prefix):
+                continue
+            value = self._store.get(namespace, {}).get(key, MISSING)
+            if value is not MISSING:
+                yield key, value
+
+    def namespace_view(self, namespace: str) -> Mapping[str, Any]:
+        return _NamespaceView(self, namespace)
+
+    def _snapshot_keys(self, namespace: str) -> List[str]:
+        with self._all_locks():
+            return list(self._store.get(namespace, ()))
+
+    @contextmanager
+    def _all_locks(self) -> Iterator[None]:
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+    def _lock_for(self, namespace: str, key: str) -> threading.Lock:
+        return self._locks[self._stripe_index(namespace, key)]
+
+    def _stripe_index(self, namespace: str, key: str) -> int:
+        return hash((namespace, key)) % len(self._locks)
+
+
+class _NamespaceView(Mapping[str, Any]):
+    """Read-only live view of a namespace of a :class:`StripedInMemoryStorage`."""
+
+    def __init__(self, storage: StripedInMemoryStorage, namespace: str) -> None:
+        self._storage = storage
+        self._namespace = namespace
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._storage._store.get(self._namespace, {}).get(key, MISSING)
+        if value is MISSING:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._storage._snapshot_keys(self._namespace))
+
+    def __len__(self) -> int:
+        return len(self._storage._store.get(self._namespace, ()))
+
+
+__all__ = ["MISSING", "StripedInMemoryStorage"]
@@ -0,0 +1,53 @@
+"""Create storage backends from the ``storage`` section of the settings."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Mapping
+
+from .base import BaseStorage
+from .bounded import BoundedInMemoryStorage, NamespaceQuota
+from .concurrent import StripedInMemoryStorage
+from .in_memory import InMemoryStorage
+from .local import LocalFileStorage
+
+
+def create_storage(config: Mapping[str, Any] | None, *, base_dir: str | Path | None = None) -> BaseStorage:
+    """Return the storage backend described by ``config``.
+
+    ``config`` is a single entry of the ``storage`` section in
+    ``config/settings.yaml``, e.g. ``{"backend": "local", "path": "./data/storage.jsonl"}``.
+    Relative paths are resolved against ``base_dir`` if given.
+    """
+
+    config = config or {}
+    backend = str(config.get("backend", "memory")).lower()
+    if backend in {"memory", "in_memory"}:
+        return InMemoryStorage()
+    if backend == "bounded":
+        quotas = {namespace: NamespaceQuota(**quota) for namespace, quota in (config.get("quotas") or {}).items()}
+        default_quota = NamespaceQuota(**config["default_quota"]) if config.get("default_quota") else None
+        return BoundedInMemoryStorage(quotas, default_quota=default_quota)
+    if backend == "concurrent":
+        return StripedInMemoryStorage(stripes=int(config.get("stripes", 64)))
+    if backend == "local":
+        raw_path = str(config.get("path") or "").strip()
+        if not raw_path or "${" in raw_path:
+            raise ValueError("Storage backend 'local' requires a resolved 'path' setting (e.g. STORAGE_PATH).")
+        path = Path(raw_path)
+        if base_dir is not None and not path.is_absolute():
+            path = Path(base_dir) / path
+        return LocalFileStorage(path, fsync=bool(config.get("fsync", False)))
+    raise ValueError(f"Unknown storage backend '{backend}'")
+
+
+def storage_from_settings(
+    settings: Mapping[str, Any], name: str = "default", *, base_dir: str | Path | None = None
+) -> BaseStorage:
+    """Create the storage named ``name`` from the full settings mapping."""
+
+    storage_settings = settings.get("storage") or {}
+    return create_storage(storage_settings.get(name), base_dir=base_dir)
+
+
+__all__ = ["create_storage", "storage_from_settings"]
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 
 from .base import BaseStorage
 
@@ -20,8 +21,50 @@ class InMemoryStorage(BaseStorage):
         namespace_store = self._store.setdefault(namespace, {})
         namespace_store[key] = value
 
+    def set_many(self, namespace: str, values: Mapping[str, Any]) -> None:
+        self._store.setdefault(namespace, {}).update(values)
+
     def dump_namespace(self, namespace: str) -> Dict[str, Any]:
         return dict(self._store.get(namespace, {}))
 
+    def iter_namespace(self, namespace: str, prefix: Optional[str] = None) -> Iterator[Tuple[str, Any]]:
+        """Yield the entries of the live namespace dict without copying it.
+
+        As with a plain ``dict``, adding or removing keys of the namespace while
+        the iterator is active raises :class:`RuntimeError`.
+        """
+
+        namespace_store = self._store.get(namespace)
+        if not namespace_store:
+            return
+        for key, value in namespace_store.items():
+            if prefix is None or key.startswith(prefix):
+                yield key, value
+
+    def namespace_view(self, namespace: str) -> Mapping[str, Any]:
+        return MappingProxyType(self._store.setdefault(namespace, {}))
+
+    def extend(self, namespace: str, key: str, items: Iterable[Any]) -> None:
+        self._check_extendable(namespace, key)
+        namespace_store = self._store.setdefault(namespace, {})
+        current = namespace_store.get(key)
+        if current is None:
+            namespace_store[key] = list(items)
+        else:
+            current.extend(items)
+
+    def read_range(self, namespace: str, key: str, start: int = 0, stop: Optional[int] = None) -> List[Any]:
+        value = self._store.get(namespace, {}).get(key)
+        return list(value[start:stop]) if value else []
+
+    def length(self, namespace: str, key: str) -> int:
+        value = self._store.get(namespace, {}).get(key)
+        return len(value) if value else 0
+
+    def _check_extendable(self, namespace: str, key: str) -> None:
+        current = self._store.get(namespace, {}).get(key)
+        if current is not None and not callable(getattr(current, "extend", None)):
+            raise TypeError(f"Value stored under '{namespace}/{key}' is not a list")
+
 
 __all__ = ["InMemoryStorage"]
@@ -0,0 +1,99 @@
+"""Storage wrapper keeping a full-text index of stored search results up to date."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from ..services.local_index import SearchIndex
+from .base import BaseStorage, is_dunder_key
+
+
+class IndexedStorage(BaseStorage):
+    """Delegate to another storage and index every result list written to ``namespace``.
+
+    Every ``set`` of a list under a regular key of ``namespace`` replaces the
+    indexed documents of that key, every ``append``/``extend`` adds to them.
+    Existing entries of the wrapped storage are indexed on construction.
+
+    Args:
+        inner: Storage that actually holds the values.
+        index: Index to maintain. A new one is created if omitted.
+        namespace: Namespace holding search results (``WebSearchSkill.STORAGE_NAMESPACE``).
+    """
+
+    def __init__(self, inner: BaseStorage, index: SearchIndex | None = None, *, namespace: str = "web_search") -> None:
+        self.inner = inner
+        self.index = index or SearchIndex()
+        self._namespace = namespace
+        for key, value in inner.iter_namespace(namespace):
+            if self._indexable(namespace, key, value):
+                self.index.add(key, value)
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        return self.inner.get(namespace, key)
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        self.inner.set(namespace, key, value)
+        self._reindex(namespace, key, value)
+
+    def update(self, namespace: str, key: str, fn: Callable[[Optional[Any]], Any]) -> Any:
+        value = self.inner.update(namespace, key, fn)
+        self._reindex(namespace, key, value)
+        return value
+
+    def compare_and_set(self, namespace: str, key: str, expected: Any, value: Any) -> bool:
+        written = self.inner.compare_and_set(namespace, key, expected, value)
+        if written:
+            self._reindex(namespace, key, value)
+        return written
+
+    def set_many(self, namespace: str, values: Mapping[str, Any]) -> None:
+        self.inner.set_many(namespace, values)
+        if namespace != self._namespace:
+            return
+        for key, value in values.items():
+            if self._indexable(namespace, key, value):
+                self.index.replace(key, value)
+            elif not is_dunder_key(key):
+                self.index.remove(key)
+
+    def set_batch(self, values: Mapping[str, Mapping[str, Any]]) -> None:
+        self.inner.set_batch(values)
+        for key, value in values.get(self._namespace, {}).items():
+            self._reindex(self._namespace, key, value)
+
+    def extend(self, namespace: str, key: str, items: Iterable[Any]) -> None:
+        items = list(items)
+        self.inner.extend(namespace, key, items)
+        if namespace == self._namespace and not is_dunder_key(key):
+            self.index.add(key, items)
+
+    def dump_namespace(self, namespace: str) -> Dict[str, Any]:
+        return self.inner.dump_namespace(namespace)
+
+    def iter_namespace(self, namespace: str, prefix: Optional[str] = None) -> Iterator[Tuple[str, Any]]:
+        return self.inner.iter_namespace(namespace, prefix)
+
+    def namespace_view(self, namespace: str) -> Mapping[str, Any]:
+        return self.inner.namespace_view(namespace)
+
+    def read_range(self, namespace: str, key: str, start: int = 0, stop: Optional[int] = None) -> List[Any]:
+        return self.inner.read_range(namespace, key, start, stop)
+
+    def length(self, namespace: str, key: str) -> int:
+        return self.inner.length(namespace, key)
+
+    def _reindex(self, namespace: str, key: str, value: Any) -> None:
+        if namespace == self._namespace and not is_dunder_key(key):
+            if self._indexable(namespace, key, value):
+                self.index.replace(key, value)
+            else:
+                self.index.remove(key)
+
+    def _indexable(self, namespace: str, key: str, value: Any) -> bool:
+        if namespace != self._namespace or is_dunder_key(key):
+            return False
+        return isinstance(value, Sequence) and not isinstance(value, (str, bytes))
+
+
+__all__ = ["IndexedStorage"]
@@ -0,0 +1,189 @@
+"""Durable storage backed by an append-only log file."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Mapping, Tuple
+
+from .base import json_default
+from .in_memory import InMemoryStorage
+
+
+class LocalFileStorage(InMemoryStorage):
+    """Storage keeping all values in memory and persisting writes to a local log.
+
+    Every write appends a single JSON line to ``path``, so the cost of a write
+    does not depend on the size of the store. On start-up the log is replayed;
+    a partially written last line left behind by a crash is discarded.
+
+    The log is compacted into one record per live key once it has grown to
+    ``compact_ratio`` times its size after the previous compaction (and at
+    least ``compact_min_bytes``), which keeps the amortised write cost constant
+    for both overwrites and list appends. Compaction writes a new file next to the log and
+    atomically replaces it, so a crash at any point leaves either the old or
+    the new log intact. Values must be JSON serialisable; result sets are
+    stored as lists of dicts. The log is in JSON Lines format, hence the
+    ``.jsonl`` suffix of the default path.
+
+    Args:
+        path: Location of the log file. Parent directories are created.
+        fsync: Force every write to disk instead of only flushing it to the OS.
+        compact_ratio: Growth factor of the log that triggers an automatic compaction.
+        compact_min_bytes: Minimum log size before compacting automatically.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        fsync: bool = False,
+        compact_ratio: float = 4.0,
+        compact_min_bytes: int = 1 << 20,
+    ) -> None:
+        super().__init__()
+        self.path = Path(path)
+        self._fsync = fsync
+        self._compact_ratio = compact_ratio
+        self._compact_min_bytes = compact_min_bytes
+        self._lock = threading.RLock()
+        self._log_bytes = 0
+        self._compacted_bytes = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._replay()
+        self._file = self.path.open("ab")
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        with self._lock:
+            self._write({"op": "set", "ns": namespace, "key": key, "value": value})
+            super().set(namespace, key, value)
+            self._maybe_compact()
+
+    def set_many(self, namespace: str, values: Mapping[str, Any]) -> None:
+        values = dict(values)
+        with self._lock:
+            self._write({"op": "set_many", "ns": namespace, "values": values})
+            super().set_many(namespace, values)
+            self._maybe_compact()
+
+    def set_batch(self, values: Mapping[str, Mapping[str, Any]]) -> None:
+        values = {namespace: dict(namespace_values) for namespace, namespace_values in values.items()}
+        with self._lock:
+            self._write({"op": "set_batch", "values": values})
+            for namespace, namespace_values in values.items():
+                super().set_many(namespace, namespace_values)
+            self._maybe_compact()
+
+    def extend(self, namespace: str, key: str, items: Iterable[Any]) -> None:
+        items = list(items)
+        with self._lock:
+            self._check_extendable(namespace, key)
+            self._write({"op": "extend", "ns": namespace, "key": key, "items": items})
+            super().extend(namespace, key, items)
+            self._maybe_compact()
+
+    def compact(self) -> None:
+        """Rewrite the log so it contains exactly one record per live key."""
+
+        with self._lock:
+            tmp_path = self.path.with_name(f"{self.path.name}.compact")
+            with tmp_path.open("wb") as fh:
+                for record in self._snapshot_records():
+                    fh.write(self._encode(record))
+                fh.flush()
+                os.fsync(fh.fileno())
+            self._file.close()
+            os.replace(tmp_path, self.path)
+            self._fsync_directory()
+            self._file = self.path.open("ab")
+            self._log_bytes = self._compacted_bytes = self.path.stat().st_size
+
+    def close(self) -> None:
+        """Flush and close the underlying log file."""
+
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._file.close()
+
+    def _snapshot_records(self) -> Iterator[Dict[str, Any]]:
+        for namespace, values in self._store.items():
+            for key, value in values.items():
+                yield {"op": "set", "ns": namespace, "key": key, "value": value}
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        if record["op"] == "set":
+            super().set(record["ns"], record["key"], record["value"])
+        elif record["op"] == "set_many":
+            super().set_many(record["ns"], record["values"])
+        elif record["op"] == "set_batch":
+            for namespace, values in record["values"].items():
+                super().set_many(namespace, values)
+        elif record["op"] == "extend":
+            super().extend(record["ns"], record["key"], record["items"])
+        else:
+            raise ValueError(f"Unknown log operation '{record['op']}' in {self.path}")
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        line = self._encode(record)
+        self._file.write(line)
+        self._file.flush()
+        if self._fsync:
+            os.fsync(self._file.fileno())
+        self._log_bytes += len(line)
+
+    def _replay(self) -> None:
+        if not self.path.exists():
+            return
+        valid_bytes = 0
+        for offset, record in self._read_records():
+            self._apply(record)
+            valid_bytes = offset
+        if valid_bytes != self.path.stat().st_size:
+            # Drop the torn tail so new records start on a clean line.
+            with self.path.open("r+b") as fh:
+                fh.truncate(valid_bytes)
+        # Treat the replayed log as the compaction baseline, otherwise every
+        # restart would rewrite a large log on its first write.
+        self._log_bytes = self._compacted_bytes = valid_bytes
+
+    def _read_records(self) -> Iterable[Tuple[int, Dict[str, Any]]]:
+        offset = 0
+        with self.path.open("rb") as fh:
+            for line in fh:
+                if not line.endswith(b"\n"):
+                    return
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    return
+                offset += len(line)
+                yield offset, record
+
+    def _maybe_compact(self) -> None:
+        if self._log_bytes < self._compact_min_bytes:
+            return
+        if self._log_bytes > self._compact_ratio * self._compacted_bytes:
+            self.compact()
+
+    def _fsync_directory(self) -> None:
+        try:
+            fd = os.open(self.path.parent, os.O_RDONLY)
+        except OSError:  # pragma: no cover - platforms without directory handles
+            return
+        try:
+            os.fsync(fd)
+        except OSError:  # pragma: no cover - e.g. Windows
+            pass
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _encode(record: Dict[str, Any]) -> bytes:
+        return (json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=json_default) + "\n").encode("utf-8")
+
+
+__all__ = ["LocalFileStorage"]
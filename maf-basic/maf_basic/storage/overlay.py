@@ -0,0 +1,117 @@
+"""Storage layering uncommitted in-memory writes over another storage."""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional, Tuple
+
+from .base import BaseStorage
+
+Layer = Dict[str, Dict[str, Any]]
+
+
+class OverlayStorage(BaseStorage):
+    """Read through an in-memory ``layer`` to ``base`` and keep writes in the layer.
+
+    Values in the layer shadow those of ``base``. With ``write_through=True``
+    writes go to ``base`` instead and drop any shadowing value from the layer.
+    Several overlays can share one layer (see :meth:`sibling`), so a write
+    kept in memory by one of them is visible to all others.
+
+    Args:
+        base: Storage holding the committed values.
+        layer: Shared ``{namespace: {key: value}}`` mapping. A new one is created if omitted.
+        write_through: Whether writes are committed to ``base``.
+    """
+
+    def __init__(self, base: BaseStorage, layer: Layer | None = None, *, write_through: bool = False) -> None:
+        self.base = base
+        self.layer: Layer = {} if layer is None else layer
+        self.write_through = write_through
+
+    def sibling(self, *, write_through: bool) -> "OverlayStorage":
+        """Return an overlay of the same base sharing this overlay's layer."""
+
+        return OverlayStorage(self.base, self.layer, write_through=write_through)
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        values = self.layer.get(namespace)
+        if values is not None and key in values:
+            return values[key]
+        return self.base.get(namespace, key)
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        if self.write_through:
+            self.base.set(namespace, key, value)
+            self._drop(namespace, (key,))
+        else:
+            self.layer.setdefault(namespace, {})[key] = value
+
+    def set_many(self, namespace: str, values: Mapping[str, Any]) -> None:
+        if self.write_through:
+            self.base.set_many(namespace, values)
+            self._drop(namespace, values)
+        else:
+            self.layer.setdefault(namespace, {}).update(values)
+
+    def set_batch(self, values: Mapping[str, Mapping[str, Any]]) -> None:
+        if self.write_through:
+            self.base.set_batch(values)
+            for namespace, namespace_values in values.items():
+                self._drop(namespace, namespace_values)
+        else:
+            for namespace, namespace_values in values.items():
+                self.layer.setdefault(namespace, {}).update(namespace_values)
+
+    def extend(self, namespace: str, key: str, items: Iterable[Any]) -> None:
+        shadowed = self.layer.get(namespace, {})
+        if key not in shadowed:
+            if self.write_through:
+                self.base.extend(namespace, key, items)
+                return
+            shadowed = self.layer.setdefault(namespace, {})
+            shadowed[key] = list(self.base.get(namespace, key) or [])
+        elif not hasattr(shadowed[key], "extend"):
+            shadowed[key] = list(shadowed[key] or [])
+        shadowed[key].extend(items)
+        if self.write_through:
+            self.base.set(namespace, key, shadowed.pop(key))
+
+    def update(self, namespace: str, key: str, fn: Callable[[Optional[Any]], Any]) -> Any:
+        if self.write_through and key not in self.layer.get(namespace, {}):
+            return self.base.update(namespace, key, fn)
+        # The visible value lives in the layer, or writes stay in it.
+        return super().update(namespace, key, fn)
+
+    def compare_and_set(self, namespace: str, key: str, expected: Any, value: Any) -> bool:
+        if self.write_through and key not in self.layer.get(namespace, {}):
+            return self.base.compare_and_set(namespace, key, expected, value)
+        return super().compare_and_set(namespace, key, expected, value)
+
+    def dump_namespace(self, namespace: str) -> Dict[str, Any]:
+        values = self.base.dump_namespace(namespace)
+        values.update(self.layer.get(namespace, {}))
+        return values
+
+    def iter_namespace(self, namespace: str, prefix: Optional[str] = None) -> Iterator[Tuple[str, Any]]:
+        shadowed = dict(self.layer.get(namespace, {}))
+        for key, value in self.base.iter_namespace(namespace, prefix):
+            if key not in shadowed:
+                yield key, value
+        for key, value in shadowed.items():
+            if prefix is None or key.startswith(prefix):
+                yield key, value
+
+    def namespace_view(self, namespace: str) -> Mapping[str, Any]:
+        if not self.layer.get(namespace):
+            return self.base.namespace_view(namespace)
+        return MappingProxyType(self.dump_namespace(namespace))
+
+    def _drop(self, namespace: str, keys: Iterable[str]) -> None:
+        shadowed = self.layer.get(namespace)
+        if shadowed:
+            for key in keys:
+                shadowed.pop(key, None)
+
+
+__all__ = ["OverlayStorage"]
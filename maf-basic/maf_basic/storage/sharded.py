@@ -0,0 +1,94 @@
+"""Per-session storage isolation backed by hash-sharded session maps."""
+
+from __future__ import annotations
+
+import threading
+import zlib
+from typing import Callable, Dict, Iterator, List
+
+from .base import BaseStorage
+from .concurrent import StripedInMemoryStorage
+
+
+def shard_for(session_id: str, shards: int) -> int:
+    """Return the shard index of ``session_id``.
+
+    The hash is stable across processes (unlike :func:`hash`), so the same
+    function can route sessions to worker processes: a worker with index
+    ``i`` out of ``n`` owns every session for which ``shard_for(sid, n) == i``.
+    """
+
+    return zlib.crc32(session_id.encode("utf-8")) % shards
+
+
+def default_session_storage() -> BaseStorage:
+    """Return a thread-safe storage for a new session.
+
+    Concurrent calls of one session (``invoke_many``, the HTTP server) write
+    to the same storage. Sessions hold little state, so fewer lock stripes
+    than the shared default suffice.
+    """
+
+    return StripedInMemoryStorage(stripes=8)
+
+
+class ShardedSessionStore:
+    """Registry giving every session its own isolated storage.
+
+    Sessions are spread over ``shards`` independently locked maps, so creating
+    and dropping sessions from many threads does not contend on a single lock.
+    Dropping a session releases all of its state in O(1).
+
+    Args:
+        shards: Number of shards.
+        factory: Creates the storage of a new session. Defaults to
+            :func:`default_session_storage`.
+    """
+
+    def __init__(self, shards: int = 16, factory: Callable[[], BaseStorage] = default_session_storage) -> None:
+        self._factory = factory
+        self._shards: List[Dict[str, BaseStorage]] = [{} for _ in range(max(1, shards))]
+        self._locks: List[threading.Lock] = [threading.Lock() for _ in self._shards]
+
+    @property
+    def shard_count(self) -> int:
+        return len(self._shards)
+
+    def shard_index(self, session_id: str) -> int:
+        return shard_for(session_id, len(self._shards))
+
+    def session(self, session_id: str) -> BaseStorage:
+        """Return the storage of ``session_id``, creating it on first use."""
+
+        index = self.shard_index(session_id)
+        shard = self._shards[index]
+        storage = shard.get(session_id)
+        if storage is not None:
+            return storage
+        with self._locks[index]:
+            storage = shard.get(session_id)
+            if storage is None:
+                storage = shard[session_id] = self._factory()
+            return storage
+
+    def drop(self, session_id: str) -> bool:
+        """Forget all state of ``session_id`` and return whether it existed."""
+
+        index = self.shard_index(session_id)
+        with self._locks[index]:
+            return self._shards[index].pop(session_id, None) is not None
+
+    def sessions(self) -> Iterator[str]:
+        """Yield the ids of all known sessions."""
+
+        for shard in self._shards:
+            yield from list(shard)
+
+    def __contains__(self, session_id: object) -> bool:
+        return isinstance(session_id, str) and session_id in self._shards[self.shard_index(session_id)]
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+
+__all__ = ["ShardedSessionStore", "default_session_storage", "shard_for"]
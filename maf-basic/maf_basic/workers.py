@@ -0,0 +1,242 @@
+"""Process pool running CPU-heavy skills next to the app, with proxied storage access."""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .skills.base import BaseSkill
+from .storage.base import MISSING, BaseStorage
+
+Address = Tuple[str, int]
+StorageResolver = Callable[[Optional[str]], BaseStorage]
+
+# Storage methods a worker may call remotely. Everything else is derived from
+# these by :class:`ProxiedStorage` or the ``BaseStorage`` defaults.
+PROXIED_METHODS = frozenset(
+    {"get", "set", "set_many", "set_batch", "compare_and_set", "dump_namespace", "extend", "read_range", "length"}
+)
+
+
+def ensure_picklable(skill: BaseSkill) -> bytes:
+    """Return ``skill`` pickled, or raise :class:`TypeError` if it cannot be shipped to a worker."""
+
+    try:
+        return pickle.dumps(skill)
+    except Exception as exc:
+        raise TypeError(
+            f"Skill '{skill.metadata.name}' cannot be pickled for process execution: {exc}. "
+            "Keep clients with locks, sockets or open files out of its state or "
+            "recreate them in __setstate__."
+        ) from exc
+
+
+class StorageServer:
+    """Serve the app's storages to worker processes over a local connection.
+
+    Every accepted connection is handled by its own thread, which resolves the
+    storage of the requested session and calls one of :data:`PROXIED_METHODS`.
+
+    Args:
+        resolve: Returns the storage of a session id (``None`` for shared storage).
+        address: Address to listen on. Port ``0`` picks a free port.
+    """
+
+    def __init__(self, resolve: StorageResolver, *, address: Address = ("127.0.0.1", 0)) -> None:
+        self._resolve = resolve
+        self.authkey = os.urandom(16)
+        self._listener = Listener(address, authkey=self.authkey)
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._accept, name="maf-storage-server", daemon=True)
+        self._thread.start()
+
+    @property
+    def address(self) -> Address:
+        return self._listener.address
+
+    def close(self) -> None:
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        try:
+            Client(self.address, authkey=self.authkey).close()
+        except OSError:
+            pass
+        self._thread.join()
+        self._listener.close()
+
+    def _accept(self) -> None:
+        while not self._closed.is_set():
+            try:
+                conn = self._listener.accept()
+            except (OSError, EOFError, multiprocessing.AuthenticationError):
+                continue
+            if self._closed.is_set():
+                conn.close()
+                break
+            threading.Thread(target=self._serve, args=(conn,), name="maf-storage-conn", daemon=True).start()
+
+    def _serve(self, conn: Connection) -> None:
+        with conn:
+            while True:
+                try:
+                    session_id, method, args = conn.recv()
+                except (EOFError, OSError):
+                    return
+                try:
+                    if method not in PROXIED_METHODS:
+                        raise AttributeError(f"Storage method '{method}' is not available to workers")
+                    reply: Tuple[bool, Any] = (True, getattr(self._resolve(session_id), method)(*args))
+                except Exception as exc:
+                    reply = (False, exc)
+                try:
+                    conn.send(reply)
+                except (pickle.PicklingError, TypeError, AttributeError) as exc:
+                    conn.send((False, RuntimeError(f"Cannot send result of '{method}' to worker: {exc}")))
+
+
+class ProxiedStorage(BaseStorage):
+    """Storage forwarding every call to a :class:`StorageServer`."""
+
+    def __init__(self, address: Address, authkey: bytes, session_id: Optional[str] = None) -> None:
+        self._address = address
+        self._authkey = authkey
+        self._session_id = session_id
+        self._conn: Optional[Connection] = None
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        return self._call("get", namespace, key)
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        self._call("set", namespace, key, value)
+
+    def set_many(self, namespace: str, values: Mapping[str, Any]) -> None:
+        self._call("set_many", namespace, dict(values))
+
+    def set_batch(self, values: Mapping[str, Mapping[str, Any]]) -> None:
+        self._call("set_batch", {namespace: dict(namespace_values) for namespace, namespace_values in values.items()})
+
+    def compare_and_set(self, namespace: str, key: str, expected: Any, value: Any) -> bool:
+        return self._call("compare_and_set", namespace, key, expected, value)
+
+    def update(self, namespace: str, key: str, fn: Callable[[Optional[Any]], Any]) -> Any:
+        """Atomically replace the value with ``fn(current)`` and return the new value.
+
+        Implemented as a retry loop over :meth:`get` and the parent storage's
+        :meth:`compare_and_set`, so ``fn`` need not be picklable but may run
+        more than once and must not have side effects.
+        """
+
+        while True:
+            current = self.get(namespace, key)
+            value = fn(current)
+            if current is None:
+                # A missing entry and a stored None both read as None.
+                if self.compare_and_set(namespace, key, MISSING, value) or self.compare_and_set(
+                    namespace, key, None, value
+                ):
+                    return value
+            elif self.compare_and_set(namespace, key, current, value):
+                return value
+
+    def dump_namespace(self, namespace: str) -> Dict[str, Any]:
+        return self._call("dump_namespace", namespace)
+
+    def extend(self, namespace: str, key: str, items: Iterable[Any]) -> None:
+        self._call("extend", namespace, key, list(items))
+
+    def read_range(self, namespace: str, key: str, start: int = 0, stop: Optional[int] = None) -> List[Any]:
+        return self._call("read_range", namespace, key, start, stop)
+
+    def length(self, namespace: str, key: str) -> int:
+        return self._call("length", namespace, key)
+
+    def _call(self, method: str, *args: Any) -> Any:
+        with self._lock:
+            if self._conn is None:
+                self._conn = Client(self._address, authkey=self._authkey)
+            self._conn.send((self._session_id, method, args))
+            ok, value = self._conn.recv()
+        if not ok:
+            raise value
+        return value
+
+
+# State of a worker process, set up once by ``_init_worker``.
+_worker_skills: Dict[str, BaseSkill] = {}
+_worker_storages: Dict[Optional[str], ProxiedStorage] = {}
+_worker_server: Tuple[Address, bytes] = (("", 0), b"")
+
+
+def _init_worker(skills: bytes, address: Address, authkey: bytes) -> None:
+    global _worker_server
+    _worker_skills.update(pickle.loads(skills))
+    _worker_server = (address, authkey)
+
+
+def _worker_ping() -> int:
+    return os.getpid()
+
+
+def _worker_invoke(name: str, message: str, session_id: Optional[str]) -> str:
+    storage = _worker_storages.get(session_id)
+    if storage is None:
+        address, authkey = _worker_server
+        storage = _worker_storages[session_id] = ProxiedStorage(address, authkey, session_id)
+    return _worker_skills[name].handle(message=message, storage=storage)
+
+
+class ProcessSkillPool:
+    """Warm pool of worker processes, each holding unpickled copies of ``skills``.
+
+    Skills access storage through a :class:`ProxiedStorage` connected to a
+    :class:`StorageServer` in the parent process, so all writes land in the
+    app's storage. State kept on the skill objects themselves (e.g. counters)
+    is per worker.
+
+    Args:
+        skills: Skills available in the workers, keyed by name.
+        resolve: Returns the storage of a session id.
+        max_workers: Number of worker processes. Defaults to the CPU count.
+        start_method: ``multiprocessing`` start method of the workers. ``spawn``
+            is the default because the parent runs threads.
+    """
+
+    def __init__(
+        self,
+        skills: Mapping[str, BaseSkill],
+        resolve: StorageResolver,
+        *,
+        max_workers: int | None = None,
+        start_method: str = "spawn",
+    ) -> None:
+        payload = pickle.dumps(dict(skills))
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._server = StorageServer(resolve)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_init_worker,
+            initargs=(payload, self._server.address, self._server.authkey),
+        )
+
+    def warm_up(self) -> None:
+        """Start all worker processes and wait until they have loaded the skills."""
+
+        wait([self._executor.submit(_worker_ping) for _ in range(self.max_workers)])
+
+    def submit(self, name: str, message: str, session_id: Optional[str] = None) -> Future[str]:
+        return self._executor.submit(_worker_invoke, name, message, session_id)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._server.close()
+
+
+__all__ = ["ProcessSkillPool", "ProxiedStorage", "StorageServer", "ensure_picklable"]
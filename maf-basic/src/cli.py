@@ -12,20 +12,23 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from maf_basic.app import AgentApp  # noqa: E402  (import after sys.path patch)
-from maf_basic.skills import (  # noqa: E402
-    EchoSkill,
-    ManagementSummarySkill,
-    WebSearchSkill,
-)
 
 
 def _setup_agent(*, websearch_max_results: int) -> AgentApp:
-    """Create and return an ``AgentApp`` with the default skills registered."""
+    """Create and return an ``AgentApp`` with the default skills registered.
+
+    Skills are registered lazily, so only the skill selected with ``--skill``
+    is imported when the first message arrives.
+    """
 
     app = AgentApp()
-    app.register_skill(EchoSkill())
-    app.register_skill(WebSearchSkill(max_results=websearch_max_results))
-    app.register_skill(ManagementSummarySkill())
+    app.register_lazy_skill("EchoSkill", "maf_basic.skills.echo:EchoSkill")
+    app.register_lazy_skill(
+        "WebSearchSkill",
+        "maf_basic.skills.web_search:WebSearchSkill",
+        max_results=websearch_max_results,
+    )
+    app.register_lazy_skill("ManagementSummarySkill", "maf_basic.skills.management_summary:ManagementSummarySkill")
     return app
 
 
@@ -89,12 +92,13 @@ def run_cli() -> None:
             break
 
         try:
-            response = app.invoke(args.skill, user_input)
+            lines = app.stream(args.skill, user_input)
         except KeyError as error:
             print(f"Fehler: {error}")
             continue
 
-        print(response)
+        for line in lines:
+            print(line, flush=True)
 
 
 if __name__ == "__main__":
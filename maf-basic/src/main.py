@@ -7,14 +7,16 @@ skill like handler that echoes incoming text back to the caller.
 
 from __future__ import annotations
 
-import asyncio
+import inspect
 import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict
 
-import yaml
-from dotenv import load_dotenv
-from maf.core import AgentApp  # type: ignore
+if TYPE_CHECKING:  # pragma: no cover - the framework is imported in create_app
+    from maf.core import AgentApp  # type: ignore
+
+# ``yaml``, ``dotenv`` and the agent framework are imported where they are
+# used, so importing this module stays cheap for short-lived invocations.
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 CONFIG_FILE = BASE_DIR / "config" / "settings.yaml"
@@ -27,6 +29,8 @@ def load_settings(config_path: Path) -> Dict[str, Any]:
     use of ``${VARNAME}`` placeholders in the configuration values.
     """
 
+    import yaml
+
     with config_path.open("r", encoding="utf-8") as fh:
         data = yaml.safe_load(fh) or {}
     return _expand_env_values(data)
@@ -62,7 +66,7 @@ async def _echo_skill(context: Any, *args: Any, **kwargs: Any) -> str:
     # Some framework contexts expose helper methods to send responses directly.
     if hasattr(context, "send_output") and callable(context.send_output):
         maybe_awaitable = context.send_output(message)
-        if asyncio.iscoroutine(maybe_awaitable):
+        if inspect.isawaitable(maybe_awaitable):
             await maybe_awaitable
         return message
 
@@ -117,6 +121,9 @@ def _register_echo_skill(app: AgentApp) -> None:
 def create_app() -> AgentApp:
     """Factory that prepares and returns a configured ``AgentApp`` instance."""
 
+    from dotenv import load_dotenv
+    from maf.core import AgentApp  # type: ignore
+
     load_dotenv(BASE_DIR / ".env")
     settings = load_settings(CONFIG_FILE)
 
@@ -0,0 +1,109 @@
+"""Tests for the asynchronous invocation path of the AgentApp."""
+
+from __future__ import annotations
+
+import asyncio
+import pathlib
+import sys
+import threading
+import time
+from typing import Any
+
+import pytest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from maf_basic.app import AgentApp
+from maf_basic.skills.base import AsyncSkill, BaseSkill, SkillMetadata
+from maf_basic.skills.echo import EchoSkill
+from maf_basic.storage.base import BaseStorage
+from maf_basic.storage.in_memory import InMemoryStorage
+
+
+class SlowSyncSkill(BaseSkill):
+    def __init__(self, delay: float) -> None:
+        super().__init__(SkillMetadata(name="SlowSync", description="Sleeps before answering."))
+        self._delay = delay
+        self.threads: set[str] = set()
+
+    def handle(self, message: str, storage: BaseStorage, **_: Any) -> str:
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self._delay)
+        return message.upper()
+
+
+class SlowAsyncSkill(AsyncSkill):
+    def __init__(self, delay: float) -> None:
+        super().__init__(SkillMetadata(name="SlowAsync", description="Awaits before answering."))
+        self._delay = delay
+
+    async def ahandle(self, message: str, storage: BaseStorage, **_: Any) -> str:
+        await asyncio.sleep(self._delay)
+        return message[::-1]
+
+
+def test_ainvoke_runs_sync_skill_in_worker_thread() -> None:
+    app = AgentApp(storage=InMemoryStorage())
+    app.register_skill(EchoSkill())
+
+    response = asyncio.run(app.ainvoke("EchoSkill", "hello"))
+
+    assert response == "hello"
+    assert EchoSkill().conversation_history(app.storage) == ["hello"]
+    app.close()
+
+
+def test_ainvoke_runs_sync_skills_concurrently() -> None:
+    app = AgentApp(storage=InMemoryStorage(), max_workers=8)
+    skill = SlowSyncSkill(delay=0.2)
+    app.register_skill(skill)
+
+    async def run() -> list[str]:
+        return await asyncio.gather(*(app.ainvoke("SlowSync", f"m{i}") for i in range(8)))
+
+    started = time.perf_counter()
+    responses = asyncio.run(run())
+    elapsed = time.perf_counter() - started
+
+    assert responses == [f"M{i}" for i in range(8)]
+    assert elapsed < 0.2 * 4
+    assert all(name.startswith("maf-skill") for name in skill.threads)
+    app.close()
+
+
+def test_ainvoke_awaits_native_async_skill() -> None:
+    app = AgentApp(storage=InMemoryStorage())
+    skill = SlowAsyncSkill(delay=0.01)
+    app.register_skill(skill)
+
+    assert skill.is_async
+    assert not EchoSkill().is_async
+    assert asyncio.run(app.ainvoke("SlowAsync", "abc")) == "cba"
+    assert skill.handle("xyz", app.storage) == "zyx"
+
+
+def test_invoke_async_skill_inside_running_loop() -> None:
+    app = AgentApp(storage=InMemoryStorage())
+    app.register_skill(SlowAsyncSkill(delay=0.01))
+
+    async def run() -> str:
+        # A synchronous helper called from a coroutine.
+        return app.invoke("SlowAsync", "abc")
+
+    assert asyncio.run(run()) == "cba"
+
+
+def test_ainvoke_times_out() -> None:
+    app = AgentApp(storage=InMemoryStorage(), timeout=0.05)
+    app.register_skill(SlowAsyncSkill(delay=1.0))
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(app.ainvoke("SlowAsync", "abc"))
+
+
+def test_ainvoke_unknown_skill_raises_error() -> None:
+    app = AgentApp(storage=InMemoryStorage())
+    with pytest.raises(KeyError):
+        asyncio.run(app.ainvoke("unknown", "hi"))
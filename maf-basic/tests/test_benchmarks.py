@@ -0,0 +1,67 @@
+"""Smoke tests for the benchmark suite."""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import sys
+
+import pytest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.__main__ import main
+from benchmarks.runner import BenchmarkResult, compare, load_results, measure
+from maf_basic.services.providers import SearchProviderError
+from maf_basic.services.synthetic import SyntheticSearchClient
+
+
+def test_measure_counts_rounds_and_ops() -> None:
+    calls = []
+
+    result = measure("noop", lambda: calls.append(1), ops=10, rounds=3, warmup=1)
+
+    assert len(calls) == 4
+    assert result.rounds == 3
+    assert result.ops_per_second > 0
+    assert result.as_dict()["name"] == "noop"
+
+
+def test_compare_scales_baseline_to_current_ops() -> None:
+    baseline = {"a": {"median_seconds": 1.0, "ops": 100}, "b": {"median_seconds": 1.0, "ops": 10}}
+    results = [
+        BenchmarkResult(name="a", ops=200, rounds=1, median_seconds=2.1, best_seconds=2.1),
+        BenchmarkResult(name="b", ops=10, rounds=1, median_seconds=1.5, best_seconds=1.5),
+        BenchmarkResult(name="new", ops=1, rounds=1, median_seconds=1.0, best_seconds=1.0),
+    ]
+
+    comparisons = {comparison.name: comparison for comparison in compare(results, baseline)}
+
+    assert set(comparisons) == {"a", "b"}
+    assert not comparisons["a"].is_regression(0.25)
+    assert comparisons["b"].is_regression(0.25)
+
+
+def test_runner_writes_results_and_baseline(tmp_path: pathlib.Path) -> None:
+    output = tmp_path / "latest.json"
+    baseline = tmp_path / "baseline.json"
+
+    assert main(["invoke", "--quick", "--output", str(output), "--baseline", str(baseline), "--save-baseline"]) == 0
+
+    document = json.loads(output.read_text(encoding="utf-8"))
+    assert document["quick"] is True
+    assert "invoke.app_invoke" in load_results(baseline)
+    assert main(["invoke", "--quick", "--output", str(output), "--baseline", str(baseline)]) == 0
+
+
+def test_synthetic_client_is_deterministic_and_can_fail() -> None:
+    client = SyntheticSearchClient(seed=1)
+    failing = SyntheticSearchClient(failure_rate=1.0)
+
+    assert client.search("Cloud Kosten", max_results=2) == client.search("Cloud Kosten", max_results=2)
+    assert client.search("Cloud Kosten", max_results=2)[1].url == "https://synthetic.example/cloud-kosten/2"
+    assert client.calls == 3
+    with pytest.raises(SearchProviderError):
+        failing.search("x")
@@ -0,0 +1,137 @@
+"""Tests for the quota-enforcing bounded storage."""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+from typing import Iterable
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from maf_basic.services.search import SearchResult
+from maf_basic.skills.management_summary import ManagementSummarySkill
+from maf_basic.skills.web_search import WebSearchSkill
+from maf_basic.storage.bounded import BoundedInMemoryStorage, NamespaceQuota, estimate_size
+from maf_basic.storage.factory import create_storage
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeSearchClient:
+    def search(self, query: str, *, max_results: int = 5) -> Iterable[SearchResult]:
+        return [SearchResult(title=query, url="https://example.com", snippet=f"About {query}.")]
+
+
+def test_least_recently_used_entries_are_evicted() -> None:
+    storage = BoundedInMemoryStorage({"web_search": NamespaceQuota(max_entries=2)})
+
+    storage.set("web_search", "a", 1)
+    storage.set("web_search", "b", 2)
+    storage.get("web_search", "a")
+    storage.set("web_search", "c", 3)
+
+    assert storage.dump_namespace("web_search") == {"a": 1, "c": 3}
+    assert storage.eviction_stats()["web_search"].evicted_entries == 1
+
+
+def test_byte_quota_is_enforced() -> None:
+    storage = BoundedInMemoryStorage(default_quota=NamespaceQuota(max_bytes=30))
+
+    for key in "abcde":
+        storage.set("ns", key, "x" * 10)
+
+    assert storage.namespace_bytes("ns") <= 30
+    assert storage.namespace_size("ns") == 2
+    assert storage.eviction_stats()["ns"].evicted_bytes == 36
+
+
+def test_entries_expire_after_ttl() -> None:
+    clock = FakeClock()
+    storage = BoundedInMemoryStorage({"ns": NamespaceQuota(ttl_seconds=5)}, clock=clock)
+    storage.set("ns", "a", 1)
+    storage.set("ns", "b", 2)
+
+    clock.now = 4
+    assert storage.get("ns", "a") == 1
+    clock.now = 5
+    assert storage.get("ns", "a") is None
+    assert storage.expire() == 1
+    assert storage.eviction_stats()["ns"].expired == 2
+
+
+def test_last_query_key_is_pinned() -> None:
+    storage = BoundedInMemoryStorage({WebSearchSkill.STORAGE_NAMESPACE: NamespaceQuota(max_entries=2)})
+    skill = WebSearchSkill(search_client=FakeSearchClient())
+
+    for index in range(5):
+        skill.handle(f"topic {index}", storage)
+
+    assert storage.get(WebSearchSkill.STORAGE_NAMESPACE, WebSearchSkill.LAST_QUERY_KEY) == "topic 4"
+    assert storage.namespace_size(WebSearchSkill.STORAGE_NAMESPACE) == 2
+    assert storage.get(WebSearchSkill.STORAGE_NAMESPACE, "topic 0") is None
+    assert "Management Summary zu 'topic 4'" in ManagementSummarySkill().handle("", storage)
+
+
+def test_explicit_pins_survive_eviction() -> None:
+    storage = BoundedInMemoryStorage({"ns": NamespaceQuota(max_entries=1)}, pinned=[("ns", "keep")])
+    storage.set("ns", "keep", "pinned")
+    storage.set("ns", "a", 1)
+    storage.set("ns", "b", 2)
+
+    assert storage.dump_namespace("ns") == {"b": 2, "keep": "pinned"}
+
+
+def test_append_respects_quota() -> None:
+    storage = BoundedInMemoryStorage({"echo": NamespaceQuota(max_entries=1)})
+    storage.append("echo", "history", "a")
+    storage.append("echo", "history", "b")
+
+    assert storage.read_range("echo", "history") == ["a", "b"]
+
+
+def test_append_to_large_list_keeps_byte_accounting() -> None:
+    sizes: list[int] = []
+
+    def sizer(value: object) -> int:
+        size = estimate_size(value)
+        sizes.append(size)
+        return size
+
+    storage = BoundedInMemoryStorage(default_quota=NamespaceQuota(max_bytes=1_000_000))
+    counting = BoundedInMemoryStorage(default_quota=NamespaceQuota(max_bytes=1_000_000), sizer=sizer)
+    storage.set("echo", "other", "x" * 100)
+    for index in range(5_000):
+        storage.append("echo", "history", f"message {index}")
+        counting.append("echo", "history", f"message {index}")
+    storage.extend("echo", "history", [])
+
+    history = storage.get("echo", "history")
+    assert len(history) == 5_000
+    assert storage.namespace_bytes("echo") == estimate_size(history) + estimate_size("x" * 100)
+    # Only the appended items are sized, never the whole list.
+    assert max(sizes) < 32
+
+
+def test_append_beyond_byte_quota_evicts_least_recently_used() -> None:
+    storage = BoundedInMemoryStorage(default_quota=NamespaceQuota(max_bytes=200))
+    storage.set("echo", "old", "x" * 100)
+    for index in range(20):
+        storage.append("echo", "history", f"message {index}")
+
+    assert storage.get("echo", "old") is None
+    assert storage.namespace_bytes("echo") == estimate_size(storage.get("echo", "history"))
+    assert storage.namespace_bytes("echo") <= 200
+
+
+def test_factory_creates_bounded_backend() -> None:
+    storage = create_storage({"backend": "bounded", "quotas": {"web_search": {"max_entries": 10}}})
+
+    assert isinstance(storage, BoundedInMemoryStorage)
@@ -0,0 +1,175 @@
+"""Tests for the lock-striped thread-safe storage."""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Mapping, Optional
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import pytest
+
+from maf_basic.app import AgentApp
+from maf_basic.instrumentation import Instrumentation, InstrumentedStorage
+from maf_basic.skills.echo import EchoSkill
+from maf_basic.storage.base import BaseStorage
+from maf_basic.storage.concurrent import MISSING, StripedInMemoryStorage
+from maf_basic.storage.factory import create_storage
+from maf_basic.storage.in_memory import InMemoryStorage
+from maf_basic.storage.indexed import IndexedStorage
+from maf_basic.storage.overlay import OverlayStorage
+
+
+def test_concurrent_echo_calls_keep_every_message() -> None:
+    app = AgentApp(storage=StripedInMemoryStorage())
+    app.register_skill(EchoSkill())
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(lambda index: app.invoke("EchoSkill", str(index)), range(2000)))
+
+    history = EchoSkill().conversation_history(app.storage)
+    assert sorted(history, key=int) == [str(index) for index in range(2000)]
+
+
+def test_update_is_atomic() -> None:
+    storage = StripedInMemoryStorage(stripes=4)
+
+    def increment(_: int) -> None:
+        storage.update("counters", "hits", lambda value: (value or 0) + 1)
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(increment, range(5000)))
+
+    assert storage.get("counters", "hits") == 5000
+
+
+def test_compare_and_set() -> None:
+    storage = StripedInMemoryStorage()
+
+    assert storage.compare_and_set("ns", "key", MISSING, 1)
+    assert not storage.compare_and_set("ns", "key", MISSING, 2)
+    assert not storage.compare_and_set("ns", "key", 5, 2)
+    assert storage.compare_and_set("ns", "key", 1, 2)
+    assert storage.get("ns", "key") == 2
+
+
+def test_compare_and_set_distinguishes_none_from_missing() -> None:
+    storage = StripedInMemoryStorage()
+    storage.set("ns", "key", None)
+
+    assert not storage.compare_and_set("ns", "key", MISSING, 1)
+    assert storage.compare_and_set("ns", "key", None, 1)
+
+
+class RecordingStorage(StripedInMemoryStorage):
+    def __init__(self) -> None:
+        super().__init__()
+        self.atomic_calls: list[str] = []
+        self.batches: list[Mapping[str, Mapping[str, Any]]] = []
+
+    def update(self, namespace: str, key: str, fn: Callable[[Optional[Any]], Any]) -> Any:
+        self.atomic_calls.append("update")
+        return super().update(namespace, key, fn)
+
+    def compare_and_set(self, namespace: str, key: str, expected: Any, value: Any) -> bool:
+        self.atomic_calls.append("compare_and_set")
+        return super().compare_and_set(namespace, key, expected, value)
+
+    def set_batch(self, values: Mapping[str, Mapping[str, Any]]) -> None:
+        self.batches.append(values)
+        super().set_batch(values)
+
+
+@pytest.mark.parametrize(
+    "wrap",
+    [
+        lambda inner: InstrumentedStorage(inner, Instrumentation()),
+        lambda inner: IndexedStorage(inner),
+        lambda inner: OverlayStorage(inner, write_through=True),
+    ],
+    ids=["instrumented", "indexed", "overlay"],
+)
+def test_wrappers_forward_atomic_operations(wrap: Callable[[BaseStorage], BaseStorage]) -> None:
+    inner = RecordingStorage()
+    storage: BaseStorage = wrap(inner)
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(lambda _: storage.update("counters", "hits", lambda value: (value or 0) + 1), range(2000)))
+    assert storage.compare_and_set("ns", "key", MISSING, 1)
+    assert not storage.compare_and_set("ns", "key", MISSING, 2)
+
+    assert inner.get("counters", "hits") == 2000
+    assert inner.atomic_calls.count("update") == 2000
+    assert inner.atomic_calls.count("compare_and_set") == 2
+
+    storage.set_batch({"a": {"x": [1]}, "b": {"y": 2}})
+    assert len(inner.batches) == 1
+    assert storage.get("a", "x") == [1]
+    assert inner.get("b", "y") == 2
+
+
+def test_default_atomic_operations() -> None:
+    storage = InMemoryStorage()
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(lambda _: storage.update("counters", "hits", lambda value: (value or 0) + 1), range(2000)))
+    assert storage.get("counters", "hits") == 2000
+    assert storage.compare_and_set("ns", "key", MISSING, 1)
+    assert not storage.compare_and_set("ns", "key", MISSING, 2)
+    assert not storage.compare_and_set("ns", "key", 5, 2)
+    assert storage.compare_and_set("ns", "key", 1, 2)
+
+
+def test_overlay_atomic_operations_see_layered_values() -> None:
+    base = StripedInMemoryStorage()
+    overlay = OverlayStorage(base)
+    overlay.set("ns", "key", 1)
+
+    assert overlay.update("ns", "key", lambda value: value + 1) == 2
+    assert overlay.compare_and_set("ns", "key", 2, 3)
+    assert overlay.get("ns", "key") == 3
+    assert base.get("ns", "key") is None
+
+
+def test_factory_creates_concurrent_backend() -> None:
+    assert isinstance(create_storage({"backend": "concurrent"}), StripedInMemoryStorage)
+
+
+def test_iteration_survives_concurrent_writers() -> None:
+    storage = StripedInMemoryStorage(stripes=8)
+    storage.set_many("ns", {f"key {index}": index for index in range(200)})
+
+    def write() -> None:
+        for index in range(200, 20000):
+            storage.set("ns", f"key {index}", index)
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    try:
+        while writer.is_alive():
+            seen = dict(storage.iter_namespace("ns"))
+            assert all(seen[f"key {index}"] == index for index in range(200))
+            view = storage.namespace_view("ns")
+            assert len(list(view)) >= 200
+            assert view["key 7"] == 7
+    finally:
+        writer.join()
+    assert len(dict(storage.iter_namespace("ns"))) == 20000
+
+
+def test_namespace_view_does_not_create_the_namespace() -> None:
+    storage = StripedInMemoryStorage()
+
+    view = storage.namespace_view("ns")
+
+    assert dict(view) == {}
+    assert "ns" not in storage._store
+    storage.set("ns", "a", 1)
+    assert dict(view) == {"a": 1}
+    with pytest.raises(KeyError):
+        view["b"]
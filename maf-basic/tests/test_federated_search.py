@@ -0,0 +1,132 @@
+"""Tests for federated search with hedged requests."""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+import time
+from typing import Iterable, Sequence
+
+import pytest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from maf_basic.services.federated import FederatedSearchClient, LatencyTracker, merge_results, normalize_url
+from maf_basic.services.providers import SearchProviderError
+from maf_basic.services.search import SearchResult
+from maf_basic.skills.web_search import WebSearchSkill
+from maf_basic.storage.in_memory import InMemoryStorage
+
+
+class DelayedClient:
+    def __init__(self, name: str, urls: Sequence[str], delay: float = 0.0, fail: bool = False) -> None:
+        self.name = name
+        self._urls = list(urls)
+        self._delay = delay
+        self._fail = fail
+        self.calls = 0
+
+    def search(self, query: str, *, max_results: int = 5) -> Iterable[SearchResult]:
+        self.calls += 1
+        time.sleep(self._delay)
+        if self._fail:
+            raise ConnectionError(f"{self.name} down")
+        return [SearchResult(title=f"{self.name} {url}", url=url, snippet="") for url in self._urls[:max_results]]
+
+
+def test_normalize_url_ignores_cosmetic_differences() -> None:
+    assert normalize_url("HTTP://www.Example.com/path/?utm_source=x&b=2&a=1#top") == normalize_url(
+        "https://example.com/path?a=1&b=2"
+    )
+    assert normalize_url("https://example.com/a") != normalize_url("https://example.com/b")
+
+
+def test_merge_results_deduplicates_and_ranks() -> None:
+    first = [SearchResult("A", "https://a.com", ""), SearchResult("B", "https://b.com", "")]
+    second = [SearchResult("B2", "https://www.b.com/", ""), SearchResult("C", "https://c.com", "")]
+
+    merged = merge_results([first, second], max_results=5)
+
+    assert [result.title for result in merged] == ["B", "A", "C"]
+
+
+def test_fast_primary_does_not_trigger_hedge() -> None:
+    primary = DelayedClient("primary", ["https://a.com"])
+    backup = DelayedClient("backup", ["https://b.com"])
+    client = FederatedSearchClient([primary, backup], hedge_delay=0.5)
+
+    results = list(client.search("KI"))
+
+    assert [result.url for result in results] == ["https://a.com"]
+    assert backup.calls == 0
+    assert client.hedges_sent == 0
+
+
+def test_slow_primary_is_hedged() -> None:
+    primary = DelayedClient("primary", ["https://a.com"], delay=1.0)
+    backup = DelayedClient("backup", ["https://b.com"])
+    client = FederatedSearchClient([primary, backup], hedge_delay=0.05)
+
+    started = time.perf_counter()
+    results = list(client.search("KI"))
+    elapsed = time.perf_counter() - started
+
+    assert [result.url for result in results] == ["https://b.com"]
+    assert elapsed < 0.5
+    assert client.hedges_sent == 1
+    assert client.fallbacks_sent == 0
+
+
+def test_failing_primary_falls_back_immediately() -> None:
+    primary = DelayedClient("primary", [], fail=True)
+    backup = DelayedClient("backup", ["https://b.com"])
+    client = FederatedSearchClient([primary, backup], hedge_delay=10)
+
+    started = time.perf_counter()
+    results = list(client.search("KI"))
+
+    assert results[0].url == "https://b.com"
+    assert time.perf_counter() - started < 1.0
+    assert client.hedges_sent == 0
+    assert client.fallbacks_sent == 1
+
+
+def test_all_providers_failing_raises() -> None:
+    client = FederatedSearchClient([DelayedClient("a", [], fail=True), DelayedClient("b", [], fail=True)])
+
+    with pytest.raises(SearchProviderError):
+        client.search("KI")
+
+
+def test_parallel_mode_merges_every_provider() -> None:
+    first = DelayedClient("first", ["https://a.com", "https://b.com"], delay=0.05)
+    second = DelayedClient("second", ["https://b.com", "https://c.com"])
+    client = FederatedSearchClient([first, second], hedged=False)
+
+    results = list(client.search("KI"))
+
+    assert [result.url for result in results] == ["https://b.com", "https://a.com", "https://c.com"]
+
+
+def test_hedge_delay_follows_primary_latency_percentile() -> None:
+    client = FederatedSearchClient([DelayedClient("a", ["https://a.com"])], min_samples=3, initial_hedge_delay=1.0)
+    assert client.current_hedge_delay() == 1.0
+
+    for _ in range(3):
+        client.search("KI")
+
+    assert client.current_hedge_delay() < 0.1
+
+    tracker = LatencyTracker()
+    for value in range(1, 101):
+        tracker.record(value / 100)
+    assert tracker.percentile(0.95) == 0.95
+
+
+def test_web_search_skill_accepts_federated_client() -> None:
+    client = FederatedSearchClient([DelayedClient("a", ["https://a.com"]), DelayedClient("b", ["https://b.com"])])
+    skill = WebSearchSkill(search_client=client)
+
+    assert "https://a.com" in skill.handle("KI", InMemoryStorage())
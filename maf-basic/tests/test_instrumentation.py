@@ -0,0 +1,130 @@
+"""Tests for latency histograms, counters and span hooks."""
+
+from __future__ import annotations
+
+import asyncio
+import pathlib
+import sys
+from typing import Any, Iterable, List
+
+import pytest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from maf_basic.app import AgentApp
+from maf_basic.instrumentation import Histogram, Instrumentation, InstrumentedSearchClient, Span
+from maf_basic.services.search import SearchResult
+from maf_basic.skills.base import BaseSkill, SkillMetadata
+from maf_basic.skills.echo import EchoSkill
+from maf_basic.skills.web_search import WebSearchSkill
+from maf_basic.storage.base import BaseStorage
+from maf_basic.storage.in_memory import InMemoryStorage
+
+
+class StaticSearchClient:
+    def search(self, query: str, *, max_results: int = 5) -> Iterable[SearchResult]:
+        return [SearchResult(title=f"{query} result", url="https://example.com", snippet="Text.")]
+
+
+class FailingSkill(BaseSkill):
+    def __init__(self) -> None:
+        super().__init__(SkillMetadata(name="Failing", description="Always fails."))
+
+    def handle(self, message: str, storage: BaseStorage, **_: Any) -> str:
+        raise RuntimeError(message)
+
+
+def test_histogram_percentiles_interpolate_within_buckets() -> None:
+    histogram = Histogram(buckets=(0.1, 0.2, 0.4))
+    for seconds in [0.05] * 50 + [0.15] * 45 + [0.3] * 4 + [2.0]:
+        histogram.observe(seconds)
+
+    assert histogram.count == 100
+    assert histogram.percentile(0.50) == pytest.approx(0.1)
+    assert 0.1 < histogram.percentile(0.95) <= 0.2
+    assert 0.2 < histogram.percentile(0.99) <= 0.4
+    assert histogram.percentile(1.0) == 2.0
+    assert histogram.cumulative_counts()[-1] == (float("inf"), 100)
+    assert Histogram().percentile(0.5) is None
+
+
+def test_app_records_skill_lookup_and_storage_operations() -> None:
+    instrumentation = Instrumentation()
+    app = AgentApp(storage=InMemoryStorage(), instrumentation=instrumentation)
+    app.register_skill(EchoSkill())
+
+    app.invoke("EchoSkill", "Hallo")
+    app.invoke("EchoSkill", "Welt", session_id="alice")
+    snapshot = instrumentation.snapshot()
+
+    assert snapshot["skill"]["EchoSkill"]["calls"] == 2
+    assert snapshot["skill"]["EchoSkill"]["p99"] is not None
+    assert snapshot["app"]["skill_lookup"]["calls"] == 2
+    assert snapshot["storage"]["extend"]["calls"] == 2
+    assert app.storage.get(EchoSkill.HISTORY_NAMESPACE, EchoSkill.HISTORY_KEY) == ["Hallo"]
+
+
+def test_errors_are_counted_and_reported_to_hooks() -> None:
+    instrumentation = Instrumentation()
+    started: List[Span] = []
+    ended: List[Span] = []
+    instrumentation.add_hook(on_start=started.append, on_end=ended.append)
+    app = AgentApp(instrumentation=instrumentation)
+    app.register_skill(FailingSkill())
+
+    with pytest.raises(RuntimeError):
+        app.invoke("Failing", "boom", session_id="bob")
+
+    assert instrumentation.errors("skill", "Failing") == 1
+    assert [span.kind for span in started] == ["skill"]
+    assert ended[0].attributes == {"session_id": "bob"}
+    assert isinstance(ended[0].error, RuntimeError)
+    assert ended[0].seconds is not None
+
+
+def test_ainvoke_is_timed() -> None:
+    instrumentation = Instrumentation()
+    app = AgentApp(instrumentation=instrumentation)
+    app.register_skill(EchoSkill())
+
+    assert asyncio.run(app.ainvoke("EchoSkill", "async")) == "async"
+    app.close()
+
+    assert instrumentation.histogram("skill", "EchoSkill").count == 1
+    assert instrumentation.histogram("storage", "extend").count == 1
+
+
+def test_search_client_wrapper_times_calls() -> None:
+    instrumentation = Instrumentation()
+    client = InstrumentedSearchClient(StaticSearchClient(), instrumentation)
+    skill = WebSearchSkill(search_client=client)
+
+    skill.handle("Cloud", InMemoryStorage())
+
+    assert not hasattr(client, "asearch")
+    assert instrumentation.histogram("search", "StaticSearchClient").count == 1
+
+
+def test_prometheus_export() -> None:
+    instrumentation = Instrumentation(buckets=(0.5, 1.0))
+    instrumentation.observe("skill", 'Echo "x"', 0.2)
+    instrumentation.observe("skill", 'Echo "x"', 2.0, error=True)
+
+    text = instrumentation.to_prometheus()
+
+    assert "# TYPE maf_skill_duration_seconds histogram" in text
+    assert 'maf_skill_duration_seconds_bucket{name="Echo \\"x\\"",le="0.5"} 1' in text
+    assert 'maf_skill_duration_seconds_bucket{name="Echo \\"x\\"",le="+Inf"} 2' in text
+    assert 'maf_skill_duration_seconds_count{name="Echo \\"x\\""} 2' in text
+    assert 'maf_skill_errors_total{name="Echo \\"x\\""} 1' in text
+    assert Instrumentation().to_prometheus() == ""
+
+
+def test_app_without_instrumentation_uses_plain_storage() -> None:
+    storage = InMemoryStorage()
+    app = AgentApp(storage=storage)
+
+    assert app.storage_for() is storage
+    assert app.instrumentation is None
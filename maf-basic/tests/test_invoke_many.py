@@ -0,0 +1,140 @@
+"""Tests for batched skill invocation through ``AgentApp.invoke_many``."""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+import threading
+import time
+from typing import Any, Iterable, Iterator
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from maf_basic.app import AgentApp
+from maf_basic.batch import InvokeRequest
+from maf_basic.services.search import SearchResult
+from maf_basic.skills.base import BaseSkill, SkillMetadata
+from maf_basic.skills.echo import EchoSkill
+from maf_basic.skills.management_summary import ManagementSummarySkill
+from maf_basic.skills.web_search import WebSearchSkill
+from maf_basic.storage.base import BaseStorage
+from maf_basic.storage.in_memory import InMemoryStorage
+
+
+class SlowSearchClient:
+    def search(self, query: str, *, max_results: int = 5) -> Iterable[SearchResult]:
+        time.sleep(0.05)
+        return [SearchResult(title=f"{query} result", url="https://example.com", snippet=f"About {query}.")]
+
+
+class SleepSkill(BaseSkill):
+    def __init__(self) -> None:
+        super().__init__(SkillMetadata(name="Sleep", description="Sleeps for the given seconds."))
+        self._lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def handle(self, message: str, storage: BaseStorage, **_: Any) -> str:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(float(message))
+        finally:
+            with self._lock:
+                self.active -= 1
+        return message
+
+
+def test_invoke_many_returns_results_in_input_order() -> None:
+    app = AgentApp(storage=InMemoryStorage())
+    app.register_skill(SleepSkill())
+
+    messages = ["0.05", "0.01", "0.03", "0"]
+    results = list(app.invoke_many(("Sleep", message) for message in messages))
+
+    assert [result.index for result in results] == [0, 1, 2, 3]
+    assert [result.response for result in results] == messages
+
+
+def test_invoke_many_unordered_yields_as_completed() -> None:
+    app = AgentApp(storage=InMemoryStorage())
+    app.register_skill(SleepSkill())
+
+    results = list(app.invoke_many([("Sleep", "0.2"), ("Sleep", "0")], ordered=False))
+
+    assert [result.response for result in results] == ["0", "0.2"]
+
+
+def test_invoke_many_respects_skill_limits() -> None:
+    app = AgentApp(storage=InMemoryStorage())
+    skill = SleepSkill()
+    app.register_skill(skill)
+
+    requests = [InvokeRequest("Sleep", "0.02", key=str(i)) for i in range(12)]
+    results = list(app.invoke_many(requests, max_workers=8, skill_limits={"Sleep": 2}))
+
+    assert all(result.ok for result in results)
+    assert skill.peak <= 2
+
+
+def test_invoke_many_orders_dependent_calls_on_same_topic() -> None:
+    app = AgentApp(storage=InMemoryStorage())
+    app.register_skill(WebSearchSkill(search_client=SlowSearchClient()))
+    app.register_skill(ManagementSummarySkill())
+
+    topics = [f"topic {i}" for i in range(5)]
+    requests = [InvokeRequest("WebSearchSkill", topic) for topic in topics]
+    requests += [InvokeRequest("ManagementSummarySkill", topic) for topic in topics]
+    results = list(app.invoke_many(requests, max_workers=10))
+
+    for result in results[len(topics):]:
+        assert result.response is not None
+        assert result.response.startswith("Management Summary zu")
+
+
+def test_invoke_many_summarises_last_query_after_its_search() -> None:
+    app = AgentApp(storage=InMemoryStorage())
+    app.register_skill(WebSearchSkill(search_client=SlowSearchClient()))
+    app.register_skill(ManagementSummarySkill())
+
+    requests = [
+        InvokeRequest("WebSearchSkill", "Cloud", session_id="alice"),
+        InvokeRequest("ManagementSummarySkill", "", session_id="alice"),
+        InvokeRequest("WebSearchSkill", "Edge", session_id="bob"),
+        InvokeRequest("ManagementSummarySkill", " ", session_id="bob"),
+    ]
+    results = list(app.invoke_many(requests, max_workers=4))
+
+    assert results[1].response == "Management Summary zu 'Cloud':\n- Cloud result: About Cloud."
+    assert results[3].response == "Management Summary zu 'Edge':\n- Edge result: About Edge."
+
+
+def test_invoke_many_reports_errors_without_aborting() -> None:
+    app = AgentApp(storage=InMemoryStorage())
+    app.register_skill(EchoSkill())
+
+    results = list(app.invoke_many([("EchoSkill", "a"), ("Missing", "b"), ("EchoSkill", "c")]))
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, KeyError)
+
+
+def test_invoke_many_consumes_input_lazily() -> None:
+    app = AgentApp(storage=InMemoryStorage())
+    app.register_skill(EchoSkill())
+    produced: list[int] = []
+
+    def requests() -> Iterator[tuple[str, str]]:
+        for index in range(1000):
+            produced.append(index)
+            yield ("EchoSkill", str(index))
+
+    stream = app.invoke_many(requests(), max_workers=2, max_in_flight=4)
+    first = next(stream)
+
+    assert first.response == "0"
+    assert len(produced) <= 5
+    stream.close()
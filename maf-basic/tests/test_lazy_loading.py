@@ -0,0 +1,135 @@
+"""Tests for lazy skill registration, warm-up and the import-time budget."""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import subprocess
+import sys
+from typing import List
+
+import pytest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from maf_basic.app import AgentApp
+from maf_basic.services.search import SearchResult
+from maf_basic.skills.echo import EchoSkill
+from maf_basic.skills.web_search import WebSearchSkill
+
+# Generous upper bound for ``import maf_basic`` plus creating an app, measured
+# inside a fresh interpreter. Locally this takes a few tens of milliseconds.
+IMPORT_BUDGET_SECONDS = 1.0
+
+# Modules that must not be loaded until a skill or feature needs them: skill
+# implementations, search providers, worker processes, network clients and the
+# storage backends selected by ``AgentApp.from_settings``.
+DEFERRED_MODULES = (
+    "multiprocessing",
+    "http.client",
+    "maf_basic.workers",
+    "maf_basic.skills.echo",
+    "maf_basic.skills.web_search",
+    "maf_basic.skills.management_summary",
+    "maf_basic.services.providers",
+    "maf_basic.storage.factory",
+    "maf_basic.storage.local",
+)
+
+
+class WarmableClient:
+    def __init__(self) -> None:
+        self.warmed = 0
+
+    def warm_up(self) -> None:
+        self.warmed += 1
+
+    def search(self, query: str, *, max_results: int = 5) -> List[SearchResult]:
+        return [SearchResult(title=query, url="https://example.org", snippet="")]
+
+
+def test_lazy_skill_is_instantiated_on_first_invoke() -> None:
+    app = AgentApp()
+    app.register_lazy_skill("EchoSkill", "maf_basic.skills.echo:EchoSkill")
+
+    assert not app.is_loaded("EchoSkill")
+    assert app.execution_mode("EchoSkill") == "inline"
+    assert app.invoke("EchoSkill", "Hallo") == "Hallo"
+    assert app.is_loaded("EchoSkill")
+    assert isinstance(app.get_skill("EchoSkill"), EchoSkill)
+    assert app.get_skill("EchoSkill") is app.get_skill("EchoSkill")
+
+
+def test_lazy_skill_receives_keyword_arguments() -> None:
+    app = AgentApp()
+    app.register_lazy_skill(
+        "WebSearchSkill",
+        "maf_basic.skills.web_search.WebSearchSkill",
+        search_client=WarmableClient(),
+        max_results=1,
+    )
+
+    assert "KI" in app.invoke("WebSearchSkill", "KI")
+
+
+def test_register_skill_replaces_lazy_registration() -> None:
+    app = AgentApp()
+    app.register_lazy_skill("EchoSkill", "maf_basic.skills.does_not_exist:EchoSkill")
+    skill = EchoSkill()
+    app.register_skill(skill)
+
+    assert app.get_skill("EchoSkill") is skill
+
+
+def test_lazy_skill_errors() -> None:
+    app = AgentApp()
+    app.register_lazy_skill("Missing", "maf_basic.skills.does_not_exist:Skill")
+    app.register_lazy_skill("WrongName", "maf_basic.skills.echo:EchoSkill")
+    app.register_lazy_skill("NotASkill", "maf_basic.storage.in_memory:InMemoryStorage")
+
+    with pytest.raises(ImportError):
+        app.invoke("Missing", "x")
+    with pytest.raises(ValueError):
+        app.invoke("WrongName", "x")
+    with pytest.raises(TypeError):
+        app.invoke("NotASkill", "x")
+    with pytest.raises(ValueError):
+        app.register_lazy_skill("EchoSkill", "maf_basic.skills.echo:EchoSkill", execution="remote")
+    with pytest.raises(KeyError):
+        app.invoke("Unknown", "x")
+
+
+def test_warm_up_instantiates_skills_and_resolves_clients() -> None:
+    client = WarmableClient()
+    app = AgentApp()
+    app.register_lazy_skill("EchoSkill", "maf_basic.skills.echo:EchoSkill")
+    app.register_skill(WebSearchSkill(search_client=client))
+
+    app.warm_up(["WebSearchSkill"])
+    assert client.warmed == 1
+    assert not app.is_loaded("EchoSkill")
+
+    app.warm_up()
+    assert client.warmed == 2
+    assert app.is_loaded("EchoSkill")
+
+
+def test_import_time_budget() -> None:
+    script = f"""
+import json, sys, time
+started = time.perf_counter()
+import maf_basic
+app = maf_basic.AgentApp()
+app.register_lazy_skill("EchoSkill", "maf_basic.skills.echo:EchoSkill")
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {list(DEFERRED_MODULES)!r} if m in sys.modules]}}))
+"""
+    completed = subprocess.run(
+        [sys.executable, "-c", script], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+    report = json.loads(completed.stdout)
+
+    assert report["loaded"] == []
+    assert report["seconds"] < IMPORT_BUDGET_SECONDS
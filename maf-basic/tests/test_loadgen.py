@@ -0,0 +1,88 @@
+"""Tests for the load generator replaying traffic against an ``AgentApp``."""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import sys
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.loadgen import TraceEvent, build_app, main, read_trace, replay, synthesize_trace, write_trace
+
+
+def test_synthetic_trace_is_reproducible_and_ordered() -> None:
+    first = synthesize_trace(sessions=5, duration_seconds=10, think_time_seconds=1, seed=3)
+    second = synthesize_trace(sessions=5, duration_seconds=10, think_time_seconds=1, seed=3)
+
+    assert first == second
+    assert [event.timestamp for event in first] == sorted(event.timestamp for event in first)
+    assert {event.skill for event in first} <= {"EchoSkill", "WebSearchSkill", "ManagementSummarySkill"}
+    assert all(0 <= event.timestamp < 10 for event in first)
+
+
+def test_summaries_follow_the_session_search_topic() -> None:
+    events = synthesize_trace(sessions=3, duration_seconds=20, think_time_seconds=1, seed=5)
+    last_topic = {}
+    for event in events:
+        if event.skill == "WebSearchSkill":
+            last_topic[event.session] = event.message
+        elif event.skill == "ManagementSummarySkill" and event.session in last_topic:
+            assert event.message == last_topic[event.session]
+
+
+def test_trace_round_trip(tmp_path: pathlib.Path) -> None:
+    events = [
+        TraceEvent(timestamp=0.5, session=None, skill="EchoSkill", message="b"),
+        TraceEvent(timestamp=0.1, session="s", skill="EchoSkill", message="a"),
+    ]
+    path = tmp_path / "trace.jsonl"
+
+    write_trace(events, path)
+
+    assert read_trace(path) == sorted(events, key=lambda event: event.timestamp)
+
+
+def test_replay_reports_latencies_and_storage_growth() -> None:
+    app = build_app(search_latency=0.0, seed=0)
+    events = [
+        TraceEvent(timestamp=0.0, session="alice", skill="WebSearchSkill", message="Cloud"),
+        TraceEvent(timestamp=0.01, session="alice", skill="EchoSkill", message="Hallo"),
+        TraceEvent(timestamp=0.02, session=None, skill="EchoSkill", message="Welt"),
+        TraceEvent(timestamp=0.03, session="bob", skill="Unknown", message="x"),
+    ]
+
+    report = replay(app, events, speed=1.0, max_workers=1, sample_interval=10.0)
+
+    assert report.requests == 4
+    assert report.errors == 1
+    assert report.error_types == {"KeyError": 1}
+    assert report.latencies["EchoSkill"]["calls"] == 2
+    assert report.samples[-1].completed == 4
+    # Search results plus the last query of alice and both echo histories.
+    assert report.samples[-1].keys == 4
+    assert report.samples[-1].bytes > 0
+    assert report.elapsed_seconds >= 0.03
+
+
+def test_main_writes_report(tmp_path: pathlib.Path) -> None:
+    report_path = tmp_path / "report.json"
+
+    status = main(
+        [
+            "--sessions", "3",
+            "--duration", "2",
+            "--speed", "0",
+            "--search-latency", "0",
+            "--seed", "1",
+            "--report", str(report_path),
+        ]
+    )
+
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert status == 0
+    assert report["requests"] > 0
+    assert report["errors"] == 0
+    assert report["throughput"] > 0
@@ -0,0 +1,96 @@
+"""Tests for the local BM25 index over stored search results."""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+from typing import Iterable
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from maf_basic.services.local_index import LocalSearchClient, SearchIndex
+from maf_basic.services.search import SearchResult
+from maf_basic.skills.management_summary import ManagementSummarySkill
+from maf_basic.skills.web_search import WebSearchSkill
+from maf_basic.storage.in_memory import InMemoryStorage
+from maf_basic.storage.indexed import IndexedStorage
+
+
+class FakeSearchClient:
+    def __init__(self, results: Iterable[SearchResult]) -> None:
+        self._results = list(results)
+
+    def search(self, query: str, *, max_results: int = 5) -> Iterable[SearchResult]:
+        return self._results[:max_results]
+
+
+def _entry(title: str, url: str, snippet: str) -> dict[str, str]:
+    return {"title": title, "url": url, "snippet": snippet}
+
+
+def test_bm25_ranks_more_relevant_documents_first() -> None:
+    index = SearchIndex()
+    index.add(
+        "q",
+        [
+            _entry("Cloud Kosten", "https://a.com", "Kosten der Cloud senken"),
+            _entry("KI Trends 2024", "https://b.com", "Die wichtigsten KI Trends und KI Agenten"),
+            _entry("KI im Mittelstand", "https://c.com", "Wie der Mittelstand KI nutzt"),
+        ],
+    )
+
+    hits = index.search("KI Trends")
+
+    assert [result.url for _, result in hits] == ["https://b.com", "https://c.com"]
+    assert hits[0][0] > hits[1][0]
+
+
+def test_storage_writes_update_index_incrementally() -> None:
+    storage = IndexedStorage(InMemoryStorage())
+
+    storage.set("web_search", "KI", [_entry("KI Trends", "https://b.com", "")])
+    storage.append("web_search", "KI", _entry("Agenten", "https://d.com", "KI Agenten"))
+    storage.set("web_search", "__last_query__", "KI")
+    storage.set("echo", "history", [_entry("KI", "https://x.com", "")])
+
+    assert len(storage.index) == 2
+
+    storage.set("web_search", "KI", [_entry("Quanten", "https://q.com", "")])
+
+    assert len(storage.index) == 1
+    assert storage.index.search("KI") == []
+
+
+def test_existing_entries_are_indexed_on_wrap() -> None:
+    inner = InMemoryStorage()
+    inner.set("web_search", "KI", [_entry("KI Trends", "https://b.com", "")])
+
+    storage = IndexedStorage(inner)
+
+    assert [result.url for result in LocalSearchClient(storage.index).search("trends")] == ["https://b.com"]
+
+
+def test_duplicate_urls_are_returned_once() -> None:
+    storage = IndexedStorage(InMemoryStorage())
+    storage.set("web_search", "KI", [_entry("KI Trends", "https://b.com", "")])
+    storage.set("web_search", "KI 2024", [_entry("KI Trends", "https://www.b.com/", "")])
+
+    assert len(list(LocalSearchClient(storage.index).search("KI Trends"))) == 1
+
+
+def test_web_search_results_serve_related_summary_offline() -> None:
+    storage = IndexedStorage(InMemoryStorage())
+    search = WebSearchSkill(
+        search_client=FakeSearchClient(
+            [SearchResult(title="KI Trend Report", url="https://beispiel.de/report", snippet="Überblick zu KI Trends.")]
+        )
+    )
+    search.handle("Aktuelle KI Trends", storage)
+
+    summary = ManagementSummarySkill(fallback_client=LocalSearchClient(storage.index))
+    response = summary.handle("KI Trends 2025", storage)
+
+    assert "Management Summary zu 'KI Trends 2025'" in response
+    assert "KI Trend Report" in response
@@ -0,0 +1,117 @@
+"""Tests for the durable append-only log storage."""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+
+import pytest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from maf_basic.app import AgentApp
+from maf_basic.skills.echo import EchoSkill
+from maf_basic.storage.factory import create_storage
+from maf_basic.storage.in_memory import InMemoryStorage
+from maf_basic.storage.local import LocalFileStorage
+
+
+def test_values_survive_restart(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "data" / "storage.json"
+    storage = LocalFileStorage(path)
+    storage.set("web_search", "KI", [{"title": "Result 1", "url": "", "snippet": ""}])
+    storage.set("web_search", "__last_query__", "KI")
+    storage.close()
+
+    reopened = LocalFileStorage(path)
+
+    assert reopened.get("web_search", "KI") == [{"title": "Result 1", "url": "", "snippet": ""}]
+    assert reopened.dump_namespace("web_search")["__last_query__"] == "KI"
+
+
+def test_writes_append_instead_of_rewriting(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "storage.json"
+    storage = LocalFileStorage(path)
+    storage.set("ns", "a", 1)
+    size_after_first = path.stat().st_size
+    storage.set("ns", "b", 2)
+
+    assert path.read_text(encoding="utf-8").count("\n") == 2
+    assert path.stat().st_size > size_after_first
+
+
+def test_torn_last_record_is_discarded(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "storage.json"
+    storage = LocalFileStorage(path)
+    storage.set("ns", "a", 1)
+    storage.close()
+    with path.open("a", encoding="utf-8") as fh:
+        fh.write('{"op":"set","ns":"ns","key":"b","val')
+
+    reopened = LocalFileStorage(path)
+    reopened.set("ns", "c", 3)
+    reopened.close()
+
+    assert LocalFileStorage(path).dump_namespace("ns") == {"a": 1, "c": 3}
+
+
+def test_compaction_keeps_one_record_per_key(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "storage.json"
+    storage = LocalFileStorage(path, compact_ratio=2, compact_min_bytes=256)
+    for value in range(25):
+        storage.set("ns", "counter", value)
+    storage.set("ns", "other", "x")
+    storage.compact()
+    storage.close()
+
+    assert path.read_text(encoding="utf-8").count("\n") == 2
+    assert not (tmp_path / "storage.json.compact").exists()
+    assert LocalFileStorage(path).dump_namespace("ns") == {"counter": 24, "other": "x"}
+
+
+def test_reopening_does_not_compact_on_first_write(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "storage.jsonl"
+    storage = LocalFileStorage(path, compact_min_bytes=256)
+    for index in range(20):
+        storage.set("ns", f"key {index}", index)
+    storage.close()
+    size = path.stat().st_size
+    assert size > 256
+
+    reopened = LocalFileStorage(path, compact_min_bytes=256)
+    reopened.set("ns", "key 0", "neu")
+    reopened.close()
+
+    assert path.read_text(encoding="utf-8").count("\n") == 21
+    assert path.stat().st_size > size
+
+
+def test_unserialisable_values_are_rejected_without_side_effects(tmp_path: pathlib.Path) -> None:
+    storage = LocalFileStorage(tmp_path / "storage.json")
+
+    with pytest.raises(TypeError):
+        storage.set("ns", "a", object())
+
+    assert storage.get("ns", "a") is None
+
+
+def test_create_storage_from_settings(tmp_path: pathlib.Path) -> None:
+    settings = {"storage": {"default": {"backend": "local", "path": "./data/storage.json"}}}
+
+    app = AgentApp.from_settings(settings, base_dir=tmp_path)
+    app.register_skill(EchoSkill())
+    app.invoke("EchoSkill", "persist me")
+
+    assert isinstance(app.storage, LocalFileStorage)
+    assert app.storage.path == tmp_path / "data" / "storage.json"
+    assert EchoSkill().conversation_history(LocalFileStorage(app.storage.path)) == ["persist me"]
+    assert isinstance(create_storage({"backend": "memory"}), InMemoryStorage)
+
+
+def test_create_storage_rejects_unresolved_path() -> None:
+    with pytest.raises(ValueError):
+        create_storage({"backend": "local", "path": "${STORAGE_PATH}"})
+    with pytest.raises(ValueError):
+        create_storage({"backend": "redis"})
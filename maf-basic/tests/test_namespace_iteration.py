@@ -0,0 +1,80 @@
+"""Tests for lazy namespace iteration and read-only namespace views."""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+
+import pytest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from maf_basic.storage.base import BaseStorage
+from maf_basic.storage.bounded import BoundedInMemoryStorage, NamespaceQuota
+from maf_basic.storage.concurrent import StripedInMemoryStorage
+from maf_basic.storage.in_memory import InMemoryStorage
+from maf_basic.storage.local import LocalFileStorage
+
+
+@pytest.fixture(params=["memory", "striped", "local", "bounded"])
+def storage(request: pytest.FixtureRequest, tmp_path: pathlib.Path) -> BaseStorage:
+    if request.param == "memory":
+        return InMemoryStorage()
+    if request.param == "striped":
+        return StripedInMemoryStorage()
+    if request.param == "local":
+        return LocalFileStorage(tmp_path / "storage.json")
+    return BoundedInMemoryStorage()
+
+
+def test_iter_namespace_filters_by_prefix(storage: BaseStorage) -> None:
+    storage.set("web_search", "ki trends", [1])
+    storage.set("web_search", "ki agents", [2])
+    storage.set("web_search", "cloud", [3])
+    storage.set("other", "ki", [4])
+
+    assert dict(storage.iter_namespace("web_search")) == {"ki trends": [1], "ki agents": [2], "cloud": [3]}
+    assert dict(storage.iter_namespace("web_search", prefix="ki ")) == {"ki trends": [1], "ki agents": [2]}
+    assert list(storage.iter_namespace("missing")) == []
+
+
+def test_iter_namespace_does_not_copy_values(storage: BaseStorage) -> None:
+    value = [{"title": "Result"}]
+    storage.set("web_search", "ki", value)
+
+    (_, yielded), = storage.iter_namespace("web_search")
+
+    if not isinstance(storage, LocalFileStorage):
+        assert yielded is value
+
+
+def test_namespace_view_is_live_and_read_only(storage: BaseStorage) -> None:
+    view = storage.namespace_view("web_search")
+    storage.set("web_search", "ki", [1])
+
+    assert view["ki"] == [1]
+    assert len(view) == 1
+    with pytest.raises(TypeError):
+        view["other"] = [2]  # type: ignore[index]
+
+
+def test_bounded_iteration_skips_expired_entries_and_keeps_lru_order() -> None:
+    now = [0.0]
+    storage = BoundedInMemoryStorage(
+        {"ns": NamespaceQuota(max_entries=2, ttl_seconds=10)}, clock=lambda: now[0]
+    )
+    storage.set("ns", "old", 1)
+    now[0] = 5
+    storage.set("ns", "new", 2)
+    storage.set("ns", "__meta__", "pinned")
+
+    assert dict(storage.iter_namespace("ns")) == {"old": 1, "new": 2, "__meta__": "pinned"}
+
+    now[0] = 8
+    storage.set("ns", "newest", 3)
+    assert "old" not in storage.namespace_view("ns")
+
+    now[0] = 15.5
+    assert dict(storage.iter_namespace("ns")) == {"newest": 3, "__meta__": "pinned"}
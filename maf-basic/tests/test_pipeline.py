@@ -0,0 +1,222 @@
+"""Tests for skill pipelines run through ``AgentApp.run_pipeline``."""
+
+from __future__ import annotations
+
+import pathlib
+import pickle
+import sys
+import time
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple
+
+import pytest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from maf_basic.app import AgentApp
+from maf_basic.pipeline import Pipeline, Stage
+from maf_basic.services.search import SearchResult
+from maf_basic.services.result_set import ResultSet
+from maf_basic.skills.base import BaseSkill, SkillMetadata, SkillResponse
+from maf_basic.skills.management_summary import ManagementSummarySkill
+from maf_basic.skills.web_search import WebSearchSkill
+from maf_basic.storage.base import BaseStorage
+from maf_basic.storage.in_memory import InMemoryStorage
+from maf_basic.storage.overlay import OverlayStorage
+
+
+class StaticSearchClient:
+    def search(self, query: str, *, max_results: int = 5) -> Iterable[SearchResult]:
+        return [SearchResult(title=f"{query} result", url="https://example.com", snippet=f"About {query}.")]
+
+
+class JoinSkill(BaseSkill):
+    """Sleeps briefly and joins its inputs, or upper-cases the message without inputs."""
+
+    def __init__(self, name: str = "Join", *, delay: float = 0.0, fail: bool = False) -> None:
+        super().__init__(SkillMetadata(name=name, description="Joins stage inputs."))
+        self._delay = delay
+        self._fail = fail
+
+    def handle(self, message: str, storage: BaseStorage, **kwargs: Any) -> str:
+        time.sleep(self._delay)
+        if self._fail:
+            raise RuntimeError("stage failed")
+        inputs: Mapping[str, str] = kwargs.get("inputs") or {}
+        if not inputs:
+            return message.upper()
+        return "+".join(inputs[name] for name in sorted(inputs))
+
+
+class WriteOnlySearchStorage(InMemoryStorage):
+    """Storage failing every read of stored search results."""
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        self._check(namespace)
+        return super().get(namespace, key)
+
+    def dump_namespace(self, namespace: str) -> Dict[str, Any]:
+        self._check(namespace)
+        return super().dump_namespace(namespace)
+
+    def iter_namespace(self, namespace: str, prefix: Optional[str] = None) -> Iterator[Tuple[str, Any]]:
+        self._check(namespace)
+        return super().iter_namespace(namespace, prefix)
+
+    def namespace_view(self, namespace: str) -> Mapping[str, Any]:
+        self._check(namespace)
+        return super().namespace_view(namespace)
+
+    @staticmethod
+    def _check(namespace: str) -> None:
+        if namespace == WebSearchSkill.STORAGE_NAMESPACE:
+            raise AssertionError("search results must be passed in memory")
+
+
+def _search_app(storage: BaseStorage) -> AgentApp:
+    app = AgentApp(storage=storage)
+    app.register_skill(WebSearchSkill(search_client=StaticSearchClient()))
+    app.register_skill(ManagementSummarySkill())
+    return app
+
+
+def test_pipeline_passes_outputs_to_dependent_stages() -> None:
+    app = AgentApp()
+    app.register_skill(JoinSkill())
+
+    result = app.run_pipeline(
+        [
+            Stage("a", "Join"),
+            Stage("b", "Join", message=lambda message, _: message + "!"),
+            Stage("joined", "Join", inputs=("a", "b")),
+        ],
+        "hi",
+    )
+
+    assert result.ok
+    assert result["joined"] == "HI+HI!"
+
+
+def test_independent_stages_run_concurrently() -> None:
+    app = AgentApp()
+    app.register_skill(JoinSkill("Slow", delay=0.1))
+    app.register_skill(JoinSkill())
+    stages = [Stage(f"branch {index}", "Slow") for index in range(4)]
+    stages.append(Stage("joined", "Join", inputs=[stage.name for stage in stages]))
+
+    started = time.perf_counter()
+    result = app.run_pipeline(stages, "x")
+
+    assert time.perf_counter() - started < 0.3
+    assert result["joined"] == "+".join(["X"] * 4)
+
+
+def test_transient_stage_writes_are_visible_downstream_only() -> None:
+    storage = InMemoryStorage()
+    app = _search_app(storage)
+
+    result = app.run_pipeline(
+        [
+            Stage("search", "WebSearchSkill", store=False),
+            Stage("summary", "ManagementSummarySkill", inputs=("search",)),
+        ],
+        "Cloud",
+    )
+
+    assert "Cloud result" in result["summary"]
+    assert storage.get(WebSearchSkill.STORAGE_NAMESPACE, "Cloud") is None
+    assert storage.get(ManagementSummarySkill.STORAGE_NAMESPACE, "Cloud") is not None
+
+
+def test_summary_stage_uses_upstream_results_instead_of_storage() -> None:
+    storage = WriteOnlySearchStorage()
+    app = _search_app(storage)
+
+    result = app.run_pipeline(
+        [
+            Stage("search", "WebSearchSkill"),
+            Stage("summary", "ManagementSummarySkill", inputs=("search",)),
+        ],
+        "Cloud",
+    )
+
+    assert result.ok, result.errors
+    assert result["summary"] == "Management Summary zu 'Cloud':\n- Cloud result: About Cloud."
+    assert isinstance(result["search"], SkillResponse)
+    assert isinstance(result["search"].data, ResultSet)
+
+
+def test_search_response_carries_results() -> None:
+    skill = WebSearchSkill(search_client=StaticSearchClient())
+
+    response = skill.handle("Cloud", InMemoryStorage())
+
+    assert response.startswith("Suchergebnisse für 'Cloud':")
+    assert [entry["title"] for entry in response.data] == ["Cloud result"]
+    restored = pickle.loads(pickle.dumps(response))
+    assert restored == response
+    assert [entry["url"] for entry in restored.data] == ["https://example.com"]
+
+
+def test_stored_stage_writes_are_committed() -> None:
+    storage = InMemoryStorage()
+    app = _search_app(storage)
+
+    app.run_pipeline([Stage("search", "WebSearchSkill")], "Cloud")
+
+    assert storage.get(WebSearchSkill.STORAGE_NAMESPACE, "Cloud")[0]["title"] == "Cloud result"
+
+
+def test_failed_stage_skips_dependents() -> None:
+    app = AgentApp()
+    app.register_skill(JoinSkill())
+    app.register_skill(JoinSkill("Broken", fail=True))
+
+    result = app.run_pipeline(
+        [
+            Stage("ok", "Join"),
+            Stage("broken", "Broken"),
+            Stage("after", "Join", inputs=("broken",)),
+            Stage("last", "Join", inputs=("after", "ok")),
+        ],
+        "x",
+    )
+
+    assert not result.ok
+    assert result.outputs == {"ok": "X"}
+    assert isinstance(result.errors["broken"], RuntimeError)
+    assert sorted(result.skipped) == ["after", "last"]
+
+
+def test_pipeline_validation() -> None:
+    with pytest.raises(ValueError):
+        Pipeline([Stage("a", "Join"), Stage("a", "Join")])
+    with pytest.raises(ValueError):
+        Pipeline([Stage("a", "Join", inputs=("missing",))])
+    with pytest.raises(ValueError):
+        Pipeline([Stage("a", "Join", inputs=("b",)), Stage("b", "Join", inputs=("a",))])
+    with pytest.raises(KeyError):
+        AgentApp().run_pipeline([Stage("a", "Unknown")], "x")
+
+    pipeline = Pipeline([Stage("c", "Join", inputs=("a", "b")), Stage("b", "Join", inputs=("a",)), Stage("a", "Join")])
+    assert [stage.name for stage in pipeline.stages] == ["a", "b", "c"]
+
+
+def test_overlay_storage_shadows_and_writes_through() -> None:
+    base = InMemoryStorage()
+    base.set("ns", "a", [1])
+    overlay = OverlayStorage(base)
+    committed = overlay.sibling(write_through=True)
+
+    overlay.extend("ns", "a", [2])
+    overlay.set("ns", "b", "transient")
+
+    assert base.get("ns", "a") == [1]
+    assert committed.get("ns", "a") == [1, 2]
+    assert dict(overlay.iter_namespace("ns")) == {"a": [1, 2], "b": "transient"}
+
+    committed.extend("ns", "a", [3])
+
+    assert base.get("ns", "a") == [1, 2, 3]
+    assert overlay.get("ns", "a") == [1, 2, 3]
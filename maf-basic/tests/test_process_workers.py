@@ -0,0 +1,180 @@
+"""Tests for per-skill execution modes and the process worker pool."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import pathlib
+import sys
+import threading
+import time
+from typing import Any
+
+import pytest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from maf_basic.app import AgentApp
+from maf_basic.services.result_set import ResultSet
+from maf_basic.skills.base import BaseSkill, SkillMetadata
+from maf_basic.skills.echo import EchoSkill
+from maf_basic.skills.management_summary import ManagementSummarySkill
+from maf_basic.skills.web_search import WebSearchSkill
+from maf_basic.storage.base import MISSING, BaseStorage
+from maf_basic.storage.concurrent import StripedInMemoryStorage
+from maf_basic.storage.in_memory import InMemoryStorage
+from maf_basic.workers import ProxiedStorage, StorageServer
+
+
+class WhereSkill(BaseSkill):
+    """Reports the process and thread it runs in after burning some CPU."""
+
+    def __init__(self) -> None:
+        super().__init__(SkillMetadata(name="Where", description="Reports where it runs."))
+
+    def handle(self, message: str, storage: BaseStorage, **_: Any) -> str:
+        deadline = time.perf_counter() + float(message or 0)
+        while time.perf_counter() < deadline:
+            pass
+        return f"{os.getpid()}:{threading.get_ident()}"
+
+
+class CounterSkill(BaseSkill):
+    """Increments a shared counter ``message`` times."""
+
+    def __init__(self) -> None:
+        super().__init__(SkillMetadata(name="Counter", description="Increments a counter."))
+
+    def handle(self, message: str, storage: BaseStorage, **_: Any) -> str:
+        for _ in range(int(message)):
+            storage.update("counters", "hits", lambda value: (value or 0) + 1)
+        return f"{os.getpid()}"
+
+
+class LockedSkill(WhereSkill):
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = threading.Lock()
+
+
+@pytest.fixture
+def process_app() -> Any:
+    app = AgentApp(storage=InMemoryStorage(), process_workers=2)
+    app.register_skill(WhereSkill(), execution="process")
+    app.register_skill(EchoSkill(), execution="process")
+    app.register_skill(ManagementSummarySkill(), execution="process")
+    yield app
+    app.close()
+
+
+def test_execution_modes_select_where_skills_run() -> None:
+    app = AgentApp()
+    app.register_skill(WhereSkill())
+    inline = app.invoke("Where", "0")
+    app.register_skill(WhereSkill(), execution="thread")
+    threaded = app.invoke("Where", "0")
+    app.close()
+
+    assert inline == f"{os.getpid()}:{threading.get_ident()}"
+    assert threaded.startswith(f"{os.getpid()}:") and threaded != inline
+    assert app.execution_mode("Where") == "thread"
+
+
+def test_register_skill_validates_execution() -> None:
+    app = AgentApp()
+    with pytest.raises(ValueError):
+        app.register_skill(WhereSkill(), execution="gpu")
+    with pytest.raises(TypeError):
+        app.register_skill(LockedSkill(), execution="process")
+
+
+def test_process_skills_use_the_app_storage(process_app: AgentApp) -> None:
+    process_app.invoke("EchoSkill", "Hallo")
+    process_app.invoke("EchoSkill", "Welt", session_id="alice")
+
+    assert EchoSkill().conversation_history(process_app.storage) == ["Hallo"]
+    assert EchoSkill().conversation_history(process_app.storage_for("alice")) == ["Welt"]
+
+
+def test_process_summary_reads_results_stored_in_parent(process_app: AgentApp) -> None:
+    process_app.storage.set(
+        WebSearchSkill.STORAGE_NAMESPACE,
+        "Cloud",
+        ResultSet([{"title": "Cloud result", "url": "https://example.com", "snippet": "About cloud."}]),
+    )
+
+    summary = process_app.invoke("ManagementSummarySkill", "Cloud")
+
+    assert "Cloud result" in summary
+    assert process_app.storage.get(ManagementSummarySkill.STORAGE_NAMESPACE, "Cloud") == summary.splitlines()
+
+
+def test_process_skills_spread_over_workers(process_app: AgentApp) -> None:
+    process_app.start_workers()
+
+    results = list(process_app.invoke_many([("Where", "0.2")] * 4, max_workers=4))
+    pids = {result.response.split(":")[0] for result in results}
+
+    assert all(result.ok for result in results)
+    assert len(pids) == 2
+    assert str(os.getpid()) not in pids
+
+
+def test_process_skills_support_async_and_streaming(process_app: AgentApp) -> None:
+    response = asyncio.run(process_app.ainvoke("EchoSkill", "async"))
+
+    assert response == "async"
+    assert list(process_app.stream("EchoSkill", "stream")) == ["stream"]
+
+
+def test_proxied_storage_round_trip() -> None:
+    storage = InMemoryStorage()
+    server = StorageServer(lambda session_id: storage)
+    try:
+        proxy = ProxiedStorage(server.address, server.authkey)
+        proxy.set("ns", "a", 1)
+        proxy.set_many("ns", {"b": 2})
+        proxy.set_batch({"other": {"c": 3}})
+        proxy.extend("ns", "items", ["x", "y"])
+
+        assert storage.dump_namespace("ns") == {"a": 1, "b": 2, "items": ["x", "y"]}
+        assert storage.get("other", "c") == 3
+        assert proxy.read_range("ns", "items", 1) == ["y"]
+        assert dict(proxy.iter_namespace("ns", "i")) == {"items": ["x", "y"]}
+        with pytest.raises(TypeError):
+            proxy.extend("ns", "a", ["z"])
+    finally:
+        server.close()
+
+
+def test_process_skills_update_atomically_across_workers() -> None:
+    storage = StripedInMemoryStorage()
+    app = AgentApp(storage=storage, process_workers=2)
+    app.register_skill(CounterSkill(), execution="process")
+    try:
+        app.start_workers()
+        results = list(app.invoke_many([("Counter", "0" * index + "200") for index in range(4)], max_workers=4))
+    finally:
+        app.close()
+
+    assert all(result.ok for result in results)
+    assert len({result.response for result in results}) == 2
+    assert storage.get("counters", "hits") == 800
+
+
+def test_proxied_compare_and_set_keeps_missing_sentinel() -> None:
+    storage = StripedInMemoryStorage()
+    server = StorageServer(lambda session_id: storage)
+    try:
+        proxy = ProxiedStorage(server.address, server.authkey)
+
+        assert proxy.compare_and_set("ns", "key", MISSING, 1)
+        assert not proxy.compare_and_set("ns", "key", MISSING, 2)
+        assert proxy.compare_and_set("ns", "key", 1, 3)
+        assert proxy.update("ns", "key", lambda value: value + 1) == 4
+        assert proxy.update("ns", "other", lambda value: [value]) == [None]
+        assert storage.get("ns", "key") == 4
+    finally:
+        server.close()
@@ -0,0 +1,127 @@
+"""Tests for the compact column-oriented result set."""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+import threading
+import tracemalloc
+from typing import Any, Callable, Iterable
+
+import pytest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from maf_basic.services.result_set import ResultSet
+from maf_basic.services.search import SearchResult
+from maf_basic.skills.management_summary import ManagementSummarySkill
+from maf_basic.skills.web_search import WebSearchSkill
+from maf_basic.storage.bounded import estimate_size
+from maf_basic.storage.in_memory import InMemoryStorage
+from maf_basic.storage.local import LocalFileStorage
+
+ENTRIES = [
+    {"title": "Result 1", "url": "https://example.com/1", "snippet": "First finding about AI."},
+    {"title": "Result 2", "url": "https://example.com/2", "snippet": "Second finding about AI."},
+]
+
+
+class FakeSearchClient:
+    def search(self, query: str, *, max_results: int = 5) -> Iterable[SearchResult]:
+        return [SearchResult(**entry) for entry in ENTRIES][:max_results]
+
+
+def test_result_set_behaves_like_list_of_dicts() -> None:
+    results = ResultSet(ENTRIES)
+
+    assert results == ENTRIES
+    assert ENTRIES == results
+    assert len(results) == 2
+    assert results[0]["title"] == "Result 1"
+    assert results[-1].get("url") == "https://example.com/2"
+    assert results[0].get("missing", "default") == "default"
+    assert dict(results[1]) == ENTRIES[1]
+    assert results[:1] == ENTRIES[:1]
+    assert isinstance(results[:1], ResultSet)
+    with pytest.raises(IndexError):
+        results[5]
+
+
+def test_result_set_accepts_search_results_and_interns_urls() -> None:
+    results = ResultSet([SearchResult(title="T", url="https://example.com/" + "x", snippet="S")])
+    results.append({"title": "T", "url": "https://example.com/x", "snippet": "S2"})
+
+    assert results.urls()[0] is results.urls()[1]
+    assert [result.snippet for result in results.results()] == ["S", "S2"]
+
+
+def test_web_search_skill_stores_result_set_read_by_summary() -> None:
+    storage = InMemoryStorage()
+    WebSearchSkill(search_client=FakeSearchClient()).handle("KI", storage)
+
+    stored = storage.get(WebSearchSkill.STORAGE_NAMESPACE, "KI")
+
+    assert isinstance(stored, ResultSet)
+    assert stored == ENTRIES
+    assert "- Result 2: Second finding about AI." in ManagementSummarySkill().handle("KI", storage)
+
+
+def test_result_set_is_serialised_as_plain_json(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "storage.json"
+    storage = LocalFileStorage(path)
+    WebSearchSkill(search_client=FakeSearchClient()).handle("KI", storage)
+    storage.close()
+
+    assert LocalFileStorage(path).get(WebSearchSkill.STORAGE_NAMESPACE, "KI") == ENTRIES
+    assert estimate_size(ResultSet(ENTRIES)) == estimate_size(ENTRIES)
+
+
+def _allocated(build: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        value = build()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del value
+    return size
+
+
+def test_result_set_uses_less_memory_than_dicts() -> None:
+    results = [
+        SearchResult(title=f"Title {i % 50}", url=f"https://example.com/{i % 50}", snippet=f"Snippet {i}")
+        for i in range(5000)
+    ]
+
+    as_dicts = _allocated(lambda: [result.as_dict() for result in results])
+    as_columns = _allocated(lambda: ResultSet(results))
+
+    assert as_columns * 3 < as_dicts
+
+
+def test_appends_are_published_whole_to_concurrent_readers() -> None:
+    results = ResultSet()
+    errors: list[BaseException] = []
+
+    def append() -> None:
+        for index in range(20000):
+            results.append({"title": f"T{index}", "url": f"https://example.com/{index}", "snippet": f"S{index}"})
+
+    writer = threading.Thread(target=append)
+    writer.start()
+    try:
+        while writer.is_alive():
+            try:
+                if len(results):
+                    assert results[-1]["snippet"].startswith("S")
+                assert all(entry["snippet"] for entry in results[-50:])
+            except IndexError as exc:
+                errors.append(exc)
+                break
+    finally:
+        writer.join()
+
+    assert errors == []
+    assert len(results) == len(results.as_dicts()) == 20000
@@ -0,0 +1,102 @@
+"""Tests for the caching search client wrapper."""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+from typing import Iterable
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from maf_basic.services.cache import CachingSearchClient
+from maf_basic.services.search import SearchResult
+from maf_basic.skills.web_search import WebSearchSkill
+from maf_basic.storage.in_memory import InMemoryStorage
+
+
+class CountingSearchClient:
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+
+    def search(self, query: str, *, max_results: int = 5) -> Iterable[SearchResult]:
+        self.queries.append(query)
+        return [SearchResult(title=f"{query} {i}", url=f"https://example.com/{i}", snippet="") for i in range(max_results)]
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_hits_on_normalised_query() -> None:
+    inner = CountingSearchClient()
+    client = CachingSearchClient(inner)
+
+    first = list(client.search("KI  Trends", max_results=2))
+    second = list(client.search(" ki trends ", max_results=2))
+
+    assert first == second
+    assert inner.queries == ["KI  Trends"]
+    assert (client.stats.hits, client.stats.misses) == (1, 1)
+
+
+def test_cache_keys_on_max_results() -> None:
+    inner = CountingSearchClient()
+    client = CachingSearchClient(inner)
+
+    client.search("KI", max_results=2)
+    client.search("KI", max_results=3)
+
+    assert len(inner.queries) == 2
+
+
+def test_cache_entries_expire_after_ttl() -> None:
+    inner = CountingSearchClient()
+    clock = FakeClock()
+    client = CachingSearchClient(inner, ttl_seconds=10, clock=clock)
+
+    client.search("KI")
+    clock.now = 9.9
+    client.search("KI")
+    clock.now = 10.0
+    client.search("KI")
+
+    assert len(inner.queries) == 2
+    assert client.stats.expirations == 1
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    inner = CountingSearchClient()
+    client = CachingSearchClient(inner, max_entries=2)
+
+    client.search("a")
+    client.search("b")
+    client.search("a")
+    client.search("c")
+    client.search("a")
+    client.search("b")
+
+    assert inner.queries == ["a", "b", "c", "b"]
+    assert client.stats.evictions == 2
+    assert len(client) == 2
+
+
+def test_web_search_skill_uses_cache_and_still_stores_results() -> None:
+    inner = CountingSearchClient()
+    skill = WebSearchSkill(search_client=CachingSearchClient(inner), max_results=1)
+    storage = InMemoryStorage()
+
+    skill.handle("KI", storage)
+    storage.set(WebSearchSkill.STORAGE_NAMESPACE, "KI", [])
+    response = skill.handle("KI", storage)
+
+    assert inner.queries == ["KI"]
+    assert "KI 0" in response
+    assert storage.get(WebSearchSkill.STORAGE_NAMESPACE, "KI") == [
+        {"title": "KI 0", "url": "https://example.com/0", "snippet": ""}
+    ]
@@ -0,0 +1,123 @@
+"""Tests for single-flight coalescing of identical search requests."""
+
+from __future__ import annotations
+
+import asyncio
+import pathlib
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
+import pytest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from maf_basic.app import AgentApp
+from maf_basic.services.coalescing import CoalescingSearchClient
+from maf_basic.services.search import SearchResult
+from maf_basic.skills.web_search import WebSearchSkill
+from maf_basic.storage.in_memory import InMemoryStorage
+
+
+class SlowSearchClient:
+    def __init__(self, delay: float = 0.1, fail: bool = False) -> None:
+        self._delay = delay
+        self._fail = fail
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def search(self, query: str, *, max_results: int = 5) -> Iterable[SearchResult]:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self._delay)
+        if self._fail:
+            raise ConnectionError("provider down")
+        return [SearchResult(title=query, url="https://example.com", snippet="")]
+
+
+def test_concurrent_thread_callers_share_one_call() -> None:
+    inner = SlowSearchClient()
+    client = CoalescingSearchClient(inner)
+
+    with ThreadPoolExecutor(max_workers=10) as pool:
+        results = list(pool.map(lambda _: list(client.search("Trend")), range(10)))
+
+    assert inner.calls == 1
+    assert all(result == results[0] for result in results)
+    assert client.stats.coalesced == 9
+
+
+def test_sequential_calls_are_not_coalesced() -> None:
+    inner = SlowSearchClient(delay=0)
+    client = CoalescingSearchClient(inner)
+
+    client.search("Trend")
+    client.search("Trend")
+
+    assert inner.calls == 2
+
+
+def test_errors_are_propagated_to_all_waiters() -> None:
+    client = CoalescingSearchClient(SlowSearchClient(fail=True))
+
+    def call() -> BaseException | None:
+        try:
+            client.search("Trend")
+        except ConnectionError as exc:
+            return exc
+        return None
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        errors = list(pool.map(lambda _: call(), range(4)))
+
+    assert all(isinstance(error, ConnectionError) for error in errors)
+
+
+def test_async_and_thread_callers_share_one_call() -> None:
+    inner = SlowSearchClient(delay=0.2)
+    client = CoalescingSearchClient(inner)
+
+    async def run() -> list[object]:
+        thread_call = asyncio.to_thread(client.search, "Trend")
+        return await asyncio.gather(thread_call, *(client.asearch("trend") for _ in range(20)))
+
+    results = asyncio.run(run())
+
+    assert inner.calls == 1
+    assert len(results) == 21
+
+
+def test_cancelled_async_caller_does_not_cancel_others() -> None:
+    inner = SlowSearchClient(delay=0.1)
+    client = CoalescingSearchClient(inner)
+
+    async def run() -> object:
+        first = asyncio.ensure_future(client.asearch("Trend"))
+        second = asyncio.ensure_future(client.asearch("Trend"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(run())[0].title == "Trend"
+
+
+def test_web_search_skill_uses_async_client_natively() -> None:
+    inner = SlowSearchClient(delay=0.1)
+    skill = WebSearchSkill(search_client=CoalescingSearchClient(inner))
+    app = AgentApp(storage=InMemoryStorage())
+    app.register_skill(skill)
+
+    async def run() -> list[str]:
+        return await asyncio.gather(*(app.ainvoke("WebSearchSkill", "Trend") for _ in range(50)))
+
+    responses = asyncio.run(run())
+
+    assert skill.is_async
+    assert inner.calls == 1
+    assert all("Suchergebnisse für 'Trend'" in response for response in responses)
@@ -0,0 +1,198 @@
+"""Tests for the pooled search provider clients against a local stub server."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import pathlib
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator, List
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from maf_basic.app import AgentApp
+from maf_basic.services.providers import (
+    DuckDuckGoSearchClient,
+    HttpSearchClient,
+    RetryPolicy,
+    SearchProviderError,
+    http_client_from_settings,
+)
+from maf_basic.services.synthetic import SyntheticSearchClient
+from maf_basic.skills.management_summary import ManagementSummarySkill
+from maf_basic.skills.web_search import WebSearchSkill
+from maf_basic.storage.in_memory import InMemoryStorage
+
+NO_WAIT = RetryPolicy(attempts=3, backoff_seconds=0)
+
+
+class StubSearchServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.connections = 0
+        self.failures_left = 0
+        self.status = 200
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    wbufsize = -1
+    server: StubSearchServer
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self) -> None:  # noqa: N802 - required by BaseHTTPRequestHandler
+        params = parse_qs(urlsplit(self.path).query)
+        with self.server.lock:
+            failing = self.server.failures_left > 0
+            self.server.failures_left -= 1 if failing else 0
+        status = 503 if failing else self.server.status
+        query = params["q"][0]
+        count = int(params["max_results"][0])
+        body = json.dumps(
+            [{"title": f"{query} {i}", "href": f"https://example.com/{i}", "body": "Text"} for i in range(count)]
+        ).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_: Any) -> None:
+        pass
+
+
+@pytest.fixture()
+def server() -> Iterator[StubSearchServer]:
+    stub = StubSearchServer()
+    thread = threading.Thread(target=stub.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield stub
+    stub.shutdown()
+    stub.server_close()
+
+
+def test_http_client_parses_results(server: StubSearchServer) -> None:
+    client = HttpSearchClient(server.base_url, retry=NO_WAIT)
+
+    results = list(client.search("KI Trends", max_results=2))
+
+    assert [result.title for result in results] == ["KI Trends 0", "KI Trends 1"]
+    assert results[0].url == "https://example.com/0"
+    assert results[0].snippet == "Text"
+
+
+def test_http_client_reuses_connections(server: StubSearchServer) -> None:
+    client = HttpSearchClient(server.base_url, retry=NO_WAIT)
+
+    for index in range(10):
+        client.search(f"q{index}")
+
+    assert server.connections == 1
+    assert client.connections_created == 1
+
+
+def test_http_client_limits_connections(server: StubSearchServer) -> None:
+    client = HttpSearchClient(server.base_url, max_connections=2, retry=NO_WAIT)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda index: client.search(f"q{index}"), range(40)))
+
+    assert client.connections_created <= 2
+
+
+def test_http_client_retries_server_errors(server: StubSearchServer) -> None:
+    server.failures_left = 2
+    client = HttpSearchClient(server.base_url, retry=NO_WAIT)
+
+    assert len(list(client.search("KI"))) == 5
+
+
+def test_http_client_gives_up_after_retries(server: StubSearchServer) -> None:
+    server.failures_left = 5
+    client = HttpSearchClient(server.base_url, retry=NO_WAIT)
+
+    with pytest.raises(SearchProviderError):
+        client.search("KI")
+
+
+def test_http_client_does_not_retry_client_errors(server: StubSearchServer) -> None:
+    server.status = 404
+    client = HttpSearchClient(server.base_url, retry=NO_WAIT)
+
+    with pytest.raises(SearchProviderError):
+        client.search("KI")
+
+
+def test_shared_client_across_skills(server: StubSearchServer) -> None:
+    client = http_client_from_settings({"connections": {"default": {"base_url": server.base_url}}}, retry=NO_WAIT)
+    first = WebSearchSkill(search_client=client)
+    second = WebSearchSkill(search_client=client, max_results=1)
+
+    first.handle("KI", InMemoryStorage())
+    second.handle("Cloud", InMemoryStorage())
+
+    assert server.connections == 1
+
+
+def test_web_search_skill_reports_provider_failure(server: StubSearchServer) -> None:
+    server.failures_left = 5
+    skill = WebSearchSkill(search_client=HttpSearchClient(server.base_url, retry=NO_WAIT))
+
+    assert "nicht erreichbar" in skill.handle("KI", InMemoryStorage())
+
+
+def test_web_search_skill_reports_async_provider_failure() -> None:
+    app = AgentApp()
+    app.register_skill(WebSearchSkill(search_client=SyntheticSearchClient(failure_rate=1.0)))
+
+    async def stream() -> List[str]:
+        return [line async for line in app.astream("WebSearchSkill", "KI")]
+
+    assert app.invoke("WebSearchSkill", "KI") == "Synthetic search failure"
+    assert asyncio.run(app.ainvoke("WebSearchSkill", "KI")) == "Synthetic search failure"
+    assert asyncio.run(stream()) == ["Synthetic search failure"]
+
+
+def test_summary_skill_survives_fallback_provider_failure() -> None:
+    skill = ManagementSummarySkill(fallback_client=SyntheticSearchClient(failure_rate=1.0))
+
+    response = skill.handle("KI", InMemoryStorage())
+
+    assert response.startswith("Keine gespeicherten Suchergebnisse für 'KI' gefunden.")
+
+
+def test_duckduckgo_client_reuses_sessions() -> None:
+    created: List[object] = []
+
+    class FakeDDGS:
+        def __init__(self) -> None:
+            created.append(self)
+
+        def text(self, query: str, max_results: int = 5) -> list[dict[str, str]]:
+            return [{"title": query, "href": "https://example.com", "body": "Text"}][:max_results]
+
+    client = DuckDuckGoSearchClient(factory=FakeDDGS, retry=NO_WAIT)
+    for _ in range(5):
+        results = list(client.search("KI"))
+
+    assert len(created) == 1
+    assert results[0].url == "https://example.com"
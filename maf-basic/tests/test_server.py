@@ -0,0 +1,349 @@
+"""Tests for the HTTP serving mode against a server on localhost."""
+
+from __future__ import annotations
+
+import asyncio
+import http.client
+import json
+import pathlib
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pytest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from maf_basic.app import AgentApp
+from maf_basic.instrumentation import Instrumentation
+from maf_basic.server import AgentServer
+from maf_basic.services.search import SearchResult
+from maf_basic.skills.base import BaseSkill, SkillMetadata
+from maf_basic.skills.echo import EchoSkill
+from maf_basic.skills.management_summary import ManagementSummarySkill
+from maf_basic.skills.web_search import WebSearchSkill
+from maf_basic.storage.base import BaseStorage
+
+
+class GateSkill(BaseSkill):
+    """Skill blocking until the test opens its gate, counting concurrent calls."""
+
+    def __init__(self, name: str = "Gate") -> None:
+        super().__init__(SkillMetadata(name=name, description="Waits for the gate."))
+        self.gate = threading.Event()
+        self.started = threading.Semaphore(0)
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def handle(self, message: str, storage: BaseStorage, **_: Any) -> str:
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        self.started.release()
+        try:
+            self.gate.wait(timeout=10)
+            return f"done {message}"
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+class LinesSkill(BaseSkill):
+    def __init__(self) -> None:
+        super().__init__(SkillMetadata(name="Lines", description="Streams three lines."))
+
+    def handle(self, message: str, storage: BaseStorage, **_: Any) -> str:
+        return "\n".join(self.handle_stream(message, storage))
+
+    def handle_stream(self, message: str, storage: BaseStorage, **_: Any) -> Iterator[str]:
+        for index in range(3):
+            yield f"{message} {index}"
+
+
+class SlowLinesSkill(BaseSkill):
+    def __init__(self) -> None:
+        super().__init__(SkillMetadata(name="SlowLines", description="Streams one line, then stalls."))
+
+    def handle(self, message: str, storage: BaseStorage, **_: Any) -> str:
+        return "\n".join(self.handle_stream(message, storage))
+
+    def handle_stream(self, message: str, storage: BaseStorage, **_: Any) -> Iterator[str]:
+        yield "erste Zeile"
+        time.sleep(1.0)
+        yield "zu spät"
+
+
+class SlowSearchClient:
+    def search(self, query: str, *, max_results: int = 5) -> List[SearchResult]:
+        time.sleep(0.05)
+        return [SearchResult(title=f"{query} result", url="https://example.com", snippet="")]
+
+
+class FailingSkill(BaseSkill):
+    def __init__(self) -> None:
+        super().__init__(SkillMetadata(name="Failing", description="Always fails."))
+
+    def handle(self, message: str, storage: BaseStorage, **_: Any) -> str:
+        raise RuntimeError("kaputt")
+
+
+class RunningServer:
+    def __init__(self, server: AgentServer, loop: asyncio.AbstractEventLoop) -> None:
+        self.server = server
+        self.loop = loop
+
+    def request(
+        self, method: str, path: str, body: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        conn = http.client.HTTPConnection("127.0.0.1", self.server.port, timeout=10)
+        try:
+            payload = json.dumps(body).encode("utf-8") if body is not None else None
+            conn.request(method, path, body=payload, headers={"Content-Type": "application/json"})
+            response = conn.getresponse()
+            return response.status, dict(response.getheaders()), response.read()
+        finally:
+            conn.close()
+
+    def post(self, path: str, body: Dict[str, Any]) -> Tuple[int, Any]:
+        status, _, data = self.request("POST", path, body)
+        return status, json.loads(data)
+
+    def shutdown(self, timeout: float = 10.0) -> "asyncio.Future[None]":
+        return asyncio.run_coroutine_threadsafe(self.server.shutdown(timeout), self.loop)
+
+
+@contextmanager
+def running_server(app: AgentApp, **kwargs: Any) -> Iterator[RunningServer]:
+    started = threading.Event()
+    holder: Dict[str, Any] = {}
+
+    async def main() -> None:
+        server = AgentServer(app, port=0, **kwargs)
+        await server.start()
+        holder["running"] = RunningServer(server, asyncio.get_running_loop())
+        started.set()
+        await server.serve_forever()
+
+    thread = threading.Thread(target=asyncio.run, args=(main(),), daemon=True)
+    thread.start()
+    assert started.wait(timeout=10)
+    running: RunningServer = holder["running"]
+    try:
+        yield running
+    finally:
+        if not running.server.draining:
+            running.shutdown().result(timeout=15)
+        thread.join(timeout=15)
+        app.close()
+
+
+def make_app(*skills: BaseSkill) -> AgentApp:
+    app = AgentApp(max_workers=16)
+    for skill in skills or (EchoSkill(),):
+        app.register_skill(skill)
+    return app
+
+
+def test_invoke_and_errors() -> None:
+    app = make_app(EchoSkill(), FailingSkill())
+    with running_server(app) as running:
+        assert running.post("/invoke", {"skill": "EchoSkill", "message": "Hallo"}) == (200, {"response": "Hallo"})
+
+        status, body = running.post("/invoke", {"skill": "Unknown", "message": "x"})
+        assert status == 404
+        status, body = running.post("/invoke", {"skill": "EchoSkill"})
+        assert status == 400
+        status, body = running.post("/invoke", {"skill": "Failing", "message": "x"})
+        assert status == 500
+        assert "kaputt" in body["error"]
+        status, _, _ = running.request("GET", "/invoke")
+        assert status == 405
+        status, _, _ = running.request("GET", "/nowhere")
+        assert status == 404
+
+
+def test_sessions_are_isolated() -> None:
+    app = make_app()
+    with running_server(app) as running:
+        running.post("/invoke", {"skill": "EchoSkill", "message": "a", "session_id": "s1"})
+        running.post("/invoke", {"skill": "EchoSkill", "message": "b", "session_id": "s2"})
+
+    assert EchoSkill().conversation_history(app.storage_for("s1")) == ["a"]
+    assert EchoSkill().conversation_history(app.storage_for("s2")) == ["b"]
+
+
+def test_invoke_many_returns_results_in_order() -> None:
+    app = make_app(EchoSkill(), FailingSkill())
+    requests = [{"skill": "EchoSkill", "message": f"m{index}"} for index in range(5)]
+    requests.insert(2, {"skill": "Failing", "message": "x"})
+    with running_server(app) as running:
+        status, body = running.post("/invoke_many", {"requests": requests})
+
+    assert status == 200
+    results: List[Dict[str, Any]] = body["results"]
+    assert [result["index"] for result in results] == list(range(6))
+    assert [result["ok"] for result in results] == [True, True, False, True, True, True]
+    assert results[0]["response"] == "m0"
+    assert "kaputt" in results[2]["error"]
+
+
+def test_invoke_many_summarises_last_query_after_its_search() -> None:
+    app = make_app(WebSearchSkill(search_client=SlowSearchClient()), ManagementSummarySkill())
+    requests = [
+        {"skill": "WebSearchSkill", "message": "Cloud", "session_id": "s1"},
+        {"skill": "ManagementSummarySkill", "message": "", "session_id": "s1"},
+    ]
+    with running_server(app) as running:
+        status, body = running.post("/invoke_many", {"requests": requests})
+
+    assert status == 200
+    assert body["results"][1]["response"].startswith("Management Summary zu 'Cloud'")
+
+
+def test_invoke_many_rejects_oversized_batches() -> None:
+    with running_server(make_app(), max_batch_size=2) as running:
+        requests = [{"skill": "EchoSkill", "message": "x"}] * 3
+        status, _ = running.post("/invoke_many", {"requests": requests})
+    assert status == 413
+
+
+def test_stream_sends_lines_as_ndjson() -> None:
+    with running_server(make_app(LinesSkill())) as running:
+        status, headers, data = running.request("POST", "/stream", {"skill": "Lines", "message": "Zeile"})
+
+    assert status == 200
+    assert headers["Transfer-Encoding"] == "chunked"
+    lines = [json.loads(line) for line in data.decode("utf-8").splitlines()]
+    assert lines == [{"line": "Zeile 0"}, {"line": "Zeile 1"}, {"line": "Zeile 2"}]
+
+
+def test_stream_reports_unloadable_skill_with_error_status() -> None:
+    app = make_app()
+    app.register_lazy_skill("Broken", "maf_basic.skills.does_not_exist:Skill")
+    with running_server(app) as running:
+        status, body = running.post("/stream", {"skill": "Broken", "message": "x"})
+        assert status == 500
+        assert "does_not_exist" in body["error"]
+        assert running.server.status()["queued"] == 0
+
+
+def test_stream_is_bounded_by_request_timeout() -> None:
+    with running_server(make_app(SlowLinesSkill()), request_timeout=0.2) as running:
+        started = time.monotonic()
+        status, _, data = running.request("POST", "/stream", {"skill": "SlowLines", "message": "x"})
+        elapsed = time.monotonic() - started
+
+    assert status == 200
+    assert elapsed < 0.9
+    lines = [json.loads(line) for line in data.decode("utf-8").splitlines()]
+    assert lines == [{"line": "erste Zeile"}, {"error": "Skill 'SlowLines' timed out"}]
+
+
+def test_negative_content_length_is_rejected() -> None:
+    with running_server(make_app()) as running:
+        with socket.create_connection(("127.0.0.1", running.server.port), timeout=10) as sock:
+            sock.sendall(b"POST /invoke HTTP/1.1\r\nHost: localhost\r\nContent-Length: -5\r\n\r\n")
+            response = b""
+            while chunk := sock.recv(4096):
+                response += chunk
+
+    assert response.startswith(b"HTTP/1.1 400")
+    assert b"Invalid Content-Length" in response
+
+
+def test_overload_is_shed_with_429() -> None:
+    gate = GateSkill()
+    app = make_app(gate, EchoSkill())
+    with running_server(app, max_concurrency=2, max_queue=1) as running:
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(running.post, "/invoke", {"skill": "Gate", "message": str(i)}) for i in range(3)]
+            for _ in range(2):
+                assert gate.started.acquire(timeout=5)
+            _wait_for(lambda: running.server.status()["queued"] == 1)
+
+            status, headers, _ = running.request("POST", "/invoke", {"skill": "EchoSkill", "message": "x"})
+            assert status == 429
+            assert headers["Retry-After"] == "1"
+            assert running.server.status()["shed"] == 1
+
+            gate.gate.set()
+            assert [future.result(timeout=10)[0] for future in futures] == [200, 200, 200]
+        assert running.post("/invoke", {"skill": "EchoSkill", "message": "y"})[0] == 200
+    assert gate.peak == 2
+
+
+def test_skill_limits_cap_concurrency_per_skill() -> None:
+    gate = GateSkill()
+    app = make_app(gate, EchoSkill())
+    with running_server(app, skill_limits={"Gate": 1}, skill_queue=1) as running:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(running.post, "/invoke", {"skill": "Gate", "message": str(i)}) for i in range(2)]
+            assert gate.started.acquire(timeout=5)
+            _wait_for(lambda: running.server.status()["skills"]["Gate"]["queued"] == 1)
+
+            # The limited skill is full, other skills are still served.
+            assert running.post("/invoke", {"skill": "Gate", "message": "x"})[0] == 429
+            assert running.post("/invoke", {"skill": "EchoSkill", "message": "x"})[0] == 200
+
+            gate.gate.set()
+            assert [future.result(timeout=10)[0] for future in futures] == [200, 200]
+    assert gate.peak == 1
+
+
+def test_shutdown_drains_admitted_requests() -> None:
+    gate = GateSkill()
+    app = make_app(gate)
+    with running_server(app) as running:
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(running.post, "/invoke", {"skill": "Gate", "message": "lang"})
+            assert gate.started.acquire(timeout=5)
+
+            drained = running.shutdown()
+            _wait_for(lambda: running.server.draining)
+            assert not drained.done()
+            with pytest.raises(OSError):
+                running.request("GET", "/health")
+
+            gate.gate.set()
+            assert future.result(timeout=10) == (200, {"response": "done lang"})
+            drained.result(timeout=10)
+
+
+def test_health_and_metrics() -> None:
+    app = AgentApp(instrumentation=Instrumentation())
+    app.register_skill(EchoSkill())
+    with running_server(app) as running:
+        running.post("/invoke", {"skill": "EchoSkill", "message": "x"})
+        status, _, health = running.request("GET", "/health")
+        assert status == 200
+        assert json.loads(health)["status"] == "ok"
+        status, _, metrics = running.request("GET", "/metrics")
+        assert status == 200
+        assert b'name="EchoSkill"' in metrics
+
+
+def test_keep_alive_connection_serves_several_requests() -> None:
+    with running_server(make_app()) as running:
+        conn = http.client.HTTPConnection("127.0.0.1", running.server.port, timeout=10)
+        try:
+            for index in range(3):
+                conn.request("POST", "/invoke", body=json.dumps({"skill": "EchoSkill", "message": str(index)}))
+                response = conn.getresponse()
+                assert json.loads(response.read()) == {"response": str(index)}
+        finally:
+            conn.close()
+
+
+def _wait_for(condition: Any, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
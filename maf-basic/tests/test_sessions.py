@@ -0,0 +1,102 @@
+"""Tests for session-scoped invocation and the sharded session store."""
+
+from __future__ import annotations
+
+import asyncio
+import pathlib
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from maf_basic.app import AgentApp
+from maf_basic.batch import InvokeRequest
+from maf_basic.services.search import SearchResult
+from maf_basic.skills.echo import EchoSkill
+from maf_basic.skills.management_summary import ManagementSummarySkill
+from maf_basic.skills.web_search import WebSearchSkill
+from maf_basic.storage.bounded import BoundedInMemoryStorage
+from maf_basic.storage.concurrent import StripedInMemoryStorage
+from maf_basic.storage.sharded import ShardedSessionStore, shard_for
+
+
+class FakeSearchClient:
+    def search(self, query: str, *, max_results: int = 5) -> Iterable[SearchResult]:
+        return [SearchResult(title=query, url="https://example.com", snippet=f"About {query}.")]
+
+
+def test_sessions_have_isolated_history() -> None:
+    app = AgentApp()
+    skill = EchoSkill()
+    app.register_skill(skill)
+
+    app.invoke("EchoSkill", "alice 1", session_id="alice")
+    app.invoke("EchoSkill", "bob 1", session_id="bob")
+    app.invoke("EchoSkill", "alice 2", session_id="alice")
+    app.invoke("EchoSkill", "shared")
+
+    assert skill.conversation_history(app.storage_for("alice")) == ["alice 1", "alice 2"]
+    assert skill.conversation_history(app.storage_for("bob")) == ["bob 1"]
+    assert skill.conversation_history(app.storage) == ["shared"]
+
+
+def test_last_query_is_scoped_per_session() -> None:
+    app = AgentApp()
+    app.register_skill(WebSearchSkill(search_client=FakeSearchClient()))
+    app.register_skill(ManagementSummarySkill())
+
+    app.invoke("WebSearchSkill", "KI", session_id="alice")
+    app.invoke("WebSearchSkill", "Cloud", session_id="bob")
+
+    assert "'KI'" in app.invoke("ManagementSummarySkill", "", session_id="alice")
+    assert "'Cloud'" in app.invoke("ManagementSummarySkill", "", session_id="bob")
+
+
+def test_end_session_drops_state() -> None:
+    app = AgentApp()
+    app.register_skill(EchoSkill())
+    app.invoke("EchoSkill", "hello", session_id="alice")
+
+    assert "alice" in app.sessions
+    assert app.end_session("alice")
+    assert "alice" not in app.sessions
+    assert not app.end_session("alice")
+    assert EchoSkill().conversation_history(app.storage_for("alice")) == []
+
+
+def test_ainvoke_and_invoke_many_use_session_storage() -> None:
+    app = AgentApp()
+    skill = EchoSkill()
+    app.register_skill(skill)
+
+    asyncio.run(app.ainvoke("EchoSkill", "async", session_id="alice"))
+    list(app.invoke_many([InvokeRequest("EchoSkill", "batch", session_id="alice")]))
+
+    assert skill.conversation_history(app.storage_for("alice")) == ["async", "batch"]
+    app.close()
+
+
+def test_concurrent_calls_in_one_session_keep_every_message() -> None:
+    app = AgentApp()
+    app.register_skill(EchoSkill())
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(lambda index: app.invoke("EchoSkill", str(index), session_id="s"), range(2000)))
+
+    assert isinstance(app.storage_for("s"), StripedInMemoryStorage)
+    history = EchoSkill().conversation_history(app.storage_for("s"))
+    assert sorted(history, key=int) == [str(index) for index in range(2000)]
+
+
+def test_session_store_uses_factory_and_stable_shards() -> None:
+    store = ShardedSessionStore(shards=4, factory=BoundedInMemoryStorage)
+
+    assert isinstance(store.session("alice"), BoundedInMemoryStorage)
+    assert store.session("alice") is store.session("alice")
+    assert store.shard_index("alice") == shard_for("alice", 4)
+    assert shard_for("alice", 4) == shard_for("alice", 4) < 4
+    assert len(store) == 1
+    assert list(store.sessions()) == ["alice"]
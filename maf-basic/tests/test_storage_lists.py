@@ -0,0 +1,108 @@
+"""Tests for list-valued storage operations (append, extend, read_range)."""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+from typing import Any, Dict, Optional
+
+import pytest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from maf_basic.skills.echo import EchoSkill
+from maf_basic.storage.base import BaseStorage
+from maf_basic.storage.in_memory import InMemoryStorage
+from maf_basic.storage.local import LocalFileStorage
+
+
+class MinimalStorage(BaseStorage):
+    """Storage implementing only the abstract methods to exercise the defaults."""
+
+    def __init__(self) -> None:
+        self.values: Dict[tuple[str, str], Any] = {}
+        self.writes = 0
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        return self.values.get((namespace, key))
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        self.writes += 1
+        self.values[(namespace, key)] = value
+
+    def dump_namespace(self, namespace: str) -> Dict[str, Any]:
+        return {key: value for (ns, key), value in self.values.items() if ns == namespace}
+
+
+@pytest.fixture(params=["memory", "local", "minimal"])
+def storage(request: pytest.FixtureRequest, tmp_path: pathlib.Path) -> BaseStorage:
+    if request.param == "memory":
+        return InMemoryStorage()
+    if request.param == "local":
+        return LocalFileStorage(tmp_path / "storage.json")
+    return MinimalStorage()
+
+
+def test_append_extend_and_read_range(storage: BaseStorage) -> None:
+    storage.append("echo", "history", "a")
+    storage.extend("echo", "history", ["b", "c", "d"])
+
+    assert storage.length("echo", "history") == 4
+    assert storage.read_range("echo", "history") == ["a", "b", "c", "d"]
+    assert storage.read_range("echo", "history", 1, 3) == ["b", "c"]
+    assert storage.read_range("echo", "history", -2) == ["c", "d"]
+    assert storage.read_range("echo", "missing") == []
+    assert storage.length("echo", "missing") == 0
+
+
+def test_append_to_non_list_value_is_rejected() -> None:
+    storage = InMemoryStorage()
+    storage.set("ns", "key", 42)
+
+    with pytest.raises(TypeError):
+        storage.append("ns", "key", 1)
+
+
+def test_local_storage_replays_appends(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "storage.json"
+    storage = LocalFileStorage(path)
+    for index in range(5):
+        storage.append("echo", "history", index)
+    storage.close()
+
+    assert LocalFileStorage(path).read_range("echo", "history") == [0, 1, 2, 3, 4]
+
+
+def test_local_storage_append_cost_does_not_grow_with_history(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "storage.json"
+    storage = LocalFileStorage(path, compact_min_bytes=1 << 30)
+    storage.append("echo", "history", "x" * 10)
+    first = path.stat().st_size
+    for _ in range(100):
+        storage.append("echo", "history", "x" * 10)
+
+    assert path.stat().st_size == first * 101
+
+
+def test_local_storage_compacts_appends(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "storage.json"
+    storage = LocalFileStorage(path, compact_min_bytes=512)
+    for index in range(200):
+        storage.append("echo", "history", index)
+    storage.close()
+
+    assert path.stat().st_size < 200 * 40
+    assert LocalFileStorage(path).length("echo", "history") == 200
+
+
+def test_echo_skill_pages_through_history() -> None:
+    storage = MinimalStorage()
+    skill = EchoSkill()
+    for message in ["first", "second", "third"]:
+        skill.handle(message, storage)
+
+    assert skill.conversation_history(storage) == ["first", "second", "third"]
+    assert skill.conversation_history(storage, start=1, stop=2) == ["second"]
+    assert skill.history_length(storage) == 3
@@ -0,0 +1,84 @@
+"""Tests for streaming skill responses."""
+
+from __future__ import annotations
+
+import asyncio
+import pathlib
+import sys
+from typing import Iterator
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from maf_basic.app import AgentApp
+from maf_basic.services.search import SearchResult
+from maf_basic.skills.echo import EchoSkill
+from maf_basic.skills.web_search import WebSearchSkill
+from maf_basic.storage.in_memory import InMemoryStorage
+
+
+class GeneratorSearchClient:
+    """Client yielding results lazily and recording how many were produced."""
+
+    def __init__(self, count: int) -> None:
+        self._count = count
+        self.produced = 0
+
+    def search(self, query: str, *, max_results: int = 5) -> Iterator[SearchResult]:
+        for index in range(min(self._count, max_results)):
+            self.produced += 1
+            yield SearchResult(title=f"Result {index}", url=f"https://example.com/{index}", snippet="Text")
+
+
+def test_stream_yields_lines_before_search_finishes() -> None:
+    client = GeneratorSearchClient(count=3)
+    storage = InMemoryStorage()
+    skill = WebSearchSkill(search_client=client)
+
+    lines = skill.handle_stream("KI", storage)
+
+    assert next(lines) == "Suchergebnisse für 'KI':"
+    assert next(lines) == "- Result 0 (https://example.com/0): Text"
+    assert client.produced == 1
+    assert storage.get(WebSearchSkill.STORAGE_NAMESPACE, "KI") == [
+        {"title": "Result 0", "url": "https://example.com/0", "snippet": "Text"}
+    ]
+    assert len(list(lines)) == 2
+    assert storage.length(WebSearchSkill.STORAGE_NAMESPACE, "KI") == 3
+    assert storage.get(WebSearchSkill.STORAGE_NAMESPACE, WebSearchSkill.LAST_QUERY_KEY) == "KI"
+
+
+def test_stream_matches_handle_output() -> None:
+    skill = WebSearchSkill(search_client=GeneratorSearchClient(count=3))
+
+    streamed = "\n".join(skill.handle_stream("KI", InMemoryStorage()))
+
+    assert streamed == skill.handle("KI", InMemoryStorage())
+
+
+def test_stream_reports_missing_results() -> None:
+    skill = WebSearchSkill(search_client=GeneratorSearchClient(count=0))
+
+    assert list(skill.handle_stream("KI", InMemoryStorage())) == ["Keine Treffer für 'KI' gefunden."]
+
+
+def test_app_stream_falls_back_to_full_response_for_other_skills() -> None:
+    app = AgentApp()
+    app.register_skill(EchoSkill())
+
+    assert list(app.stream("EchoSkill", "hello")) == ["hello"]
+
+
+def test_app_astream_yields_lines_in_order() -> None:
+    app = AgentApp()
+    app.register_skill(WebSearchSkill(search_client=GeneratorSearchClient(count=2)))
+
+    async def collect() -> list[str]:
+        return [line async for line in app.astream("WebSearchSkill", "KI", session_id="alice")]
+
+    lines = asyncio.run(collect())
+
+    assert lines[0] == "Suchergebnisse für 'KI':"
+    assert len(lines) == 3
+    assert app.storage_for("alice").length(WebSearchSkill.STORAGE_NAMESPACE, "KI") == 2
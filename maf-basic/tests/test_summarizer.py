@@ -0,0 +1,142 @@
+"""Tests for the model-backed summariser."""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+import threading
+import time
+from typing import List, Sequence
+
+import pytest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from maf_basic.services.result_set import ResultSet
+from maf_basic.services.summarizer import LocalModel, ModelSummarizer, summarizer_from_settings
+from maf_basic.skills.management_summary import ManagementSummarySkill
+from maf_basic.skills.web_search import WebSearchSkill
+from maf_basic.storage.in_memory import InMemoryStorage
+
+
+def _results(index: int) -> list[dict[str, str]]:
+    return [
+        {
+            "title": f"Result {index}",
+            "url": f"https://example.com/{index}",
+            "snippet": f"First sentence {index}. Second sentence.",
+        }
+    ]
+
+
+class ConcurrencyProbe(LocalModel):
+    def __init__(self) -> None:
+        super().__init__(latency_seconds=0.02)
+        self._active = 0
+        self._probe_lock = threading.Lock()
+        self.peak = 0
+
+    def complete_batch(self, prompts: Sequence[str]) -> List[str]:
+        with self._probe_lock:
+            self._active += 1
+            self.peak = max(self.peak, self._active)
+        try:
+            return super().complete_batch(prompts)
+        finally:
+            with self._probe_lock:
+                self._active -= 1
+
+
+def test_local_model_condenses_results() -> None:
+    summarizer = ModelSummarizer(LocalModel())
+
+    lines = summarizer.summarize("Thema", _results(1))
+
+    assert lines == ["Management Summary zu 'Thema':", "- Result 1: First sentence 1."]
+
+
+def test_summarize_many_batches_prompts() -> None:
+    model = LocalModel()
+    summarizer = ModelSummarizer(model, batch_size=4)
+
+    summaries = summarizer.summarize_many([(f"topic {index}", _results(index)) for index in range(10)])
+
+    assert sorted(model.batch_sizes) == [2, 4, 4]
+    assert summaries[7] == ["Management Summary zu 'topic 7':", "- Result 7: First sentence 7."]
+
+
+def test_responses_are_cached_and_deduplicated() -> None:
+    model = LocalModel()
+    summarizer = ModelSummarizer(model)
+
+    summarizer.summarize_many([("a", _results(1)), ("a", _results(1))])
+    summarizer.summarize("a", _results(1))
+
+    assert model.batch_sizes == [1]
+    assert summarizer.stats.misses == 1
+    assert summarizer.stats.hits == 1
+
+
+def test_cache_evicts_least_recently_used_prompt() -> None:
+    model = LocalModel()
+    summarizer = ModelSummarizer(model, cache_size=1)
+
+    summarizer.summarize("a", _results(1))
+    summarizer.summarize("b", _results(2))
+    summarizer.summarize("a", _results(1))
+
+    assert model.batch_sizes == [1, 1, 1]
+    assert summarizer.stats.evictions == 2
+
+
+def test_model_calls_are_capped() -> None:
+    model = ConcurrencyProbe()
+    summarizer = ModelSummarizer(model, batch_size=1, max_in_flight=2)
+
+    started = time.perf_counter()
+    summarizer.summarize_many([(f"topic {index}", _results(index)) for index in range(6)])
+    elapsed = time.perf_counter() - started
+
+    assert model.peak == 2
+    assert elapsed < 6 * 0.02
+
+
+def test_skill_uses_summarizer_for_single_and_batched_topics() -> None:
+    model = LocalModel()
+    skill = ManagementSummarySkill(summarizer=ModelSummarizer(model))
+    storage = InMemoryStorage()
+    for index in range(3):
+        storage.set(WebSearchSkill.STORAGE_NAMESPACE, f"topic {index}", ResultSet(_results(index)))
+
+    single = skill.handle("topic 0", storage)
+    report = skill.summarize_many(storage)
+
+    assert single == "Management Summary zu 'topic 0':\n- Result 0: First sentence 0."
+    assert model.batch_sizes == [1, 2]
+    statuses = {entry.topic: entry.status for entry in report.topics}
+    assert statuses == {"topic 0": "hit", "topic 1": "rebuild", "topic 2": "rebuild"}
+    assert skill.cached_summaries(storage)["topic 2"][1] == "- Result 2: First sentence 2."
+
+
+def test_skill_rebuilds_instead_of_appending_with_summarizer() -> None:
+    model = LocalModel()
+    skill = ManagementSummarySkill(summarizer=ModelSummarizer(model))
+    storage = InMemoryStorage()
+    storage.set(WebSearchSkill.STORAGE_NAMESPACE, "topic", ResultSet(_results(1)))
+    skill.handle("topic", storage)
+
+    storage.extend(WebSearchSkill.STORAGE_NAMESPACE, "topic", _results(2))
+    summary = skill.handle("topic", storage)
+
+    assert skill.cache_stats.rebuilds == 2
+    assert summary.splitlines()[1:] == ["- Result 1: First sentence 1.", "- Result 2: First sentence 2."]
+
+
+def test_summarizer_from_settings() -> None:
+    summarizer = summarizer_from_settings({"models": {"primary": {"provider": "local"}}}, batch_size=2)
+
+    assert summarizer.summarize("x", _results(1))[1] == "- Result 1: First sentence 1."
+    with pytest.raises(ValueError):
+        summarizer_from_settings({"models": {"primary": {"provider": "openai"}}})
@@ -0,0 +1,163 @@
+"""Tests for bulk summarisation across many topics."""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+import threading
+import time
+from typing import Any, Mapping, Type
+
+import pytest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from maf_basic.services.result_set import ResultSet
+from maf_basic.skills.management_summary import ManagementSummarySkill
+from maf_basic.skills.web_search import WebSearchSkill
+from maf_basic.storage.concurrent import StripedInMemoryStorage
+from maf_basic.storage.in_memory import InMemoryStorage
+from maf_basic.storage.local import LocalFileStorage
+
+
+class CountingStorage(InMemoryStorage):
+    def __init__(self) -> None:
+        super().__init__()
+        self.single_writes = 0
+        self.batch_writes = 0
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        self.single_writes += 1
+        super().set(namespace, key, value)
+
+    def set_many(self, namespace: str, values: Mapping[str, Any]) -> None:
+        self.batch_writes += 1
+        super().set_many(namespace, values)
+
+    def set_batch(self, values: Mapping[str, Mapping[str, Any]]) -> None:
+        self.batch_writes += 1
+        for namespace, namespace_values in values.items():
+            super().set_many(namespace, namespace_values)
+
+
+def _fill(storage: InMemoryStorage, topics: int) -> None:
+    for index in range(topics):
+        storage.set(
+            WebSearchSkill.STORAGE_NAMESPACE,
+            f"topic {index}",
+            ResultSet([{"title": f"Result {index}", "url": f"https://example.com/{index}", "snippet": "Text"}]),
+        )
+    storage.set(WebSearchSkill.STORAGE_NAMESPACE, WebSearchSkill.LAST_QUERY_KEY, "topic 0")
+
+
+def test_summarize_all_topics_with_batched_write() -> None:
+    storage = CountingStorage()
+    _fill(storage, 50)
+    storage.single_writes = 0
+    skill = ManagementSummarySkill()
+
+    report = skill.summarize_many(storage)
+
+    assert len(report.topics) == 50
+    assert {entry.status for entry in report.topics} == {"rebuild"}
+    assert storage.single_writes == 0
+    assert storage.batch_writes == 1
+    assert storage.get(ManagementSummarySkill.STORAGE_NAMESPACE, "topic 7") == [
+        "Management Summary zu 'topic 7':",
+        "- Result 7: Text",
+    ]
+    assert all(entry.seconds >= 0 for entry in report.topics)
+    assert report.slowest(3)[0].seconds >= report.slowest(3)[-1].seconds
+
+
+def test_summarize_selected_topics_reports_missing_ones() -> None:
+    storage = InMemoryStorage()
+    _fill(storage, 3)
+
+    report = ManagementSummarySkill().summarize_many(storage, ["topic 1", "unknown"])
+
+    by_topic = report.by_topic()
+    assert by_topic["topic 1"].status == "rebuild"
+    assert by_topic["unknown"].status == "missing"
+    assert storage.get(ManagementSummarySkill.STORAGE_NAMESPACE, "topic 0") is None
+
+
+def test_second_batch_uses_cached_summaries() -> None:
+    storage = CountingStorage()
+    _fill(storage, 10)
+    skill = ManagementSummarySkill()
+    skill.summarize_many(storage)
+    storage.append(
+        WebSearchSkill.STORAGE_NAMESPACE, "topic 3", {"title": "New", "url": "https://example.com/new", "snippet": ""}
+    )
+    storage.batch_writes = 0
+
+    report = skill.summarize_many(storage)
+
+    statuses = {entry.topic: entry.status for entry in report.topics}
+    assert statuses.pop("topic 3") == "incremental"
+    assert set(statuses.values()) == {"hit"}
+    assert storage.batch_writes == 1
+
+
+def test_batch_results_match_single_handle() -> None:
+    storage = InMemoryStorage()
+    _fill(storage, 5)
+
+    ManagementSummarySkill().summarize_many(storage)
+
+    skill = ManagementSummarySkill()
+    assert skill.handle("topic 2", storage) == "Management Summary zu 'topic 2':\n- Result 2: Text"
+    assert skill.cache_stats.hits == 1
+
+
+def test_local_storage_logs_one_record_per_batch(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "storage.jsonl"
+    storage = LocalFileStorage(path)
+    _fill(storage, 20)
+    lines_before = path.read_text(encoding="utf-8").count("\n")
+
+    ManagementSummarySkill().summarize_many(storage)
+    storage.close()
+
+    assert path.read_text(encoding="utf-8").count("\n") == lines_before + 1
+    reopened = LocalFileStorage(path)
+    assert len(reopened.dump_namespace(ManagementSummarySkill.STORAGE_NAMESPACE)) == 20
+    assert reopened.get(ManagementSummarySkill.FINGERPRINT_NAMESPACE, "topic 4") is not None
+
+
+def test_single_summary_is_written_in_one_batch() -> None:
+    storage = CountingStorage()
+    _fill(storage, 2)
+    storage.single_writes = 0
+
+    ManagementSummarySkill().handle("topic 1", storage)
+
+    assert storage.single_writes == 0
+    assert storage.batch_writes == 1
+
+
+@pytest.mark.parametrize("storage_class", [InMemoryStorage, StripedInMemoryStorage])
+def test_summarize_all_topics_while_searches_are_stored(storage_class: Type[InMemoryStorage]) -> None:
+    storage = storage_class()
+    _fill(storage, 200)
+    results = ResultSet([{"title": "Later", "url": "https://example.com/later", "snippet": ""}])
+
+    def search() -> None:
+        for index in range(200, 600):
+            storage.set(WebSearchSkill.STORAGE_NAMESPACE, f"topic {index}", results)
+            time.sleep(0)
+
+    writer = threading.Thread(target=search)
+    writer.start()
+    try:
+        reports = []
+        while writer.is_alive() or not reports:
+            reports.append(ManagementSummarySkill().summarize_many(storage, max_workers=2))
+    finally:
+        writer.join()
+
+    for report in reports:
+        assert {f"topic {index}" for index in range(200)} <= set(report.by_topic())
@@ -0,0 +1,90 @@
+"""Tests for fingerprint-based caching of management summaries."""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from maf_basic.services.result_set import ResultSet
+from maf_basic.skills.management_summary import ManagementSummarySkill
+from maf_basic.skills.web_search import WebSearchSkill
+from maf_basic.storage.in_memory import InMemoryStorage
+
+
+def _entry(index: int) -> dict[str, str]:
+    return {"title": f"Result {index}", "url": f"https://example.com/{index}", "snippet": f"Finding {index}."}
+
+
+def _store(storage: InMemoryStorage, *indices: int) -> None:
+    storage.set(WebSearchSkill.STORAGE_NAMESPACE, "KI", ResultSet(_entry(index) for index in indices))
+
+
+def test_unchanged_results_return_cached_summary() -> None:
+    storage = InMemoryStorage()
+    _store(storage, 1, 2)
+    skill = ManagementSummarySkill()
+
+    first = skill.handle("KI", storage)
+    second = skill.handle("KI", storage)
+
+    assert first == second
+    assert (skill.cache_stats.rebuilds, skill.cache_stats.hits) == (1, 1)
+
+
+def test_appended_results_update_summary_incrementally() -> None:
+    storage = InMemoryStorage()
+    _store(storage, 1)
+    skill = ManagementSummarySkill(max_items=3)
+    skill.handle("KI", storage)
+
+    storage.append(WebSearchSkill.STORAGE_NAMESPACE, "KI", _entry(2))
+    summary = skill.handle("KI", storage)
+
+    assert summary.splitlines() == [
+        "Management Summary zu 'KI':",
+        "- Result 1: Finding 1.",
+        "- Result 2: Finding 2.",
+    ]
+    assert skill.cache_stats.incremental == 1
+    assert summary.splitlines() == ManagementSummarySkill()._build_summary("KI", [_entry(1), _entry(2)])
+
+
+def test_results_beyond_max_items_do_not_invalidate() -> None:
+    storage = InMemoryStorage()
+    _store(storage, 1, 2)
+    skill = ManagementSummarySkill(max_items=2)
+    skill.handle("KI", storage)
+
+    storage.append(WebSearchSkill.STORAGE_NAMESPACE, "KI", _entry(3))
+    skill.handle("KI", storage)
+
+    assert skill.cache_stats.hits == 1
+
+
+def test_changed_results_rebuild_summary() -> None:
+    storage = InMemoryStorage()
+    _store(storage, 1, 2)
+    skill = ManagementSummarySkill()
+    skill.handle("KI", storage)
+
+    _store(storage, 5, 2)
+    summary = skill.handle("KI", storage)
+
+    assert "- Result 5: Finding 5." in summary
+    assert "Result 1" not in summary
+    assert skill.cache_stats.rebuilds == 2
+
+
+def test_cache_is_shared_through_storage() -> None:
+    storage = InMemoryStorage()
+    _store(storage, 1)
+    ManagementSummarySkill().handle("KI", storage)
+
+    other = ManagementSummarySkill()
+    other.handle("KI", storage)
+
+    assert other.cache_stats.hits == 1